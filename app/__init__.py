@@ -2,52 +2,79 @@
 # ARCOS SIG Form Application - Main Package
 # ============================================================================
 # This file initializes the main app package for the ARCOS SIG Form application.
-# It imports and exports the main modules and establishes the package structure.
+# It exports the main functions and classes and establishes the package
+# structure. Each name is imported from its module the first time it is used,
+# so importing one submodule (e.g. app.config) does not load the whole app.
 # ============================================================================
 
-# Import main modules
-from app.config import setup_page_config, ARCOS_RED, ARCOS_LIGHT_RED, ARCOS_GREEN, ARCOS_BLUE
-from app.styles import load_css, styled_header, styled_expander, styled_info
-from app.helpers import render_color_key, load_callout_reasons, load_sig_descriptions
-from app.session_manager import initialize_session_state, get_current_tab, set_current_tab
-from app.openai_client import get_openai_response, initialize_openai_client
-from app.ai_assistant import render_ai_assistant, get_contextual_help
+import importlib
 
-# Import tab modules (via tabs package)
-from app.tabs import (
-    location_hierarchy, trouble_locations, job_classifications,
-    callout_reasons, event_types, callout_type_config,
-    global_config, data_interfaces, additions, generic_tab
-)
-
-# Import exporter modules (via exporters package)
-from app.exporters import export_to_csv, export_to_excel
-
-# Export all modules
-__all__ = [
+# Module defining each exported name
+_EXPORTS = {
     # Config
-    'setup_page_config', 'ARCOS_RED', 'ARCOS_LIGHT_RED', 'ARCOS_GREEN', 'ARCOS_BLUE',
-    
+    'setup_page_config': 'app.config', 'ARCOS_RED': 'app.config', 'ARCOS_LIGHT_RED': 'app.config',
+    'ARCOS_GREEN': 'app.config', 'ARCOS_BLUE': 'app.config',
+
     # Styles
-    'load_css', 'styled_header', 'styled_expander', 'styled_info',
-    
+    'load_css': 'app.styles', 'styled_header': 'app.styles', 'styled_expander': 'app.styles', 'styled_info': 'app.styles',
+
     # Helpers
-    'render_color_key', 'load_callout_reasons', 'load_sig_descriptions',
-    
+    'render_color_key': 'app.helpers', 'load_callout_reasons': 'app.helpers', 'load_sig_descriptions': 'app.helpers',
+
     # Session management
-    'initialize_session_state', 'get_current_tab', 'set_current_tab',
-    
+    'initialize_session_state': 'app.session_manager', 'get_current_tab': 'app.session_manager',
+    'set_current_tab': 'app.session_manager',
+
     # OpenAI
-    'get_openai_response', 'initialize_openai_client',
-    
+    'get_openai_response': 'app.openai_client', 'stream_openai_response': 'app.openai_client',
+    'initialize_openai_client': 'app.openai_client', 'is_openai_configured': 'app.openai_client',
+    'check_openai_client_health': 'app.openai_client', 'cancel_inflight_request': 'app.openai_client',
+    'choose_model_route': 'app.openai_client',
+    'AssistantUnavailableError': 'app.openai_resilience', 'CircuitOpenError': 'app.openai_resilience',
+    'RateLimiterBusyError': 'app.openai_resilience', 'InvalidAnswerError': 'app.openai_resilience',
+
     # AI Assistant
-    'render_ai_assistant', 'get_contextual_help',
-    
-    # Tabs
-    'location_hierarchy', 'trouble_locations', 'job_classifications',
-    'callout_reasons', 'event_types', 'callout_type_config',
-    'global_config', 'data_interfaces', 'additions', 'generic_tab',
-    
+    'render_ai_assistant': 'app.ai_assistant', 'get_contextual_help': 'app.ai_assistant',
+    'get_help_cache': 'app.ai_assistant', 'get_question_cache': 'app.ai_assistant',
+    'render_assistant_admin': 'app.ai_assistant',
+
+    # Telemetry
+    'get_telemetry': 'app.telemetry',
+
+    # Help cache
+    'HelpCache': 'app.help_cache', 'help_cache_key': 'app.help_cache',
+    'QuestionCache': 'app.question_cache', 'question_scope': 'app.question_cache',
+
+    # Chat history
+    'ChatHistory': 'app.chat_history', 'get_chat_history': 'app.chat_history',
+
+    # Batch jobs
+    'BatchFillJob': 'app.batch_jobs', 'render_batch_fill': 'app.batch_jobs',
+
+    # Pronunciation
+    'suggest_pronunciation': 'app.pronunciation', 'fill_pronunciations': 'app.pronunciation',
+
+    # SIG review
+    'build_review_snapshot': 'app.sig_review', 'review_sig': 'app.sig_review',
+    'render_sig_review_button': 'app.sig_review', 'render_review_findings': 'app.sig_review',
+
+    # Tabs (each tab module is imported when the tab is first rendered)
+    'TAB_MODULES': 'app.tabs', 'get_tab_renderer': 'app.tabs', 'render_tab': 'app.tabs',
+
     # Exporters
-    'export_to_csv', 'export_to_excel'
-]
\ No newline at end of file
+    'export_to_csv': 'app.exporters', 'export_to_excel': 'app.exporters', 'export_to_parquet': 'app.exporters',
+
+    # Importers
+    'import_from_excel': 'app.importers'
+}
+
+def __getattr__(name):
+    """Import an exported name from its module the first time it is looked up"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+# Export all modules
+__all__ = list(_EXPORTS)
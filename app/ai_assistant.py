@@ -6,12 +6,62 @@
 # ============================================================================
 
 import streamlit as st
-from app.openai_client import get_openai_response
+from datetime import datetime
+from app.openai_client import (
+    get_openai_response, stream_openai_response, get_system_message, cancel_inflight_request,
+    get_help_model, is_openai_configured
+)
+from app.openai_resilience import AssistantUnavailableError
+from app.help_cache import HelpCache, help_cache_key
+from app.question_cache import QuestionCache, question_scope
+from app.assistant_context import build_assistant_history, count_tokens, summarize_tab_state
+from app.retrieval import build_sig_index, find_local_answer, format_snippets
+from app.sig_state import SIGState
+from app.chat_history import get_chat_history
+from app.telemetry import get_telemetry
+from app.helpers import fragment
+from app.config import (
+    TAB_CONTEXT_TEMPLATE, HELP_QUERY_TEMPLATE, ASSISTANT_LOCAL_ANSWERS, QUESTION_CACHE_ENABLED,
+    CHAT_HISTORY_VISIBLE_MESSAGES, CHAT_HISTORY_PAGE_MESSAGES
+)
 
+@st.cache_resource(show_spinner=False)
+def get_help_cache():
+    """
+    Return the help answer cache shared by every session of this server process
+
+    Returns:
+        HelpCache: The persistent help cache
+    """
+    return HelpCache()
+
+@st.cache_resource(show_spinner=False)
+def get_question_cache():
+    """
+    Return the cache of answers to free-form questions shared by every session of this server process
+
+    Returns:
+        QuestionCache: The in-memory similar question cache
+    """
+    return QuestionCache()
+
+@st.cache_resource(show_spinner=False)
+def get_sig_index():
+    """
+    Return the retrieval index over the SIG guide, built once per server process
+
+    Returns:
+        BM25Index: Index over the SIG descriptions, structure and callout reasons
+    """
+    return build_sig_index()
+
+@fragment
 def render_ai_assistant(current_tab):
     """
     Render the AI Assistant panel with chat functionality
     
+    Runs as a fragment, so asking a question reruns only the panel.
+    
     Args:
         current_tab (str): The currently selected tab name
     """
@@ -20,40 +70,109 @@ def render_ai_assistant(current_tab):
     # Chat input
     user_question = st.text_input("Ask anything about ARCOS configuration:")
     
+    local_answers = st.checkbox("Answer from the SIG guide when possible", value=ASSISTANT_LOCAL_ANSWERS, key="ai_local_answers")
+    
     if st.button("Ask AI Assistant"):
         if user_question:
             # Get context for the current tab
-            context = f"The user is working on the ARCOS System Implementation Guide form. They are currently viewing the '{current_tab}' tab."
+            context = TAB_CONTEXT_TEMPLATE.format(tab=current_tab)
             
-            # Show spinner while getting response
-            with st.spinner("Getting response..."):
-                # Get response from OpenAI
-                response = get_openai_response(user_question, context)
+            # A new question supersedes any request still in flight
+            cancel_inflight_request()
+            
+            # Look the question up in the SIG guide first
+            results = get_sig_index().search(user_question)
+            local_answer = find_local_answer(results) if local_answers else None
+            if local_answers:
+                get_telemetry().record_cache("local_answer", "miss" if local_answer is None else "hit")
+            
+            if local_answer is not None:
+                # The guide answers the question directly; no model call needed
+                chat_history = get_chat_history()
+                chat_history.append({"role": "user", "content": user_question})
+                chat_history.append({"role": "assistant", "content": local_answer})
+                user_question = None
+        
+        if user_question and QUESTION_CACHE_ENABLED:
+            # Reuse the answer to the same or a near-duplicate question asked on this tab with the same form data
+            state = SIGState.from_session_state()
+            scope = question_scope(current_tab, summarize_tab_state(current_tab, state))
+            cached = get_question_cache().get(user_question, scope)
+            get_telemetry().record_cache("similar_question", "miss" if cached is None else "hit")
+            
+            if cached is not None:
+                chat_history = get_chat_history()
+                chat_history.append({"role": "user", "content": user_question})
+                chat_history.append({"role": "assistant", "content": cached["answer"]})
+                st.caption(f"Answer reused from the similar question \"{cached['question']}\"")
+                user_question = None
+        
+        if user_question:
+            # Ground the answer in the guide, the tab's form data and the recent conversation
+            reserved_tokens = count_tokens(get_system_message(context)["content"]) + count_tokens(user_question)
+            history = build_assistant_history(
+                current_tab, get_chat_history().recent(), SIGState.from_session_state(),
+                reserved_tokens=reserved_tokens, snippets=format_snippets(results)
+            )
+            
+            # Stream the response into a placeholder as it is generated
+            answer_placeholder = st.empty()
+            try:
+                with answer_placeholder.container():
+                    response = st.write_stream(stream_openai_response(
+                        user_question, context, history=history, intent="chat", tab_name=current_tab
+                    ))
+            except AssistantUnavailableError as e:
+                # Failures are shown once and kept out of the chat history
+                answer_placeholder.error(str(e))
+            else:
+                # Store in chat history once the stream has ended
+                chat_history = get_chat_history()
+                chat_history.append({"role": "user", "content": user_question})
+                chat_history.append({"role": "assistant", "content": response})
                 
-                # Store in chat history
-                if "chat_history" not in st.session_state:
-                    st.session_state.chat_history = []
-                st.session_state.chat_history.append({"role": "user", "content": user_question})
-                st.session_state.chat_history.append({"role": "assistant", "content": response})
+                # Placeholder answers are not worth keeping, and answers that drew on
+                # this session's conversation are not reused in other sessions
+                used_conversation = any(message["role"] != "system" for message in history)
+                if QUESTION_CACHE_ENABLED and not used_conversation and is_openai_configured():
+                    get_question_cache().set(user_question, scope, response)
+                
+                # The chat history below now shows the answer
+                answer_placeholder.empty()
     
     # Display chat history
     st.markdown('<p class="section-header">Chat History</p>', unsafe_allow_html=True)
     
-    if "chat_history" in st.session_state and st.session_state.chat_history:
-        # Show recent messages
-        recent_messages = st.session_state.chat_history[-6:]  # Show last 6 messages
-        for msg in recent_messages:
-            if msg["role"] == "user":
-                st.markdown(f"<div style='background-color: #f0f0f0; padding: 8px; border-radius: 5px; margin-bottom: 8px;'><b>You:</b> {msg['content']}</div>", unsafe_allow_html=True)
-            else:
-                st.markdown(f"<div style='background-color: #e6f7ff; padding: 8px; border-radius: 5px; margin-bottom: 8px;'><b>Assistant:</b> {msg['content']}</div>", unsafe_allow_html=True)
+    chat_history = get_chat_history()
+    if len(chat_history):
+        # Older messages are read from disk only when asked for
+        older_shown = st.session_state.get("chat_history_older_shown", 0)
+        hidden = chat_history.spilled_count + max(0, len(chat_history.recent()) - CHAT_HISTORY_VISIBLE_MESSAGES)
+        if older_shown < hidden and st.button(f"Show earlier messages ({hidden - older_shown} more)"):
+            older_shown = min(hidden, older_shown + CHAT_HISTORY_PAGE_MESSAGES)
+            st.session_state.chat_history_older_shown = older_shown
+        
+        # Show recent messages, preceded by any earlier ones the user asked for
+        shown = CHAT_HISTORY_VISIBLE_MESSAGES + older_shown
+        in_memory = chat_history.recent()
+        messages = chat_history.load_older(shown - len(in_memory)) + in_memory[-shown:]
+        for msg in messages:
+            _render_message(msg)
         
         if st.button("Clear Chat History"):
-            st.session_state.chat_history = []
+            chat_history.clear()
+            st.session_state.chat_history_older_shown = 0
             st.rerun()
     else:
         st.info("No chat history yet. Ask a question to get started.")
 
+def _render_message(msg):
+    """Render one chat message"""
+    if msg["role"] == "user":
+        st.markdown(f"<div style='background-color: #f0f0f0; padding: 8px; border-radius: 5px; margin-bottom: 8px;'><b>You:</b> {msg['content']}</div>", unsafe_allow_html=True)
+    else:
+        st.markdown(f"<div style='background-color: #e6f7ff; padding: 8px; border-radius: 5px; margin-bottom: 8px;'><b>Assistant:</b> {msg['content']}</div>", unsafe_allow_html=True)
+
 def get_contextual_help(topic, tab_name):
     """
     Get contextual help for a specific topic within a tab
@@ -65,15 +184,104 @@ def get_contextual_help(topic, tab_name):
     Returns:
         str: AI-generated help text
     """
-    help_query = f"Explain in detail what I need to know about {topic} when configuring the {tab_name} tab in ARCOS. Include examples and best practices."
+    help_query = HELP_QUERY_TEMPLATE.format(topic=topic, tab_name=tab_name)
+    
+    # Help prompts are deterministic, so a cached answer can be reused as is
+    cache = get_help_cache()
+    model = get_help_model(help_query, tab_name)
+    cache_key = help_cache_key(model, get_system_message()["content"], topic, tab_name)
+    help_response = cache.get(cache_key)
+    get_telemetry().record_cache("help", "miss" if help_response is None else "hit")
     
-    with st.spinner("Loading help..."):
-        help_response = get_openai_response(help_query)
+    if help_response is None:
+        served = {}
+        try:
+            with st.spinner("Loading help..."):
+                help_response = get_openai_response(help_query, intent="help", tab_name=tab_name, served=served)
+        except AssistantUnavailableError as e:
+            # Shown in place of the answer, but not cached or kept in the chat history
+            return f"Help is not available right now. {str(e)}"
         
-        # Store in chat history
-        if "chat_history" not in st.session_state:
-            st.session_state.chat_history = []
-        st.session_state.chat_history.append({"role": "user", "content": f"Help with {topic}"})
-        st.session_state.chat_history.append({"role": "assistant", "content": help_response})
+        # Placeholder answers are not worth keeping, and an answer from the
+        # fallback model must not be cached under the help model's key
+        if is_openai_configured() and served.get("model") == model:
+            cache.set(cache_key, help_response, topic=topic, tab_name=tab_name, model=model)
+    
+    # Store in chat history
+    chat_history = get_chat_history()
+    chat_history.append({"role": "user", "content": f"Help with {topic}"})
+    chat_history.append({"role": "assistant", "content": help_response})
+    
+    return help_response
+
+def render_assistant_admin():
+    """Render the admin view of the AI Assistant telemetry for this server process"""
+    from app.openai_client import get_openai_runtime
+    telemetry = get_telemetry()
+    
+    st.markdown('<p class="section-header">AI Assistant Telemetry</p>', unsafe_allow_html=True)
+    st.caption(f"Since {datetime.fromtimestamp(telemetry.started_at).strftime('%Y-%m-%d %H:%M:%S')} (this server process)")
+    
+    runtime = get_openai_runtime()
+    help_stats = get_help_cache().stats()
+    st.write(f"Circuit breaker: **{runtime['breaker'].state}**")
+    st.write(f"Help cache: {help_stats['entries']} answers, {help_stats['hit_rate']:.0%} hit rate")
+    question_stats = get_question_cache().stats()
+    st.write(f"Similar question cache: {question_stats['entries']} answers, {question_stats['hit_rate']:.0%} hit rate "
+             f"({question_stats['exact']} same after normalization, {question_stats['similar']} near-duplicate)")
+    
+    # Calls and latency per kind and model
+    rows = []
+    for (kind, model), histogram in sorted(telemetry.latency.items()):
+        ttft = telemetry.ttft.get((kind, model))
+        rows.append({
+            "Kind": kind,
+            "Model": model,
+            "Calls": histogram.count,
+            "Errors": sum(c for (k, m, o), c in telemetry.calls.items() if k == kind and m == model and o == "error"),
+            "Mean latency (s)": round(histogram.sum / histogram.count, 2),
+            "p50 latency (s)": histogram.quantile(0.5),
+            "p95 latency (s)": histogram.quantile(0.95),
+            "p95 TTFT (s)": ttft.quantile(0.95) if ttft else None
+        })
+    if rows:
+        st.dataframe(rows, hide_index=True)
+    else:
+        st.info("No assistant calls yet.")
+    
+    # Latency per model route, for tuning the router thresholds
+    route_rows = []
+    for (route, model), histogram in sorted(telemetry.route_latency.items()):
+        outcomes = {o: c for (r, m, o), c in telemetry.routes.items() if r == route and m == model}
+        route_rows.append({
+            "Route": route,
+            "Model": model,
+            "Requests": histogram.count,
+            "Fell back": outcomes.get("fallback", 0),
+            "Errors": outcomes.get("error", 0),
+            "p50 latency (s)": histogram.quantile(0.5),
+            "p95 latency (s)": histogram.quantile(0.95)
+        })
+    if route_rows:
+        st.dataframe(route_rows, hide_index=True)
+    
+    # Tokens and cost per model
+    for model, cost in sorted(telemetry.cost.items()):
+        st.write(f"{model}: {telemetry.tokens.get((model, 'prompt'), 0):,} prompt + "
+                 f"{telemetry.tokens.get((model, 'completion'), 0):,} completion tokens, about ${cost:.4f}")
+    
+    # Answers served without a model call
+    for cache in ("help", "local_answer", "similar_question", "coalesced"):
+        hits = telemetry.cache.get((cache, "hit"), 0)
+        lookups = hits + telemetry.cache.get((cache, "miss"), 0)
+        if lookups:
+            st.write(f"{cache.replace('_', ' ').capitalize()}: {hits} of {lookups} served without a new call")
+    
+    if telemetry.errors:
+        st.write("Errors: " + ", ".join(f"{error_class} ({kind}): {count}"
+                                        for (kind, error_class), count in sorted(telemetry.errors.items())))
+    
+    with st.expander("Recent calls"):
+        st.dataframe(list(reversed(telemetry.recent)), hide_index=True)
     
-    return help_response
\ No newline at end of file
+    st.download_button("Download metrics", telemetry.to_prometheus_text(), file_name="assistant_metrics.prom", mime="text/plain")
@@ -0,0 +1,209 @@
+# ============================================================================
+# ARCOS SIG Form Application - Assistant Context
+# ============================================================================
+# This file contains the context builder for AI Assistant questions. It adds
+# a compact summary of the current tab's form data and the most recent chat
+# history to the prompt, counting tokens so the prompt stays within a fixed
+# budget however long the session runs.
+# ============================================================================
+
+from app.config import (
+    DEFAULT_MODEL, ASSISTANT_CONTEXT_TOKEN_BUDGET, ASSISTANT_SUMMARY_TOKEN_BUDGET,
+    ASSISTANT_HISTORY_MESSAGE_TOKENS, ASSISTANT_HISTORY_MAX_MESSAGES, ASSISTANT_RETRIEVAL_TOKEN_BUDGET
+)
+
+# Rough characters per token, used when tiktoken is not installed
+_CHARS_PER_TOKEN = 4
+
+# Prefix of the response keys written by each option tab
+RESPONSE_KEY_PREFIXES = {
+    "Global Configuration Options": "Global_Configuration_Options_",
+    "Data and Interfaces": "Data_Interfaces_",
+    "Additions": "Additions_"
+}
+
+# Number of items listed by name in a summary before the rest are only counted
+SUMMARY_LIST_LIMIT = 8
+
+_encodings = {}
+
+def _get_encoding(model):
+    """Return the tiktoken encoding for a model, or None if tiktoken is not installed"""
+    if model not in _encodings:
+        try:
+            import tiktoken
+            try:
+                _encodings[model] = tiktoken.encoding_for_model(model)
+            except KeyError:
+                _encodings[model] = tiktoken.get_encoding("o200k_base")
+        except ImportError:
+            _encodings[model] = None
+    return _encodings[model]
+
+def count_tokens(text, model=DEFAULT_MODEL):
+    """
+    Count the tokens of a text with the model's local tokenizer
+
+    Args:
+        text (str): Text to count
+        model (str): Model whose tokenizer is used
+
+    Returns:
+        int: Token count (an estimate when tiktoken is not installed)
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+    return len(encoding.encode(text))
+
+def truncate_to_tokens(text, max_tokens, model=DEFAULT_MODEL):
+    """
+    Shorten a text to at most max_tokens tokens, marking the cut with '...'
+
+    Returns:
+        str: The text, unchanged if it already fits
+    """
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        max_chars = max_tokens * _CHARS_PER_TOKEN
+        return text if len(text) <= max_chars else text[:max(0, max_chars - 3)] + "..."
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max(0, max_tokens - 1)]) + "..."
+
+def _name_list(names):
+    """Join up to SUMMARY_LIST_LIMIT names, counting the rest"""
+    names = [str(name) for name in names if name]
+    shown = ", ".join(names[:SUMMARY_LIST_LIMIT])
+    if len(names) > SUMMARY_LIST_LIMIT:
+        shown += f" and {len(names) - SUMMARY_LIST_LIMIT} more"
+    return shown or "none"
+
+def _summarize_location_hierarchy(state):
+    hierarchy_data = state.hierarchy_data
+    entries = [e for e in hierarchy_data["entries"] if any(e.get(f"level{n}") for n in range(1, 5))]
+    lines = [f"{len(entries)} hierarchy entries; default time zone {hierarchy_data['timezone'] or 'not set'}."]
+    for n, label in enumerate(hierarchy_data["labels"], start=1):
+        names = list(dict.fromkeys(e[f"level{n}"] for e in entries if e.get(f"level{n}")))
+        lines.append(f"Level {n} ({label}): {_name_list(names)}")
+    return lines
+
+def _summarize_trouble_locations(state):
+    locations = [l for l in state.trouble_locations if l.get("location")]
+    recorded = sum(1 for l in locations if l.get("recording_needed"))
+    return [f"{len(locations)} trouble locations ({recorded} need a recording): "
+            f"{_name_list(l['location'] for l in locations)}"]
+
+def _summarize_job_classifications(state):
+    jobs = [j for j in state.job_classifications if j.get("title")]
+    lines = [f"{len(jobs)} job classifications."]
+    for job_type in dict.fromkeys(j.get("type", "") for j in jobs):
+        lines.append(f"{job_type or 'No type'}: {_name_list(j['title'] for j in jobs if j.get('type', '') == job_type)}")
+    return lines
+
+def _summarize_callout_reasons(state):
+    selected = state.selected_callout_reasons
+    if selected is None:
+        return ["No callout reasons selected yet."]
+    return [f"{len(selected)} callout reasons selected (IDs: {_name_list(selected)}); "
+            f"default reason ID: {state.default_callout_reason or 'not set'}."]
+
+def _summarize_event_types(state):
+    events = [e for e in state.event_types if e.get("description")]
+    used = [e for e in events if e.get("use")]
+    return [f"{len(used)} of {len(events)} event types in use: {_name_list(e['description'] for e in used)}"]
+
+def _summarize_callout_type_configs(state):
+    lines = [f"{len(state.callout_type_configs)} callout types configured."]
+    for config in state.callout_type_configs[:SUMMARY_LIST_LIMIT]:
+        lines.append(
+            f"{config.get('name', '')}: abandon after {config.get('abandon_after_minutes', '')} min, "
+            f"stop accepting after {config.get('stop_accepting_after_minutes', '')} min, "
+            f"{len(config.get('exceptions_to_override', []))} exception overrides"
+        )
+    return lines
+
+# Tab name mapped to the function summarizing its form data
+TAB_SUMMARIZERS = {
+    "Location Hierarchy": _summarize_location_hierarchy,
+    "Trouble Locations": _summarize_trouble_locations,
+    "Job Classifications": _summarize_job_classifications,
+    "Callout Reasons": _summarize_callout_reasons,
+    "Event Types": _summarize_event_types,
+    "Callout Type Configuration": _summarize_callout_type_configs
+}
+
+def summarize_tab_state(tab_name, state):
+    """
+    Summarize the form data of a tab in a few plain lines
+
+    Args:
+        tab_name (str): The tab to summarize
+        state (SIGState): The current SIG data
+
+    Returns:
+        str: The summary, or an empty string if the tab holds no data yet
+    """
+    summarizer = TAB_SUMMARIZERS.get(tab_name)
+    if summarizer is not None:
+        lines = summarizer(state)
+    else:
+        # Option tabs and generic tabs keep their answers in the responses
+        prefix = RESPONSE_KEY_PREFIXES.get(tab_name, f"{tab_name}_")
+        lines = [f"{key[len(prefix):].replace('_', ' ')}: {value}"
+                 for key, value in state.responses.items() if key.startswith(prefix) and value]
+    return "\n".join(lines)
+
+def build_assistant_history(tab_name, chat_history, state, model=DEFAULT_MODEL,
+                            budget=ASSISTANT_CONTEXT_TOKEN_BUDGET, reserved_tokens=0, snippets=""):
+    """
+    Build the messages sent between the system message and a new question
+
+    The tab summary and the guide excerpts are truncated to their own
+    budgets, then the most recent chat messages are added newest first
+    while they fit the remaining budget. Long messages are shortened and
+    older ones are dropped.
+
+    Args:
+        tab_name (str): The tab the user is viewing
+        chat_history (list): The session's chat messages ({"role", "content"})
+        state (SIGState): The current SIG data
+        model (str): Model whose tokenizer is used
+        budget (int): Token budget for the whole prompt
+        reserved_tokens (int): Tokens already used by the system message and question
+        snippets (str): Excerpts from the SIG guide, from format_snippets
+
+    Returns:
+        list: Messages to send, oldest first
+    """
+    remaining = budget - reserved_tokens
+    messages = []
+
+    summary = summarize_tab_state(tab_name, state)
+    if summary:
+        summary = truncate_to_tokens(summary, min(ASSISTANT_SUMMARY_TOKEN_BUDGET, remaining), model)
+        if summary:
+            content = f"Current data on the '{tab_name}' tab:\n{summary}"
+            messages.append({"role": "system", "content": content})
+            remaining -= count_tokens(content, model)
+
+    if snippets:
+        snippets = truncate_to_tokens(snippets, min(ASSISTANT_RETRIEVAL_TOKEN_BUDGET, remaining), model)
+        if snippets:
+            messages.append({"role": "system", "content": snippets})
+            remaining -= count_tokens(snippets, model)
+
+    history = []
+    for message in reversed(chat_history[-ASSISTANT_HISTORY_MAX_MESSAGES:]):
+        if remaining <= 0:
+            break
+        content = truncate_to_tokens(message["content"], min(ASSISTANT_HISTORY_MESSAGE_TOKENS, remaining), model)
+        if not content:
+            break
+        history.append({"role": message["role"], "content": content})
+        remaining -= count_tokens(content, model)
+
+    return messages + list(reversed(history))
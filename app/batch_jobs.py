@@ -0,0 +1,281 @@
+# ============================================================================
+# ARCOS SIG Form Application - Batch Jobs
+# ============================================================================
+# This file contains the batch fill jobs that let the AI Assistant fill a
+# whole table column (e.g. pronunciations for every trouble location) in a few
+# structured-output requests instead of one round trip per row. Requests run
+# concurrently on the shared event loop, answers are validated before they are
+# used, and a job that partly failed can be resumed.
+# ============================================================================
+
+import asyncio
+import concurrent.futures
+import streamlit as st
+from app.openai_client import get_openai_runtime, get_session_id, request_structured_output
+from app.openai_resilience import AssistantUnavailableError
+from app.config import (
+    BATCH_FILL_CHUNK_SIZE, BATCH_FILL_MAX_CONCURRENCY, BATCH_FILL_MAX_TOKENS, BATCH_FILL_MAX_VALUE_LENGTH
+)
+
+# Column fill tasks. Each names the session state table, the field sent to
+# the model, the field filled in, which rows need a value, the widget key
+# of the filled field (if it is keyed by row index) and the instructions.
+BATCH_FILL_TASKS = {
+    "trouble_location_verbiage": {
+        "label": "pronunciations",
+        "table": "trouble_locations",
+        "source": "location",
+        "target": "verbiage",
+        "needs_value": lambda row: bool(row.get("recording_needed")),
+        "widget_key": "loc_verbiage_{index}",
+        "instructions": (
+            "For each trouble location name, write a phonetic respelling that a voice artist can read "
+            "aloud: plain letters, syllables separated by hyphens, no IPA symbols. "
+            "Examples: Rockford -> rok-ferd, Paxton -> pak-stuhn."
+        )
+    },
+    "job_classification_recording": {
+        "label": "recording verbiage",
+        "table": "job_classifications",
+        "source": "title",
+        "target": "recording",
+        "needs_value": lambda row: True,
+        "widget_key": None,
+        "instructions": (
+            "For each job classification title, write the short phrase spoken to employees during a "
+            "callout: expand abbreviations and codes into plain spoken words. "
+            "Example: Elec Tech II -> Electrical Technician 2."
+        )
+    }
+}
+
+# JSON schema of the answer to one batch request
+BATCH_FILL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, "value": {"type": "string"}},
+                "required": ["id", "value"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["items"],
+    "additionalProperties": False
+}
+
+def validate_batch_answer(data, chunk):
+    """
+    Check the answer to one batch request
+
+    Args:
+        data (dict): The parsed answer
+        chunk (list): The source values sent, in id order
+
+    Returns:
+        dict: Source value mapped to its accepted value. Items with an
+        unknown or repeated id, or an empty or overlong value, are left out.
+    """
+    accepted = {}
+    items = data.get("items") if isinstance(data, dict) else None
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        item_id, value = item.get("id"), item.get("value")
+        if not isinstance(item_id, int) or isinstance(item_id, bool) or not 0 <= item_id < len(chunk):
+            continue
+        if not isinstance(value, str) or not value.strip() or len(value.strip()) > BATCH_FILL_MAX_VALUE_LENGTH:
+            continue
+        accepted.setdefault(chunk[item_id], value.strip())
+    return accepted
+
+class BatchFillJob:
+    """
+    Fill one column of a table with values from the AI Assistant.
+
+    Each distinct source value is sent once, whatever the number of rows
+    sharing it. Accepted values are kept in results, so running the job
+    again after a failure only sends the values still missing.
+    """
+    def __init__(self, task_name, overwrite=False, chunk_size=BATCH_FILL_CHUNK_SIZE,
+                 concurrency=BATCH_FILL_MAX_CONCURRENCY):
+        self.task_name = task_name
+        self.task = BATCH_FILL_TASKS[task_name]
+        self.overwrite = overwrite
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.results = {}
+        self.errors = []
+
+    def _wants_value(self, row):
+        source = str(row.get(self.task["source"], "")).strip()
+        if not source or not self.task["needs_value"](row):
+            return False
+        return self.overwrite or not str(row.get(self.task["target"], "")).strip()
+
+    def pending_sources(self, rows):
+        """
+        Return the distinct source values that still need an answer
+
+        Args:
+            rows (list): The table's rows
+
+        Returns:
+            list: Source values in row order
+        """
+        sources = dict.fromkeys(str(row[self.task["source"]]).strip() for row in rows if self._wants_value(row))
+        return [source for source in sources if source not in self.results]
+
+    def _messages(self, chunk):
+        listing = "\n".join(f"{item_id}: {source}" for item_id, source in enumerate(chunk))
+        return [
+            {"role": "system", "content": (
+                "You fill in configuration data for the ARCOS callout system. "
+                f"{self.task['instructions']} Answer with one item per input line, using the line's id."
+            )},
+            {"role": "user", "content": listing}
+        ]
+
+    async def _run_chunks(self, runtime, chunks, session_id, progress):
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_chunk(chunk):
+            async with semaphore:
+                try:
+                    data = await request_structured_output(
+                        runtime, self._messages(chunk), "batch_fill", BATCH_FILL_SCHEMA,
+                        intent="batch", max_tokens=BATCH_FILL_MAX_TOKENS, session_id=session_id
+                    )
+                    accepted = validate_batch_answer(data, chunk)
+                    self.results.update(accepted)
+                    if len(accepted) < len(chunk):
+                        self.errors.append(f"{len(chunk) - len(accepted)} value(s) were missing or invalid")
+                except AssistantUnavailableError as e:
+                    self.errors.append(str(e))
+                finally:
+                    progress["done"] += 1
+
+        await asyncio.gather(*[run_chunk(chunk) for chunk in chunks])
+
+    def run(self, rows, on_progress=None, session_id=None):
+        """
+        Send the pending source values and collect the answers
+
+        The requests run on the shared event loop; the calling thread waits
+        and reports progress. Stopping the script cancels the requests
+        still in flight, and the answers received so far are kept.
+
+        Args:
+            rows (list): The table's rows
+            on_progress (callable): Called with (requests done, requests in total)
+            session_id (str): Session the requests are queued under by the rate
+                limiter; defaults to the calling session
+
+        Returns:
+            dict: "requested" (values sent), "filled" (values accepted) and
+            "errors" (messages from failed or incomplete requests)
+        """
+        pending = self.pending_sources(rows)
+        chunks = [pending[i:i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+        filled_before = len(self.results)
+        self.errors = []
+        progress = {"done": 0}
+
+        if chunks:
+            runtime = get_openai_runtime()
+            session_id = session_id or get_session_id()
+            future = runtime["loop"].submit(self._run_chunks(runtime, chunks, session_id, progress))
+            try:
+                while True:
+                    try:
+                        future.result(timeout=0.25)
+                        break
+                    except concurrent.futures.TimeoutError:
+                        if on_progress is not None:
+                            on_progress(progress["done"], len(chunks))
+            finally:
+                future.cancel()
+            if on_progress is not None:
+                on_progress(len(chunks), len(chunks))
+
+        return {"requested": len(pending), "filled": len(self.results) - filled_before, "errors": list(self.errors)}
+
+    def apply(self, rows):
+        """
+        Write the accepted values into the table
+
+        Args:
+            rows (list): The table's rows
+
+        Returns:
+            tuple: (new list of rows, indices of the rows that changed)
+        """
+        updated_rows = list(rows)
+        changed = []
+        for index, row in enumerate(rows):
+            if not self._wants_value(row):
+                continue
+            value = self.results.get(str(row[self.task["source"]]).strip())
+            if value is not None and value != row.get(self.task["target"]):
+                updated_rows[index] = dict(row, **{self.task["target"]: value})
+                changed.append(index)
+        return updated_rows, changed
+
+def render_batch_fill(task_name):
+    """
+    Render the controls that fill a table column with the AI Assistant
+
+    Args:
+        task_name (str): A key of BATCH_FILL_TASKS
+    """
+    task = BATCH_FILL_TASKS[task_name]
+    jobs = st.session_state.setdefault("batch_fill_jobs", {})
+    status = st.session_state.setdefault("batch_fill_status", {}).pop(task_name, None)
+    rows = st.session_state.get(task["table"], [])
+
+    with st.expander(f"Fill {task['label']} with the AI Assistant"):
+        if status is not None:
+            level, message = status
+            getattr(st, level)(message)
+
+        overwrite = st.checkbox(f"Replace existing {task['label']}", key=f"batch_fill_overwrite_{task_name}")
+        job = jobs.get(task_name)
+        resuming = job is not None and job.overwrite == overwrite
+        if not resuming:
+            job = BatchFillJob(task_name, overwrite=overwrite)
+
+        pending = job.pending_sources(rows)
+        if not pending:
+            st.caption(f"No rows need {task['label']}.")
+            return
+
+        label = f"Resume ({len(pending)} remaining)" if resuming else f"Fill {task['label']} for {len(pending)} name(s)"
+        if st.button(label, key=f"batch_fill_{task_name}"):
+            # Kept before running so the answers received survive an interruption
+            jobs[task_name] = job
+            progress_bar = st.progress(0.0, text="Sending requests...")
+            summary = job.run(
+                rows,
+                on_progress=lambda done, total: progress_bar.progress(done / total, text=f"{done} of {total} requests done")
+            )
+
+            # Write every accepted value back in one update of the table
+            updated_rows, changed = job.apply(rows)
+            st.session_state[task["table"]] = updated_rows
+            if task["widget_key"]:
+                for index in changed:
+                    st.session_state.pop(task["widget_key"].format(index=index), None)
+
+            if summary["errors"]:
+                st.session_state.batch_fill_status[task_name] = (
+                    "warning",
+                    f"Filled {len(changed)} row(s). Some requests failed ({summary['errors'][0]}); "
+                    "resume to retry the rest."
+                )
+            else:
+                jobs.pop(task_name, None)
+                st.session_state.batch_fill_status[task_name] = ("success", f"Filled {len(changed)} row(s).")
+            st.rerun()
@@ -0,0 +1,257 @@
+# ============================================================================
+# ARCOS SIG Form Application - Change Tracking
+# ============================================================================
+# This file contains the baseline snapshot and diff engine behind the SIG color
+# key. Rows are matched against the baseline through hash indexes on their
+# codes and IDs and classified as deleted, changed or moved.
+# ============================================================================
+
+import copy
+import streamlit as st
+from app.config import DEFAULT_CALLOUT_TYPES
+from app.sig_state import SIGState
+
+# Change statuses, matching the Delete / Changes / Moves color key
+CHANGE_DELETED = "deleted"
+CHANGE_CHANGED = "changed"
+CHANGE_MOVED = "moved"
+
+def snapshot_sig_state(state=None, copy_values=True):
+    """
+    Take a snapshot of the SIG tables
+
+    Args:
+        state (SIGState): State to snapshot; defaults to the session state
+        copy_values (bool): Deep copy the tables. Pass False for a read-only
+            view when the snapshot is only diffed and then discarded.
+
+    Returns:
+        dict: Snapshot that can be stored as a baseline or diffed against one
+    """
+    if state is None:
+        state = SIGState.from_session_state()
+
+    snapshot = {
+        "hierarchy_entries": state.hierarchy_data["entries"],
+        "default_timezone": state.hierarchy_data["timezone"],
+        "job_classifications": state.job_classifications,
+        "trouble_locations": state.trouble_locations,
+        "event_types": state.event_types,
+        "selected_callout_reasons": state.selected_callout_reasons or [],
+        "default_callout_reason": state.default_callout_reason,
+        "responses": state.responses
+    }
+    return copy.deepcopy(snapshot) if copy_values else snapshot
+
+def take_baseline_snapshot():
+    """Store the current SIG tables as the baseline that changes are compared to"""
+    st.session_state.sig_baseline = snapshot_sig_state()
+
+def get_baseline_snapshot():
+    """Return the stored baseline snapshot, or None if no baseline has been set"""
+    return st.session_state.get("sig_baseline")
+
+def diff_rows(baseline_rows, current_rows, key_fn, content_fn, parent_fn=None):
+    """
+    Classify rows against a baseline using a hash index on their keys
+
+    Args:
+        baseline_rows (list): Rows from the baseline snapshot
+        current_rows (list): Rows from the current state
+        key_fn (callable): Returns the identifying keys of a row in priority
+            order (e.g. codes, then name). Rows without keys are ignored.
+        content_fn (callable): Returns a hashable value of the row's content
+        parent_fn (callable): Returns the row's parent, used to detect moves
+
+    Returns:
+        dict: "statuses" holds one status (or None when unchanged) per current
+        row; "deleted" holds the baseline rows with no current match
+    """
+    # Build the hash index: key -> baseline row indices
+    index = {}
+    keyed = [False] * len(baseline_rows)
+    for i, row in enumerate(baseline_rows):
+        for key in key_fn(row):
+            index.setdefault(key, []).append(i)
+            keyed[i] = True
+
+    matched = [False] * len(baseline_rows)
+    statuses = []
+    for row in current_rows:
+        keys = key_fn(row)
+        if not keys:
+            statuses.append(None)
+            continue
+
+        base_index = None
+        for key in keys:
+            base_index = next((j for j in index.get(key, ()) if not matched[j]), None)
+            if base_index is not None:
+                break
+
+        if base_index is None:
+            # New rows are reported as changes
+            statuses.append(CHANGE_CHANGED)
+            continue
+
+        matched[base_index] = True
+        base_row = baseline_rows[base_index]
+        if base_row == row:
+            # Identical rows skip the (slower) parent and content comparison
+            statuses.append(None)
+        elif parent_fn is not None and parent_fn(base_row) != parent_fn(row):
+            statuses.append(CHANGE_MOVED)
+        elif content_fn(base_row) != content_fn(row):
+            statuses.append(CHANGE_CHANGED)
+        else:
+            statuses.append(None)
+
+    deleted = [baseline_rows[i] for i, is_matched in enumerate(matched) if keyed[i] and not is_matched]
+
+    return {"statuses": statuses, "deleted": deleted}
+
+def _hierarchy_depth(entry):
+    """Return the deepest filled level (1-4) of a hierarchy entry, or 0 if empty"""
+    for n in range(4, 0, -1):
+        if entry.get(f"level{n}"):
+            return n
+    return 0
+
+def _hierarchy_keys(entry):
+    """Keys of a hierarchy entry: its location codes, then its deepest name"""
+    depth = _hierarchy_depth(entry)
+    if depth == 0:
+        return []
+    keys = [("code", code) for code in entry.get("codes", []) if code]
+    keys.append(("name", depth, entry[f"level{depth}"]))
+    return keys
+
+def _hierarchy_parent(entry):
+    """Parent path of a hierarchy entry (the levels above its deepest level)"""
+    depth = _hierarchy_depth(entry)
+    return tuple(entry.get(f"level{n}", "") for n in range(1, depth))
+
+def _hierarchy_content(entry):
+    callout_types = entry.get("callout_types", {})
+    return (
+        tuple(entry.get(f"level{n}", "") for n in range(1, 5)),
+        entry.get("timezone", ""),
+        tuple(code for code in entry.get("codes", []) if code),
+        tuple(bool(callout_types.get(ct, False)) for ct in DEFAULT_CALLOUT_TYPES),
+        entry.get("callout_reasons", "")
+    )
+
+def _job_keys(job):
+    if not job.get("title"):
+        return []
+    return [("id", job_id) for job_id in job.get("ids", []) if job_id] + [("title", job["title"])]
+
+def _job_content(job):
+    return (job.get("type", ""), job.get("title", ""),
+            tuple(job_id for job_id in job.get("ids", []) if job_id), job.get("recording", ""))
+
+def _trouble_location_keys(location):
+    if not location.get("location"):
+        return []
+    keys = [("id", location["id"])] if location.get("id") else []
+    return keys + [("name", location["location"])]
+
+def _trouble_location_content(location):
+    return (bool(location.get("recording_needed")), location.get("id", ""),
+            location.get("location", ""), location.get("verbiage", ""))
+
+def _event_type_keys(event):
+    if not event.get("description"):
+        return []
+    return [("id", event.get("id", ""))]
+
+def _event_type_content(event):
+    return tuple(sorted((k, str(v)) for k, v in event.items()))
+
+def _response_keys(item):
+    key, value = item
+    return [key] if value else []
+
+def _response_content(item):
+    return item[1]
+
+def _reason_rows(snapshot, reason_ids):
+    """Build callout reason rows with their use/default flags from a snapshot"""
+    selected = set(snapshot.get("selected_callout_reasons", []))
+    default_reason = snapshot.get("default_callout_reason", "")
+    return [{"ID": reason_id, "use": reason_id in selected, "default": reason_id == default_reason}
+            for reason_id in reason_ids]
+
+def compute_sig_diff(baseline, current, callout_reason_ids=()):
+    """
+    Compare a current snapshot with a baseline snapshot, table by table
+
+    Args:
+        baseline (dict): Baseline snapshot from snapshot_sig_state
+        current (dict): Current snapshot from snapshot_sig_state
+        callout_reason_ids (iterable): IDs of the callout reason catalog
+
+    Returns:
+        dict: Table name mapped to the diff_rows result for that table. The
+        "responses" table rows are (key, value) pairs.
+    """
+    reason_ids = [str(reason_id) for reason_id in callout_reason_ids]
+
+    return {
+        "hierarchy": diff_rows(
+            baseline["hierarchy_entries"], current["hierarchy_entries"],
+            _hierarchy_keys, _hierarchy_content, _hierarchy_parent
+        ),
+        "job_classifications": diff_rows(
+            baseline["job_classifications"], current["job_classifications"],
+            _job_keys, _job_content
+        ),
+        "trouble_locations": diff_rows(
+            baseline["trouble_locations"], current["trouble_locations"],
+            _trouble_location_keys, _trouble_location_content
+        ),
+        "event_types": diff_rows(
+            baseline["event_types"], current["event_types"],
+            _event_type_keys, _event_type_content
+        ),
+        "callout_reasons": diff_rows(
+            _reason_rows(baseline, reason_ids), _reason_rows(current, reason_ids),
+            lambda r: [r["ID"]], lambda r: (r["use"], r["default"])
+        ),
+        "responses": diff_rows(
+            list(baseline["responses"].items()), list(current["responses"].items()),
+            _response_keys, _response_content
+        )
+    }
+
+def get_current_sig_diff(callout_reason_ids=(), state=None):
+    """
+    Diff the current SIG against its stored baseline
+
+    Args:
+        callout_reason_ids (iterable): IDs of the callout reason catalog
+        state (SIGState): State to diff; defaults to the session state
+
+    Returns:
+        dict: Result of compute_sig_diff, or None if no baseline has been set
+    """
+    if state is None:
+        state = SIGState.from_session_state()
+    if state.sig_baseline is None:
+        return None
+    return compute_sig_diff(state.sig_baseline, snapshot_sig_state(state, copy_values=False), callout_reason_ids)
+
+def summarize_sig_diff(diff):
+    """
+    Count the changes in a diff
+
+    Returns:
+        dict: Number of deleted, changed and moved rows across all tables
+    """
+    summary = {CHANGE_DELETED: 0, CHANGE_CHANGED: 0, CHANGE_MOVED: 0}
+    for table_diff in diff.values():
+        summary[CHANGE_DELETED] += len(table_diff["deleted"])
+        for status in table_diff["statuses"]:
+            if status:
+                summary[status] += 1
+    return summary
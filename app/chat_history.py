@@ -0,0 +1,197 @@
+# ============================================================================
+# ARCOS SIG Form Application - Chat History
+# ============================================================================
+# This file contains the bounded chat history of a session. The most recent
+# messages are kept in memory for display and for the assistant's context;
+# older messages are appended to a SQLite table and read back only when the
+# user scrolls back, so long-lived sessions do not keep growing in memory.
+# ============================================================================
+
+import os
+import time
+import uuid
+import sqlite3
+import threading
+import streamlit as st
+from collections import deque
+from app.config import (
+    CHAT_HISTORY_PATH, CHAT_HISTORY_MEMORY_MESSAGES, CHAT_HISTORY_RETENTION_SECONDS
+)
+
+class ChatHistoryStore:
+    """
+    An append-only SQLite table of spilled chat messages, keyed by session.
+
+    Sessions have no end event, so messages older than retention_seconds
+    are removed when the store is opened.
+    """
+    def __init__(self, path=CHAT_HISTORY_PATH, retention_seconds=CHAT_HISTORY_RETENTION_SECONDS):
+        self.path = path
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # One connection shared by the Streamlit script threads, guarded by the lock
+        self._connection = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS chat_messages ("
+                " session_id TEXT NOT NULL,"
+                " seq INTEGER NOT NULL,"
+                " role TEXT NOT NULL,"
+                " content TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " PRIMARY KEY (session_id, seq))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS chat_messages_created_at ON chat_messages (created_at)"
+            )
+            self._connection.execute(
+                "DELETE FROM chat_messages WHERE created_at < ?", (time.time() - retention_seconds,)
+            )
+
+    def append(self, session_id, seq, message):
+        """
+        Store one message
+
+        Args:
+            session_id (str): The session the message belongs to
+            seq (int): Position of the message in the session's history
+            message (dict): The message ({"role", "content"})
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO chat_messages (session_id, seq, role, content, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (session_id, seq, message["role"], message["content"], time.time())
+            )
+
+    def load(self, session_id, start, stop):
+        """
+        Read the stored messages of a session with start <= seq < stop
+
+        Returns:
+            list: Messages ({"role", "content"}), oldest first
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT role, content FROM chat_messages WHERE session_id = ? AND seq >= ? AND seq < ?"
+                " ORDER BY seq", (session_id, start, stop)
+            ).fetchall()
+        return [{"role": role, "content": content} for role, content in rows]
+
+    def delete_session(self, session_id):
+        """Remove every stored message of a session"""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM chat_messages WHERE session_id = ?", (session_id,))
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._connection.close()
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_chat_history_store():
+    """Return the chat history store shared by the whole server process"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ChatHistoryStore()
+        return _store
+
+class ChatHistory:
+    """
+    The chat history of one session.
+
+    Messages are appended like a list. Only the last memory_messages are
+    held in memory; each message pushed out of that window is written to
+    the chat history store, from which load_older reads it back.
+    """
+    def __init__(self, memory_messages=CHAT_HISTORY_MEMORY_MESSAGES):
+        self.session_id = uuid.uuid4().hex
+        self._recent = deque(maxlen=memory_messages)
+        self._spilled = 0
+
+    def append(self, message):
+        """
+        Add a message, spilling the oldest in-memory message to disk if the window is full
+
+        Args:
+            message (dict): The message ({"role", "content"})
+        """
+        if len(self._recent) == self._recent.maxlen:
+            try:
+                get_chat_history_store().append(self.session_id, self._spilled, self._recent[0])
+            except sqlite3.Error as e:
+                # The message is dropped rather than kept in memory
+                print(f"Warning: Failed to save chat history - {str(e)}")
+            self._spilled += 1
+        self._recent.append(message)
+
+    def recent(self, count=None):
+        """
+        Return the most recent messages held in memory
+
+        Args:
+            count (int): Number of messages, or None for the whole in-memory window
+
+        Returns:
+            list: Messages, oldest first
+        """
+        messages = list(self._recent)
+        if count is None:
+            return messages
+        return messages[-count:] if count > 0 else []
+
+    @property
+    def spilled_count(self):
+        """Number of older messages stored on disk"""
+        return self._spilled
+
+    def load_older(self, count):
+        """
+        Read the newest count messages stored on disk
+
+        Args:
+            count (int): Number of messages to read
+
+        Returns:
+            list: Messages immediately preceding the in-memory window, oldest first
+        """
+        if count <= 0 or self._spilled == 0:
+            return []
+        try:
+            return get_chat_history_store().load(self.session_id, max(0, self._spilled - count), self._spilled)
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to load chat history - {str(e)}")
+            return []
+
+    def clear(self):
+        """Remove every message, including those stored on disk"""
+        if self._spilled:
+            try:
+                get_chat_history_store().delete_session(self.session_id)
+            except sqlite3.Error as e:
+                print(f"Warning: Failed to delete chat history - {str(e)}")
+        self._recent.clear()
+        self._spilled = 0
+
+    def __len__(self):
+        return self._spilled + len(self._recent)
+
+def get_chat_history():
+    """
+    Return the chat history of the current session, creating it if needed
+
+    Returns:
+        ChatHistory: The session's chat history
+    """
+    if not isinstance(st.session_state.get("chat_history"), ChatHistory):
+        st.session_state.chat_history = ChatHistory()
+    return st.session_state.chat_history
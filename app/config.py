@@ -5,6 +5,7 @@
 # the application, including color schemes, default values, and page setup.
 # ============================================================================
 
+import os
 import streamlit as st
 
 # Define color scheme to match ARCOS branding
@@ -31,11 +32,37 @@ DEFAULT_CALLOUT_REASONS = [
     "Wires Down"
 ]
 
+# Tabs of the SIG form, in display order
+TAB_NAMES = [
+    "Location Hierarchy",
+    "Trouble Locations",
+    "Job Classifications",
+    "Callout Reasons",
+    "Event Types",
+    "Callout Type Configuration",
+    "Global Configuration Options",
+    "Data and Interfaces",
+    "Additions"
+]
+
+# Partial reruns. Tabs, their table rows and the AI Assistant panel run as
+# Streamlit fragments, so a widget change reruns only the fragment it belongs
+# to instead of the whole page. Set to False to rerun the whole page.
+FRAGMENTS_ENABLED = True
+
+# Option tabs (Global Configuration Options, Data and Interfaces, Additions)
+# can group each section into a form that is saved with one click, so
+# changing several options costs one rerun per section. Follow-up fields
+# that depend on an answer in the same section only appear after Save, so
+# this is opt-in; users can switch it on per session.
+OPTION_FORMS_BATCHED = False
+
 # Application paths
 DATA_PATH = "data/"
 STRUCTURE_JSON_PATH = f"{DATA_PATH}sig_structure.json"
 DESCRIPTIONS_JSON_PATH = f"{DATA_PATH}sig_descriptions.json"
 CALLOUT_REASONS_JSON_PATH = f"{DATA_PATH}callout_reasons.json"
+PRONUNCIATION_EXCEPTIONS_JSON_PATH = f"{DATA_PATH}pronunciation_exceptions.json"
 SYSTEM_PROMPT_PATH = "prompt.txt"
 
 # OpenAI configuration
@@ -43,6 +70,146 @@ DEFAULT_MODEL = "gpt-4o-2024-08-06"
 DEFAULT_MAX_TOKENS = 800
 DEFAULT_TEMPERATURE = 0.7
 
+# System prompt caching. prompt.txt is re-read only when its modification
+# time changes, and the modification time is checked at most this often.
+SYSTEM_PROMPT_CHECK_INTERVAL = 5.0
+DEFAULT_SYSTEM_PROMPT = "You are a helpful expert on ARCOS system implementation."
+HELP_QUERY_TEMPLATE = "Explain in detail what I need to know about {topic} when configuring the {tab_name} tab in ARCOS. Include examples and best practices."
+TAB_CONTEXT_TEMPLATE = "The user is working on the ARCOS System Implementation Guide form. They are currently viewing the '{tab}' tab."
+
+# OpenAI connection pool (shared by all sessions of a server process).
+# Each value can be overridden by a secret of the same name.
+OPENAI_MAX_CONNECTIONS = 20
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 10
+OPENAI_KEEPALIVE_EXPIRY = 30.0
+OPENAI_REQUEST_TIMEOUT = 60.0
+OPENAI_HEALTH_CHECK_TIMEOUT = 5.0
+
+# Base URL of an OpenAI-compatible API, e.g. the local test server in
+# tools/fake_openai_server.py ("http://127.0.0.1:8001/v1"). Empty means the
+# OpenAI API. Set it with the OPENAI_BASE_URL secret or environment variable.
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL", "")
+
+# Deadlines and retries for assistant calls. A call (including its retries)
+# never runs longer than OPENAI_CALL_DEADLINE seconds; rate limits and server
+# errors are retried with exponential backoff and jitter. After
+# OPENAI_CIRCUIT_FAILURE_THRESHOLD failed calls in a row, calls are refused for
+# OPENAI_CIRCUIT_RESET_SECONDS. Each value can be overridden by a secret.
+OPENAI_CALL_DEADLINE = 45.0
+OPENAI_STREAM_IDLE_TIMEOUT = 20.0
+OPENAI_MAX_ATTEMPTS = 4
+OPENAI_BACKOFF_BASE = 0.5
+OPENAI_BACKOFF_MAX = 8.0
+OPENAI_CIRCUIT_FAILURE_THRESHOLD = 5
+OPENAI_CIRCUIT_RESET_SECONDS = 30.0
+
+# Process-wide limit on API requests (0 disables it). Waiting requests are
+# served round-robin across sessions so no session can starve the others.
+OPENAI_RATE_LIMIT_PER_MINUTE = 300
+OPENAI_RATE_LIMIT_BURST = 20
+
+# Model routing for assistant calls. Short topic-style questions go to the
+# fast route and long or complex ones to the large route; a declared intent
+# (e.g. "help") picks its route directly. If a route's call fails or misses
+# its deadline, the request is retried once on the route's fallback within
+# the overall OPENAI_CALL_DEADLINE. Set MODEL_ROUTER_ENABLED to False to send
+# everything to DEFAULT_MODEL.
+MODEL_ROUTER_ENABLED = True
+MODEL_ROUTES = {
+    "fast": {"model": "gpt-4o-mini", "max_tokens": 400, "deadline": 15.0, "fallback": "large"},
+    "large": {"model": DEFAULT_MODEL, "max_tokens": DEFAULT_MAX_TOKENS, "deadline": OPENAI_CALL_DEADLINE, "fallback": "fast"}
+}
+ROUTER_INTENT_ROUTES = {"help": "fast", "review": "large", "batch": "large"}
+ROUTER_FAST_MAX_QUESTION_TOKENS = 40
+ROUTER_LARGE_MIN_PROMPT_TOKENS = 1500
+ROUTER_LARGE_TABS = ["Callout Type Configuration", "Global Configuration Options"]
+ROUTER_COMPLEX_KEYWORDS = [
+    "compare", "review", "recommend", "design", "explain why", "step by step",
+    "best way", "trade-off", "tradeoff", "difference between", "plan"
+]
+
+# Batch fill jobs (e.g. pronunciations for every trouble location). Distinct
+# values are sent CHUNK_SIZE at a time in structured-output requests, with at
+# most MAX_CONCURRENCY requests in flight; values longer than
+# MAX_VALUE_LENGTH characters are rejected.
+BATCH_FILL_CHUNK_SIZE = 50
+BATCH_FILL_MAX_CONCURRENCY = 4
+BATCH_FILL_MAX_TOKENS = 4000
+BATCH_FILL_MAX_VALUE_LENGTH = 120
+
+# Offline pronunciation suggestions for trouble locations. Respellings are
+# memoized per word and per name; empty pronunciations of locations that need
+# a recording are filled in when a workbook is imported.
+PRONUNCIATION_CACHE_SIZE = 20000
+PRONUNCIATION_FILL_ON_IMPORT = True
+
+# Token budget for assistant prompts: the system message, a summary of the
+# current tab's form data, recent chat history and the question together
+ASSISTANT_CONTEXT_TOKEN_BUDGET = 3000
+ASSISTANT_SUMMARY_TOKEN_BUDGET = 500
+ASSISTANT_HISTORY_MESSAGE_TOKENS = 400
+ASSISTANT_HISTORY_MAX_MESSAGES = 10
+
+# Local retrieval over the SIG guide. Questions whose best match covers at
+# least RETRIEVAL_LOCAL_ANSWER_MIN_CONFIDENCE of their terms are answered from
+# the guide directly when local answers are enabled.
+RETRIEVAL_TOP_K = 3
+RETRIEVAL_MIN_SCORE = 1.0
+RETRIEVAL_LOCAL_ANSWER_MIN_CONFIDENCE = 0.85
+ASSISTANT_RETRIEVAL_TOKEN_BUDGET = 700
+ASSISTANT_LOCAL_ANSWERS = True
+
+# Assistant telemetry. Prices are US dollars per million (input, output)
+# tokens and only feed the cost estimate; update them when prices change.
+OPENAI_MODEL_PRICING = {
+    "gpt-4o-2024-08-06": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60)
+}
+TELEMETRY_LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 45.0]
+TELEMETRY_METRICS_PATH = "cache/assistant_metrics.prom"
+TELEMETRY_FLUSH_INTERVAL = 15.0
+TELEMETRY_RECENT_CALLS = 200
+
+# Reuse of answers to near-duplicate free-form questions. Questions are
+# normalized (case, punctuation, contractions, plurals, word order) and
+# compared by MinHash signatures, with LSH_BANDS bands of LSH_ROWS rows
+# picking candidates (roughly those at least (1/bands)^(1/rows) similar).
+# A candidate asked on the same tab, with the same form data, within
+# TTL_SECONDS is reused when the Jaccard similarity of the two questions is
+# at least MIN_SIMILARITY.
+QUESTION_CACHE_ENABLED = True
+QUESTION_CACHE_MIN_SIMILARITY = 0.75
+QUESTION_CACHE_LSH_BANDS = 16
+QUESTION_CACHE_LSH_ROWS = 4
+QUESTION_CACHE_TTL_SECONDS = 60 * 60
+QUESTION_CACHE_MAX_ENTRIES = 1000
+
+# Persistent cache of contextual help answers
+HELP_CACHE_PATH = "cache/help_cache.sqlite3"
+HELP_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+HELP_CACHE_MAX_ENTRIES = 2000
+
+# Whole-SIG review. The export tables are sent in structured-output requests
+# of at most SIG_REVIEW_CHUNK_TOKENS tokens each (most SIGs fit in one), and
+# the findings are cached by a hash of the reviewed data.
+SIG_REVIEW_CACHE_PATH = "cache/sig_review_cache.sqlite3"
+SIG_REVIEW_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+SIG_REVIEW_CACHE_MAX_ENTRIES = 200
+SIG_REVIEW_CHUNK_TOKENS = 6000
+SIG_REVIEW_MAX_CONCURRENCY = 3
+SIG_REVIEW_MAX_TOKENS = 2000
+SIG_REVIEW_MAX_FINDINGS_PER_TAB = 10
+SIG_REVIEW_MAX_MESSAGE_LENGTH = 400
+
+# Chat history. The most recent messages stay in memory (at least the visible
+# window and ASSISTANT_HISTORY_MAX_MESSAGES); older ones are spilled to disk
+# and loaded only when the user asks for them.
+CHAT_HISTORY_PATH = "cache/chat_history.sqlite3"
+CHAT_HISTORY_MEMORY_MESSAGES = 12
+CHAT_HISTORY_VISIBLE_MESSAGES = 6
+CHAT_HISTORY_PAGE_MESSAGES = 20
+CHAT_HISTORY_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
 def setup_page_config():
     """Configure Streamlit page settings"""
     st.set_page_config(
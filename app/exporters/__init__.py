@@ -2,15 +2,30 @@
 # ARCOS SIG Form Application - Exporters Package
 # ============================================================================
 # This file initializes the exporters package for the ARCOS SIG Form application.
-# It imports and exports the export functionality modules.
+# It exports the export functions, importing each exporter module (and pandas)
+# only when its function is first used.
 # ============================================================================
 
-# Import exporter modules
-from app.exporters.csv_exporter import export_to_csv
-from app.exporters.excel_exporter import export_to_excel
+import importlib
+
+# Module defining each exported function
+_EXPORTS = {
+    'export_to_csv': 'app.exporters.csv_exporter',
+    'export_to_excel': 'app.exporters.excel_exporter',
+    'export_to_parquet': 'app.exporters.arrow_exporter'
+}
+
+def __getattr__(name):
+    """Import an exporter the first time one of its functions is looked up"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
 
 # Export all exporter modules
 __all__ = [
     'export_to_csv',
-    'export_to_excel'
-]
\ No newline at end of file
+    'export_to_excel',
+    'export_to_parquet'
+]
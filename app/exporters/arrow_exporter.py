@@ -0,0 +1,274 @@
+# ============================================================================
+# ARCOS SIG Form Application - Arrow/Parquet Exporter
+# ============================================================================
+# This file contains functionality for exporting application data in columnar
+# format. Each SIG table is converted to an Arrow table with typed columns and
+# the tables are bundled into a single zipped Parquet dataset for analytics.
+# ============================================================================
+
+import io
+import zipfile
+from app.helpers import load_callout_reasons
+from app.config import DEFAULT_CALLOUT_TYPES
+from app.sig_state import SIGState
+
+def _require_pyarrow():
+    """Import pyarrow lazily so the rest of the app works without it"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("The Parquet export requires the 'pyarrow' package. Install it with 'pip install pyarrow'.") from e
+    return pa, pq
+
+def _to_int(value):
+    """Convert a free-text form value to int, or None if it is not a number"""
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+def _to_float(value):
+    """Convert a free-text form value to float, or None if it is not a number"""
+    try:
+        return float(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+def _padded(values, size=5):
+    """Return a list padded (or truncated) to the given size with empty strings"""
+    values = list(values or [])
+    return (values + [""] * size)[:size]
+
+def _column_name(label):
+    """Convert a display label such as 'All Hands on Deck' to a column name"""
+    return "".join(c if c.isalnum() else "_" for c in label.lower()).strip("_").replace("__", "_")
+
+def get_arrow_schemas():
+    """
+    Build the Arrow schema for every SIG table
+
+    Returns:
+        dict: Table name mapped to its pyarrow.Schema
+    """
+    pa, _ = _require_pyarrow()
+
+    code_fields = [pa.field(f"code_{n}", pa.string()) for n in range(1, 6)]
+    id_fields = [pa.field(f"id_{n}", pa.string()) for n in range(1, 6)]
+    level_fields = [pa.field(f"level{n}", pa.string()) for n in range(1, 5)]
+
+    return {
+        "location_hierarchy": pa.schema(
+            [pa.field("entry", pa.int32())] + level_fields + [pa.field("timezone", pa.string())] + code_fields
+        ),
+        "co_type_matrix": pa.schema(
+            [pa.field("location", pa.string())] +
+            [pa.field(_column_name(ct), pa.bool_()) for ct in DEFAULT_CALLOUT_TYPES]
+        ),
+        "reasons_matrix": pa.schema(
+            level_fields + [pa.field("callout_reasons", pa.string())]
+        ),
+        "job_classifications": pa.schema(
+            [pa.field("type", pa.string()), pa.field("title", pa.string())] + id_fields +
+            [pa.field("recording", pa.string())]
+        ),
+        "callout_reasons": pa.schema([
+            pa.field("id", pa.string()),
+            pa.field("label", pa.string()),
+            pa.field("use", pa.bool_()),
+            pa.field("default", pa.bool_()),
+            pa.field("verbiage", pa.string())
+        ]),
+        "trouble_locations": pa.schema([
+            pa.field("recording_needed", pa.bool_()),
+            pa.field("id", pa.string()),
+            pa.field("location", pa.string()),
+            pa.field("verbiage", pa.string())
+        ]),
+        "event_types": pa.schema([
+            pa.field("id", pa.string()),
+            pa.field("description", pa.string()),
+            pa.field("use", pa.bool_()),
+            pa.field("use_in_dropdown", pa.bool_()),
+            pa.field("include_in_override", pa.bool_()),
+            pa.field("charged_or_excused", pa.string()),
+            pa.field("employee_on_exception", pa.string()),
+            pa.field("available_on_inbound", pa.string()),
+            pa.field("release_mobile", pa.bool_()),
+            pa.field("release_auto", pa.bool_()),
+            pa.field("make_unavailable", pa.bool_()),
+            pa.field("place_status", pa.bool_()),
+            pa.field("min_duration_hours", pa.float64()),
+            pa.field("max_duration_hours", pa.float64())
+        ]),
+        "callout_type_configs": pa.schema([
+            pa.field("name", pa.string()),
+            pa.field("description", pa.string()),
+            pa.field("abandon_after_minutes", pa.int32()),
+            pa.field("stop_accepting_after_minutes", pa.int32()),
+            pa.field("auto_extend", pa.bool_()),
+            pa.field("custom_message", pa.string()),
+            pa.field("allow_overlap_start", pa.bool_()),
+            pa.field("allow_overlap_end", pa.bool_()),
+            pa.field("overlap_minutes", pa.int32()),
+            pa.field("exceptions_to_override", pa.list_(pa.string()))
+        ]),
+        "other_responses": pa.schema([
+            pa.field("tab", pa.string()),
+            pa.field("section", pa.string()),
+            pa.field("response", pa.string())
+        ])
+    }
+
+def collect_table_rows(state):
+    """
+    Collect the rows of every SIG table
+
+    Args:
+        state (SIGState): Data to export
+
+    Returns:
+        dict: Table name mapped to a list of row dictionaries
+    """
+    hierarchy_data = state.hierarchy_data
+    rows = {name: [] for name in [
+        "location_hierarchy", "co_type_matrix", "reasons_matrix", "job_classifications",
+        "callout_reasons", "trouble_locations", "event_types", "callout_type_configs", "other_responses"
+    ]}
+
+    # Location hierarchy and the two matrices derived from it
+    for i, entry in enumerate(hierarchy_data["entries"]):
+        if not (entry["level1"] or entry["level2"] or entry["level3"] or entry["level4"]):
+            continue
+
+        levels = {f"level{n}": entry[f"level{n}"] for n in range(1, 5)}
+        codes = _padded(entry.get("codes"))
+        row = {"entry": i + 1, **levels, "timezone": entry["timezone"] or hierarchy_data["timezone"]}
+        row.update({f"code_{n + 1}": code for n, code in enumerate(codes)})
+        rows["location_hierarchy"].append(row)
+
+        if entry["level4"]:
+            callout_types = entry.get("callout_types", {})
+            matrix_row = {"location": entry["level4"]}
+            matrix_row.update({_column_name(ct): bool(callout_types.get(ct, False)) for ct in DEFAULT_CALLOUT_TYPES})
+            rows["co_type_matrix"].append(matrix_row)
+
+            if entry.get("callout_reasons", ""):
+                rows["reasons_matrix"].append({**levels, "callout_reasons": entry["callout_reasons"]})
+
+    # Job classifications
+    for job in state.job_classifications:
+        if job["title"]:
+            row = {"type": job["type"], "title": job["title"], "recording": job["recording"]}
+            row.update({f"id_{n + 1}": job_id for n, job_id in enumerate(_padded(job.get("ids")))})
+            rows["job_classifications"].append(row)
+
+    # Callout reasons (full catalog with use/default flags)
+    if state.selected_callout_reasons is not None:
+        selected = set(state.selected_callout_reasons)
+        default_reason = state.default_callout_reason
+        for reason in load_callout_reasons():
+            reason_id = str(reason.get("ID", ""))
+            rows["callout_reasons"].append({
+                "id": reason_id,
+                "label": reason.get("Callout Reason Drop-Down Label", ""),
+                "use": reason_id in selected,
+                "default": reason_id == default_reason,
+                "verbiage": reason.get("Verbiage", "")
+            })
+
+    # Trouble locations
+    for location in state.trouble_locations:
+        if location["location"]:
+            rows["trouble_locations"].append({
+                "recording_needed": bool(location["recording_needed"]),
+                "id": location["id"],
+                "location": location["location"],
+                "verbiage": location["verbiage"]
+            })
+
+    # Event types
+    for event in state.event_types:
+        if event["description"]:
+            rows["event_types"].append({
+                "id": event["id"],
+                "description": event["description"],
+                "use": bool(event["use"]),
+                "use_in_dropdown": bool(event["use_in_dropdown"]),
+                "include_in_override": bool(event["include_in_override"]),
+                "charged_or_excused": event.get("charged_or_excused", ""),
+                "employee_on_exception": event.get("employee_on_exception", ""),
+                "available_on_inbound": event.get("available_on_inbound", ""),
+                "release_mobile": bool(event.get("release_mobile", False)),
+                "release_auto": bool(event.get("release_auto", False)),
+                "make_unavailable": bool(event.get("make_unavailable", False)),
+                "place_status": bool(event.get("place_status", False)),
+                "min_duration_hours": _to_float(event.get("min_duration", "")),
+                "max_duration_hours": _to_float(event.get("max_duration", ""))
+            })
+
+    # Callout type configurations
+    for config in state.callout_type_configs:
+        if config["name"]:
+            rows["callout_type_configs"].append({
+                "name": config["name"],
+                "description": config.get("description", ""),
+                "abandon_after_minutes": _to_int(config.get("abandon_after_minutes")),
+                "stop_accepting_after_minutes": _to_int(config.get("stop_accepting_after_minutes")),
+                "auto_extend": bool(config.get("auto_extend", False)),
+                "custom_message": config.get("custom_message", ""),
+                "allow_overlap_start": bool(config.get("allow_overlap_start", False)),
+                "allow_overlap_end": bool(config.get("allow_overlap_end", False)),
+                "overlap_minutes": _to_int(config.get("overlap_minutes")),
+                "exceptions_to_override": [str(e) for e in config.get("exceptions_to_override", [])]
+            })
+
+    # All other responses
+    for key, value in state.responses.items():
+        if not key.startswith("matrix_") and not key.startswith("reason_") and value:  # Skip matrix entries, reason checkboxes and empty responses
+            if "_" in key:
+                tab, section = key.split("_", 1)
+                rows["other_responses"].append({"tab": tab, "section": section, "response": str(value)})
+
+    return rows
+
+def build_arrow_tables(state=None):
+    """
+    Convert every SIG table to an Arrow table with a fixed, typed schema
+
+    Args:
+        state (SIGState): Data to export; defaults to the session state
+
+    Returns:
+        dict: Table name mapped to a pyarrow.Table (empty tables keep their schema)
+    """
+    pa, _ = _require_pyarrow()
+    schemas = get_arrow_schemas()
+    if state is None:
+        state = SIGState.from_session_state()
+    rows = collect_table_rows(state)
+
+    return {name: pa.Table.from_pylist(rows[name], schema=schema) for name, schema in schemas.items()}
+
+def export_to_parquet(state=None):
+    """
+    Export all SIG tables as a zipped Parquet dataset (one file per table)
+
+    Args:
+        state (SIGState): Data to export; defaults to the session state
+
+    Returns:
+        bytes: Zip archive containing '<table>.parquet' files
+    """
+    _, pq = _require_pyarrow()
+    tables = build_arrow_tables(state)
+
+    output = io.BytesIO()
+    # Parquet pages are already compressed, so the archive only stores them
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name, table in tables.items():
+            buffer = io.BytesIO()
+            pq.write_table(table, buffer, compression="snappy")
+            archive.writestr(f"arcos_sig/{name}.parquet", buffer.getvalue())
+
+    return output.getvalue()
@@ -5,23 +5,34 @@
 # It collects data from all tabs and formats it into a downloadable CSV file.
 # ============================================================================
 
-import streamlit as st
 import pandas as pd
 from app.helpers import load_callout_reasons
+from app.sig_state import SIGState
 
-def export_to_csv():
-    """Export all form data to CSV and return CSV data"""
+def export_to_csv(state=None):
+    """
+    Export all form data to CSV and return CSV data
+    
+    Args:
+        state (SIGState): Data to export; defaults to the session state
+        
+    Returns:
+        bytes: UTF-8 encoded CSV data
+    """
+    if state is None:
+        state = SIGState.from_session_state()
+    
     # Collect data from all tabs
     data = []
     
     # Add location hierarchy data
-    data.append({"Tab": "Location Hierarchy", "Section": "Labels", "Response": str(st.session_state.hierarchy_data["labels"])})
+    data.append({"Tab": "Location Hierarchy", "Section": "Labels", "Response": str(state.hierarchy_data["labels"])})
     
     # Add each location entry separately for better readability
-    for i, entry in enumerate(st.session_state.hierarchy_data["entries"]):
+    for i, entry in enumerate(state.hierarchy_data["entries"]):
         if entry["level1"] or entry["level2"] or entry["level3"] or entry["level4"]:
             location_str = f"Level 1: {entry['level1']}, Level 2: {entry['level2']}, Level 3: {entry['level3']}, Level 4: {entry['level4']}"
-            timezone_str = entry["timezone"] if entry["timezone"] else st.session_state.hierarchy_data["timezone"]
+            timezone_str = entry["timezone"] if entry["timezone"] else state.hierarchy_data["timezone"]
             codes_str = ", ".join([code for code in entry["codes"] if code])
             
             # Get enabled callout types
@@ -53,7 +64,7 @@ def export_to_csv():
                 })
     
     # Add job classifications
-    for i, job in enumerate(st.session_state.job_classifications):
+    for i, job in enumerate(state.job_classifications):
         if job["title"]:
             ids_str = ", ".join([id for id in job["ids"] if id])
             data.append({
@@ -63,10 +74,10 @@ def export_to_csv():
             })
     
     # Add callout reasons
-    if 'selected_callout_reasons' in st.session_state:
+    if state.selected_callout_reasons is not None:
         # Load reasons
         callout_reasons = load_callout_reasons()
-        selected_reasons = [r for r in callout_reasons if r.get("ID") in st.session_state.selected_callout_reasons]
+        selected_reasons = [r for r in callout_reasons if r.get("ID") in state.selected_callout_reasons]
         
         data.append({
             "Tab": "Callout Reasons",
@@ -74,8 +85,8 @@ def export_to_csv():
             "Response": ", ".join([f"{r.get('ID')}: {r.get('Callout Reason Drop-Down Label')}" for r in selected_reasons])
         })
         
-        if 'default_callout_reason' in st.session_state and st.session_state.default_callout_reason:
-            default_reason = next((r for r in callout_reasons if r.get("ID") == st.session_state.default_callout_reason), None)
+        if state.default_callout_reason:
+            default_reason = next((r for r in callout_reasons if r.get("ID") == state.default_callout_reason), None)
             if default_reason:
                 data.append({
                     "Tab": "Callout Reasons",
@@ -84,7 +95,7 @@ def export_to_csv():
                 })
     
     # Add trouble locations
-    for i, location in enumerate(st.session_state.trouble_locations):
+    for i, location in enumerate(state.trouble_locations):
         if location["location"]:
             data.append({
                 "Tab": "Trouble Locations",
@@ -93,7 +104,7 @@ def export_to_csv():
             })
     
     # Add event types
-    for event in st.session_state.event_types:
+    for event in state.event_types:
         if event["use"] and event["description"]:
             data.append({
                 "Tab": "Event Types",
@@ -102,7 +113,7 @@ def export_to_csv():
             })
     
     # Add all other responses
-    for key, value in st.session_state.responses.items():
+    for key, value in state.responses.items():
         if not key.startswith("matrix_") and not key.startswith("reason_") and value:  # Skip matrix entries, reason checkboxes, and empty responses
             if "_" in key:
                 parts = key.split("_", 1)
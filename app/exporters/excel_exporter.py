@@ -5,234 +5,269 @@
 # It creates a workbook with multiple sheets for the different configuration tabs.
 # ============================================================================
 
-import streamlit as st
 import pandas as pd
 import io
 from app.helpers import load_callout_reasons
-from app.config import ARCOS_RED
+from app.config import ARCOS_RED, ARCOS_LIGHT_RED, ARCOS_GREEN, ARCOS_BLUE
+from app.sig_state import SIGState
+from app.change_tracking import (
+    snapshot_sig_state, compute_sig_diff,
+    CHANGE_DELETED, CHANGE_CHANGED, CHANGE_MOVED
+)
 
-def export_to_excel():
+def _hierarchy_row(entry, default_timezone):
+    """Build a Location Hierarchy sheet row from a hierarchy entry"""
+    return {
+        "Level 1": entry["level1"],
+        "Level 2": entry["level2"],
+        "Level 3": entry["level3"],
+        "Level 4": entry["level4"],
+        "Time Zone": entry["timezone"] if entry["timezone"] else default_timezone,
+        "Code 1": entry["codes"][0] if len(entry["codes"]) > 0 else "",
+        "Code 2": entry["codes"][1] if len(entry["codes"]) > 1 else "",
+        "Code 3": entry["codes"][2] if len(entry["codes"]) > 2 else "",
+        "Code 4": entry["codes"][3] if len(entry["codes"]) > 3 else "",
+        "Code 5": entry["codes"][4] if len(entry["codes"]) > 4 else ""
+    }
+
+def _co_type_row(entry):
+    """Build a Matrix of CO Types sheet row from a hierarchy entry"""
+    return {
+        "Location": entry["level4"],
+        "Normal": "X" if entry.get("callout_types", {}).get("Normal", False) else "",
+        "All Hands on Deck": "X" if entry.get("callout_types", {}).get("All Hands on Deck", False) else "",
+        "Fill Shift": "X" if entry.get("callout_types", {}).get("Fill Shift", False) else "",
+        "Travel": "X" if entry.get("callout_types", {}).get("Travel", False) else "",
+        "Notification": "X" if entry.get("callout_types", {}).get("Notification", False) else "",
+        "Notification (No Response)": "X" if entry.get("callout_types", {}).get("Notification (No Response)", False) else ""
+    }
+
+def _reasons_row(entry):
+    """Build a Matrix of Reasons sheet row from a hierarchy entry"""
+    return {
+        "Level 1": entry["level1"],
+        "Level 2": entry["level2"],
+        "Level 3": entry["level3"],
+        "Level 4": entry["level4"],
+        "Callout Reasons": entry["callout_reasons"]
+    }
+
+def _job_row(job):
+    """Build a Job Classifications sheet row"""
+    return {
+        "Type": job["type"],
+        "Classification": job["title"],
+        "ID 1": job["ids"][0] if len(job["ids"]) > 0 else "",
+        "ID 2": job["ids"][1] if len(job["ids"]) > 1 else "",
+        "ID 3": job["ids"][2] if len(job["ids"]) > 2 else "",
+        "ID 4": job["ids"][3] if len(job["ids"]) > 3 else "",
+        "ID 5": job["ids"][4] if len(job["ids"]) > 4 else "",
+        "Recording": job["recording"]
+    }
+
+def _trouble_location_row(location):
+    """Build a Trouble Locations sheet row"""
+    return {
+        "Recording Needed": "X" if location["recording_needed"] else "",
+        "ID": location["id"],
+        "Trouble Location": location["location"],
+        "Pronunciation": location["verbiage"]
+    }
+
+def _event_type_row(event):
+    """Build an Event Types sheet row"""
+    return {
+        "ID": event["id"],
+        "Description": event["description"],
+        "Use?": "X" if event["use"] else "",
+        "Use in Dropdown": "X" if event["use_in_dropdown"] else "",
+        "Override": "X" if event["include_in_override"] else ""
+    }
+
+def _other_row(key, value):
+    """Build an Other Configurations sheet row from a response key, or None to skip it"""
+    if key.startswith("matrix_") or key.startswith("reason_") or not value:  # Skip matrix entries, reason checkboxes and empty responses
+        return None
+    if "_" not in key:
+        return None
+    tab, section = key.split("_", 1)
+    return {"Tab": tab, "Section": section, "Response": value}
+
+def _sheet_value(value):
+    """Convert a DataFrame value to the cell value pandas writes (missing as empty, other non-scalars as text)"""
+    if not pd.api.types.is_scalar(value):
+        return str(value)
+    if pd.isna(value):
+        return ""
+    return value
+
+def _write_sheet(writer, sheet_name, rows, statuses, formats):
+    """
+    Write rows to a sheet with the ARCOS header and color-keyed rows
+
+    Args:
+        writer: pandas ExcelWriter using the xlsxwriter engine
+        sheet_name (str): Name of the sheet to create
+        rows (list): Row dictionaries to write
+        statuses (list): Change status (or None) for each row
+        formats (dict): xlsxwriter formats for the header and each status
     """
-    Export data to Excel format with formatting similar to the original SIG
-    
+    df = pd.DataFrame(rows)
+    df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+    worksheet = writer.sheets[sheet_name]
+    for col_num, value in enumerate(df.columns.values):
+        worksheet.write(0, col_num, value, formats["header"])
+
+    # Color the rows to match the Delete / Changes / Moves color key. The
+    # format is applied per cell so the importer can recognize deleted rows.
+    for row_num, status in enumerate(statuses):
+        if status:
+            for col_num in range(len(df.columns)):
+                worksheet.write(row_num + 1, col_num, _sheet_value(df.iat[row_num, col_num]), formats[status])
+
+def export_to_excel(state=None):
+    """
+    Export data to Excel format with formatting similar to the original SIG.
+    When a baseline has been set, rows are colored by the SIG color key:
+    deleted rows (appended at the end of each sheet) in red, changes in
+    green and moves in blue.
+
+    Args:
+        state (SIGState): Data to export; defaults to the session state
+
     Returns:
         bytes: Excel file as bytes object
     """
+    if state is None:
+        state = SIGState.from_session_state()
+
     # Use pandas to create an Excel file in memory
     output = io.BytesIO()
     writer = pd.ExcelWriter(output, engine='xlsxwriter')
-    
-    # Create a DataFrame for Location Hierarchy
-    location_data = []
-    for entry in st.session_state.hierarchy_data["entries"]:
-        if entry["level1"] or entry["level2"] or entry["level3"] or entry["level4"]:
-            location_data.append({
-                "Level 1": entry["level1"],
-                "Level 2": entry["level2"],
-                "Level 3": entry["level3"],
-                "Level 4": entry["level4"],
-                "Time Zone": entry["timezone"] if entry["timezone"] else st.session_state.hierarchy_data["timezone"],
-                "Code 1": entry["codes"][0] if len(entry["codes"]) > 0 else "",
-                "Code 2": entry["codes"][1] if len(entry["codes"]) > 1 else "",
-                "Code 3": entry["codes"][2] if len(entry["codes"]) > 2 else "",
-                "Code 4": entry["codes"][3] if len(entry["codes"]) > 3 else "",
-                "Code 5": entry["codes"][4] if len(entry["codes"]) > 4 else ""
-            })
-    
-    # Create a DataFrame for the hierarchy data
-    if location_data:
-        hierarchy_df = pd.DataFrame(location_data)
-        hierarchy_df.to_excel(writer, sheet_name='Location Hierarchy', index=False)
-        
-        # Get the xlsxwriter workbook and worksheet objects
-        workbook = writer.book
-        worksheet = writer.sheets['Location Hierarchy']
-        
-        # Add formats
-        header_format = workbook.add_format({
+
+    # Add formats
+    workbook = writer.book
+    formats = {
+        "header": workbook.add_format({
             'bold': True,
             'bg_color': ARCOS_RED,
             'font_color': 'white',
             'border': 1
-        })
-        
-        # Apply formatting
-        for col_num, value in enumerate(hierarchy_df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
-    
-    # Create a DataFrame for Matrix of Locations and CO Types from the hierarchy data
-    matrix_data = []
-    for entry in st.session_state.hierarchy_data["entries"]:
+        }),
+        CHANGE_DELETED: workbook.add_format({'bg_color': ARCOS_LIGHT_RED}),
+        CHANGE_CHANGED: workbook.add_format({'bg_color': ARCOS_GREEN}),
+        CHANGE_MOVED: workbook.add_format({'bg_color': ARCOS_BLUE})
+    }
+
+    callout_reasons = load_callout_reasons()
+
+    # Compare against the baseline, if one has been set
+    baseline = state.sig_baseline
+    diff = None
+    if baseline is not None:
+        diff = compute_sig_diff(baseline, snapshot_sig_state(state, copy_values=False), [r.get("ID", "") for r in callout_reasons])
+
+    def status_of(table, index):
+        return diff[table]["statuses"][index] if diff else None
+
+    def deleted_of(table):
+        return diff[table]["deleted"] if diff else []
+
+    # Location Hierarchy and the two matrices derived from it
+    default_timezone = state.hierarchy_data["timezone"]
+    location_data, location_statuses = [], []
+    matrix_data, matrix_statuses = [], []
+    reasons_data, reasons_statuses = [], []
+
+    hierarchy_rows = [(entry, status_of("hierarchy", i), default_timezone)
+                      for i, entry in enumerate(state.hierarchy_data["entries"])]
+    if baseline is not None:
+        hierarchy_rows += [(entry, CHANGE_DELETED, baseline["default_timezone"]) for entry in deleted_of("hierarchy")]
+
+    for entry, status, entry_default_timezone in hierarchy_rows:
+        if entry["level1"] or entry["level2"] or entry["level3"] or entry["level4"]:
+            location_data.append(_hierarchy_row(entry, entry_default_timezone))
+            location_statuses.append(status)
+
         if entry["level4"]:
-            row_data = {
-                "Location": entry["level4"],
-                "Normal": "X" if entry.get("callout_types", {}).get("Normal", False) else "",
-                "All Hands on Deck": "X" if entry.get("callout_types", {}).get("All Hands on Deck", False) else "",
-                "Fill Shift": "X" if entry.get("callout_types", {}).get("Fill Shift", False) else "",
-                "Travel": "X" if entry.get("callout_types", {}).get("Travel", False) else "",
-                "Notification": "X" if entry.get("callout_types", {}).get("Notification", False) else "",
-                "Notification (No Response)": "X" if entry.get("callout_types", {}).get("Notification (No Response)", False) else ""
-            }
-            
-            matrix_data.append(row_data)
-    
-    # Add matrix sheet
+            matrix_data.append(_co_type_row(entry))
+            matrix_statuses.append(status)
+
+            if entry.get("callout_reasons", ""):
+                reasons_data.append(_reasons_row(entry))
+                reasons_statuses.append(status)
+
+    if location_data:
+        _write_sheet(writer, 'Location Hierarchy', location_data, location_statuses, formats)
+
     if matrix_data:
-        matrix_df = pd.DataFrame(matrix_data)
-        matrix_df.to_excel(writer, sheet_name='Matrix of CO Types', index=False)
-        
-        # Format the matrix sheet
-        worksheet = writer.sheets['Matrix of CO Types']
-        for col_num, value in enumerate(matrix_df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
-    
-    # Create a DataFrame for Matrix of Locations and Reasons from the hierarchy data
-    reasons_data = []
-    for entry in st.session_state.hierarchy_data["entries"]:
-        if entry["level4"] and entry.get("callout_reasons", ""):
-            # Create hierarchical path for display
-            hierarchy_path = []
-            if entry["level1"]:
-                hierarchy_path.append(entry["level1"])
-            if entry["level2"]:
-                hierarchy_path.append(entry["level2"])
-            if entry["level3"]:
-                hierarchy_path.append(entry["level3"])
-            
-            path_str = " > ".join(hierarchy_path)
-            
-            reasons_data.append({
-                "Level 1": entry["level1"],
-                "Level 2": entry["level2"],
-                "Level 3": entry["level3"],
-                "Level 4": entry["level4"],
-                "Callout Reasons": entry["callout_reasons"]
-            })
-    
-    # Add reasons sheet
+        _write_sheet(writer, 'Matrix of CO Types', matrix_data, matrix_statuses, formats)
+
     if reasons_data:
-        reasons_df = pd.DataFrame(reasons_data)
-        reasons_df.to_excel(writer, sheet_name='Matrix of Reasons', index=False)
-        
-        # Format the reasons sheet
-        worksheet = writer.sheets['Matrix of Reasons']
-        for col_num, value in enumerate(reasons_df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
-    
-    # Create a DataFrame for Job Classifications
-    job_data = []
-    for job in st.session_state.job_classifications:
-        if job["title"]:
-            job_data.append({
-                "Type": job["type"],
-                "Classification": job["title"],
-                "ID 1": job["ids"][0] if len(job["ids"]) > 0 else "",
-                "ID 2": job["ids"][1] if len(job["ids"]) > 1 else "",
-                "ID 3": job["ids"][2] if len(job["ids"]) > 2 else "",
-                "ID 4": job["ids"][3] if len(job["ids"]) > 3 else "",
-                "ID 5": job["ids"][4] if len(job["ids"]) > 4 else "",
-                "Recording": job["recording"]
-            })
-    
-    if job_data:
-        job_df = pd.DataFrame(job_data)
-        job_df.to_excel(writer, sheet_name='Job Classifications', index=False)
-        
-        # Format the job sheet
-        worksheet = writer.sheets['Job Classifications']
-        for col_num, value in enumerate(job_df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
-    
-    # Create a DataFrame for Callout Reasons
-    if 'selected_callout_reasons' in st.session_state:
-        callout_reasons = load_callout_reasons()
-        selected_reasons = [r for r in callout_reasons if r.get("ID") in st.session_state.selected_callout_reasons]
-        
+        _write_sheet(writer, 'Matrix of Reasons', reasons_data, reasons_statuses, formats)
+
+    # Job Classifications
+    job_rows = [(job, status_of("job_classifications", i)) for i, job in enumerate(state.job_classifications)]
+    job_rows += [(job, CHANGE_DELETED) for job in deleted_of("job_classifications")]
+    job_rows = [(job, status) for job, status in job_rows if job["title"]]
+
+    if job_rows:
+        _write_sheet(writer, 'Job Classifications', [_job_row(job) for job, _ in job_rows],
+                     [status for _, status in job_rows], formats)
+
+    # Callout Reasons
+    if state.selected_callout_reasons is not None:
+        selected_reasons = [r for r in callout_reasons if r.get("ID") in state.selected_callout_reasons]
+
         if selected_reasons:
             reason_data = [{
                 "ID": r.get("ID", ""),
                 "Callout Reason": r.get("Callout Reason Drop-Down Label", ""),
-                "Use?": "X" if r.get("ID") in st.session_state.selected_callout_reasons else "",
-                "Default?": "X" if r.get("ID") == st.session_state.default_callout_reason else "",
+                "Use?": "X" if r.get("ID") in state.selected_callout_reasons else "",
+                "Default?": "X" if r.get("ID") == state.default_callout_reason else "",
                 "Verbiage": r.get("Verbiage", "")
             } for r in callout_reasons]  # Include all reasons with "Use?" marked
-            
-            reason_df = pd.DataFrame(reason_data)
-            reason_df.to_excel(writer, sheet_name='Callout Reasons', index=False)
-            
-            # Format the reasons sheet
-            worksheet = writer.sheets['Callout Reasons']
-            for col_num, value in enumerate(reason_df.columns.values):
-                worksheet.write(0, col_num, value, header_format)
-                
-    # Create a DataFrame for Trouble Locations
-    trouble_data = []
-    for location in st.session_state.trouble_locations:
-        if location["location"]:
-            trouble_data.append({
-                "Recording Needed": "X" if location["recording_needed"] else "",
-                "ID": location["id"],
-                "Trouble Location": location["location"],
-                "Pronunciation": location["verbiage"]
-            })
-            
-    if trouble_data:
-        trouble_df = pd.DataFrame(trouble_data)
-        trouble_df.to_excel(writer, sheet_name='Trouble Locations', index=False)
-        
-        # Format the trouble locations sheet
-        worksheet = writer.sheets['Trouble Locations']
-        for col_num, value in enumerate(trouble_df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
-    
-    # Create a sheet for Event Types
-    event_data = []
-    for event in st.session_state.event_types:
-        if event["description"]:
-            event_data.append({
-                "ID": event["id"],
-                "Description": event["description"],
-                "Use?": "X" if event["use"] else "",
-                "Use in Dropdown": "X" if event["use_in_dropdown"] else "",
-                "Override": "X" if event["include_in_override"] else ""
-            })
-    
-    if event_data:
-        event_df = pd.DataFrame(event_data)
-        event_df.to_excel(writer, sheet_name='Event Types', index=False)
-        
-        # Format the event types sheet
-        worksheet = writer.sheets['Event Types']
-        for col_num, value in enumerate(event_df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
-    
-    # Create a sheet for other responses
-    other_data = []
-    for key, value in st.session_state.responses.items():
-        if not key.startswith("matrix_") and not key.startswith("reason_") and value:  # Skip matrix entries, reason checkboxes and empty responses
-            if "_" in key:
-                parts = key.split("_", 1)
-                if len(parts) > 1:
-                    tab, section = parts
-                    other_data.append({
-                        "Tab": tab,
-                        "Section": section,
-                        "Response": value
-                    })
-    
+
+            reason_statuses = [status_of("callout_reasons", i) for i in range(len(callout_reasons))]
+            _write_sheet(writer, 'Callout Reasons', reason_data, reason_statuses, formats)
+
+    # Trouble Locations
+    trouble_rows = [(location, status_of("trouble_locations", i)) for i, location in enumerate(state.trouble_locations)]
+    trouble_rows += [(location, CHANGE_DELETED) for location in deleted_of("trouble_locations")]
+    trouble_rows = [(location, status) for location, status in trouble_rows if location["location"]]
+
+    if trouble_rows:
+        _write_sheet(writer, 'Trouble Locations', [_trouble_location_row(location) for location, _ in trouble_rows],
+                     [status for _, status in trouble_rows], formats)
+
+    # Event Types
+    event_rows = [(event, status_of("event_types", i)) for i, event in enumerate(state.event_types)]
+    event_rows += [(event, CHANGE_DELETED) for event in deleted_of("event_types")]
+    event_rows = [(event, status) for event, status in event_rows if event["description"]]
+
+    if event_rows:
+        _write_sheet(writer, 'Event Types', [_event_type_row(event) for event, _ in event_rows],
+                     [status for _, status in event_rows], formats)
+
+    # Other responses
+    response_items = [(item, status_of("responses", i)) for i, item in enumerate(state.responses.items())]
+    response_items += [(item, CHANGE_DELETED) for item in deleted_of("responses")]
+
+    other_data, other_statuses = [], []
+    for (key, value), status in response_items:
+        row = _other_row(key, value)
+        if row:
+            other_data.append(row)
+            other_statuses.append(status)
+
     if other_data:
-        other_df = pd.DataFrame(other_data)
-        other_df.to_excel(writer, sheet_name='Other Configurations', index=False)
-        
-        # Format the other sheet
-        worksheet = writer.sheets['Other Configurations']
-        for col_num, value in enumerate(other_df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
-    
+        _write_sheet(writer, 'Other Configurations', other_data, other_statuses, formats)
+
     # Close the writer and get the output
     writer.close()
-    
+
     # Seek to the beginning of the stream
     output.seek(0)
-    
-    return output.getvalue()
\ No newline at end of file
+
+    return output.getvalue()
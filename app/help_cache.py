@@ -0,0 +1,178 @@
+# ============================================================================
+# ARCOS SIG Form Application - Help Cache
+# ============================================================================
+# This file contains a persistent SQLite cache for contextual help answers.
+# Help prompts are deterministic, so an answer is keyed by a hash of the model,
+# system prompt, topic and tab and reused until it expires.
+# ============================================================================
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from app.config import HELP_CACHE_PATH, HELP_CACHE_TTL_SECONDS, HELP_CACHE_MAX_ENTRIES
+
+def help_cache_key(model, system_prompt, topic, tab_name):
+    """
+    Build the cache key of a contextual help answer
+
+    Args:
+        model (str): The OpenAI model that generates the answer
+        system_prompt (str): The system prompt sent with the help query
+        topic (str): The help topic
+        tab_name (str): The tab the topic belongs to
+
+    Returns:
+        str: Hex SHA-256 digest identifying the answer
+    """
+    # A separator that cannot appear in the text keeps the fields unambiguous
+    raw = "\x1f".join([model, system_prompt, topic, tab_name])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class HelpCache:
+    """
+    A size-bounded, expiring SQLite cache of help answers.
+
+    Entries older than ttl_seconds are treated as misses and removed. When
+    the cache holds more than max_entries, the least recently used entries
+    are evicted. Hit and miss counters are stored with the cache so the hit
+    rate covers every process that shares the file.
+    """
+    def __init__(self, path=HELP_CACHE_PATH, ttl_seconds=HELP_CACHE_TTL_SECONDS, max_entries=HELP_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # One connection shared by the Streamlit script threads, guarded by the lock
+        self._connection = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS help_answers ("
+                " key TEXT PRIMARY KEY,"
+                " topic TEXT NOT NULL,"
+                " tab_name TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " response TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_accessed REAL NOT NULL,"
+                " hit_count INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS help_answers_last_accessed ON help_answers (last_accessed)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS help_cache_stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO help_cache_stats (name, value) VALUES (?, 0)",
+                [("hits",), ("misses",), ("evictions",)]
+            )
+
+    def _count(self, name, amount=1):
+        self._connection.execute("UPDATE help_cache_stats SET value = value + ? WHERE name = ?", (amount, name))
+
+    def get(self, key):
+        """
+        Look up a cached answer
+
+        Args:
+            key (str): Key from help_cache_key
+
+        Returns:
+            str: The cached answer, or None if it is missing or expired
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM help_answers WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and now - row[1] > self.ttl_seconds:
+                self._connection.execute("DELETE FROM help_answers WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self._count("misses")
+                return None
+
+            self._connection.execute(
+                "UPDATE help_answers SET last_accessed = ?, hit_count = hit_count + 1 WHERE key = ?", (now, key)
+            )
+            self._count("hits")
+            return row[0]
+
+    def contains(self, key):
+        """Return True if an unexpired answer is cached, without counting a lookup"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT created_at FROM help_answers WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and time.time() - row[0] <= self.ttl_seconds
+
+    def set(self, key, response, topic="", tab_name="", model=""):
+        """
+        Store an answer, evicting the least recently used entries if the cache is full
+
+        Args:
+            key (str): Key from help_cache_key
+            response (str): The answer to cache
+            topic (str): The help topic (stored for inspection only)
+            tab_name (str): The tab name (stored for inspection only)
+            model (str): The model name (stored for inspection only)
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO help_answers (key, topic, tab_name, model, response, created_at, last_accessed, hit_count)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (key, topic, tab_name, model, response, now, now)
+            )
+            self._evict()
+
+    def _evict(self):
+        """Remove expired entries, then the least recently used ones over the size limit"""
+        removed = self._connection.execute(
+            "DELETE FROM help_answers WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+        ).rowcount
+
+        excess = self._connection.execute("SELECT COUNT(*) FROM help_answers").fetchone()[0] - self.max_entries
+        if excess > 0:
+            removed += self._connection.execute(
+                "DELETE FROM help_answers WHERE key IN"
+                " (SELECT key FROM help_answers ORDER BY last_accessed ASC LIMIT ?)", (excess,)
+            ).rowcount
+
+        if removed:
+            self._count("evictions", removed)
+
+    def stats(self):
+        """
+        Report the cache counters
+
+        Returns:
+            dict: hits, misses, evictions, entries and hit_rate (0.0-1.0)
+        """
+        with self._lock:
+            stats = dict(self._connection.execute("SELECT name, value FROM help_cache_stats").fetchall())
+            stats["entries"] = self._connection.execute("SELECT COUNT(*) FROM help_answers").fetchone()[0]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Remove every cached answer and reset the counters"""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM help_answers")
+            self._connection.execute("UPDATE help_cache_stats SET value = 0")
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._connection.close()
@@ -7,8 +7,83 @@
 
 import streamlit as st
 import json
-import pandas as pd
-from app.config import CALLOUT_REASONS_JSON_PATH, DESCRIPTIONS_JSON_PATH
+from contextlib import contextmanager
+from app.config import (
+    CALLOUT_REASONS_JSON_PATH, DESCRIPTIONS_JSON_PATH, STRUCTURE_JSON_PATH, FRAGMENTS_ENABLED, OPTION_FORMS_BATCHED
+)
+
+def fragment(func):
+    """
+    Make a render function a Streamlit fragment
+
+    A widget change inside a fragment reruns only the fragment; st.rerun()
+    still reruns the whole page. Fragments that depend on each other's data
+    (e.g. a table and its preview) see the change on the next full rerun.
+
+    Args:
+        func (callable): The render function
+
+    Returns:
+        callable: The fragment, or func itself when FRAGMENTS_ENABLED is False
+    """
+    return st.fragment(func) if FRAGMENTS_ENABLED else func
+
+def set_response(key, value):
+    """
+    Store a form response, writing it only when it changed
+
+    Args:
+        key (str): Response key, e.g. "Additions_CTT_Method"
+        value: The response
+
+    Returns:
+        bool: True if the stored response changed
+    """
+    responses = st.session_state.responses
+    if key in responses and responses[key] == value:
+        return False
+    responses[key] = value
+    return True
+
+def render_batch_edit_toggle(tab_key):
+    """
+    Render the switch between batched (one form per section) and immediate editing
+
+    Args:
+        tab_key (str): Unique name of the tab, for the widget key
+
+    Returns:
+        bool: True if sections should be rendered as forms
+    """
+    batched = st.toggle(
+        "Edit in batches",
+        value=st.session_state.get("option_forms_batched", OPTION_FORMS_BATCHED),
+        help="Changes in a section are applied together when you click its Save button, instead of on every click. Follow-up questions appear after saving.",
+        key=f"option_forms_batched_{tab_key}"
+    )
+    # Kept outside the widget so the choice carries over to the other option tabs
+    st.session_state.option_forms_batched = batched
+    return batched
+
+@contextmanager
+def option_section(form_key, batched):
+    """
+    Group the widgets of an option section into a form when batched
+
+    In a form, widget changes do not rerun the script; the section's
+    responses are updated together when the form's Save button is clicked,
+    and fields shown only for some answers appear after saving.
+
+    Args:
+        form_key (str): Unique key of the form
+        batched (bool): Render the section as a form
+    """
+    if not batched:
+        yield
+        return
+    with st.form(form_key, border=False):
+        yield
+        st.form_submit_button("Save section")
 
 def render_color_key():
     """Render the color key header similar to the Excel file"""
@@ -66,6 +141,7 @@ def generate_unique_id(prefix="id"):
 def format_data_for_display(data, style="table"):
     """Format data for display in various formats"""
     if style == "table" and isinstance(data, list) and len(data) > 0:
+        import pandas as pd
         return pd.DataFrame(data)
     elif style == "code":
         return json.dumps(data, indent=2)
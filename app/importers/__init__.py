@@ -0,0 +1,15 @@
+# ============================================================================
+# ARCOS SIG Form Application - Importers Package
+# ============================================================================
+# This file initializes the importers package for the ARCOS SIG Form application.
+# It imports and exports the import functionality modules.
+# ============================================================================
+
+# Import importer modules
+from app.importers.excel_importer import import_from_excel, read_sig_workbook
+
+# Export all importer modules
+__all__ = [
+    'import_from_excel',
+    'read_sig_workbook'
+]
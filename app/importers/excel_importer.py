@@ -0,0 +1,306 @@
+# ============================================================================
+# ARCOS SIG Form Application - Excel Importer
+# ============================================================================
+# This file contains functionality for importing a workbook produced by the
+# Excel exporter back into session state. The workbook is streamed sheet by
+# sheet in read-only mode so large SIGs never need to be fully loaded.
+# ============================================================================
+
+import streamlit as st
+from collections import Counter
+from app.config import DEFAULT_CALLOUT_TYPES, ARCOS_LIGHT_RED, PRONUNCIATION_FILL_ON_IMPORT
+from app.session_manager import initialize_default_event_types
+from app.pronunciation import fill_pronunciations
+
+# Widget keys that cache the previous values of table rows. They must be
+# cleared after an import, otherwise the widgets keep showing the old data.
+WIDGET_KEY_PREFIXES = (
+    "rec_needed_", "loc_id_", "loc_name_", "loc_verbiage_",
+    "event_desc_", "event_use_", "event_dropdown_", "event_override_",
+    "event_charge1_", "event_charge2_", "event_inbound_", "event_release_",
+    "event_auto_", "event_unavail_", "event_status_", "event_min_", "event_max_",
+    "reason_"
+)
+
+def _cell_str(value):
+    """Convert a cell value to the string form used in session state"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+def _cell_value(value):
+    """
+    Convert a cell value to a response value, keeping its type
+
+    Numbers, booleans and dates stay as openpyxl reads them (whole floats as
+    int), so responses the widgets stored as numbers or booleans come back
+    unchanged; only text is stripped.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def _is_marked(value):
+    """Return True if a cell holds an 'X' style mark"""
+    return _cell_str(value).lower() in ("x", "yes", "true", "1")
+
+def _is_deleted_row(cells):
+    """Return True if a row carries the 'Delete' fill of the SIG color key"""
+    fill = getattr(cells[0], "fill", None) if cells else None
+    color = getattr(getattr(fill, "fgColor", None), "rgb", None)
+    return isinstance(color, str) and color.upper().endswith(ARCOS_LIGHT_RED.lstrip("#").upper())
+
+def _iter_sheet_records(worksheet):
+    """
+    Stream the rows of a worksheet as dictionaries keyed by header name.
+    Rows marked as deleted by the change-tracking colors are skipped.
+
+    Args:
+        worksheet: openpyxl read-only worksheet
+
+    Yields:
+        dict: Header name mapped to the cell value for each non-empty row
+    """
+    rows = worksheet.iter_rows()
+    header = next(rows, None)
+    if not header:
+        return
+
+    columns = [_cell_str(cell.value) for cell in header]
+    for cells in rows:
+        values = [cell.value for cell in cells]
+        if all(v is None or _cell_str(v) == "" for v in values) or _is_deleted_row(cells):
+            continue
+        yield {columns[i]: values[i] for i in range(min(len(columns), len(values))) if columns[i]}
+
+def _new_hierarchy_entry():
+    """Return an empty hierarchy entry with every expected field"""
+    return {
+        "level1": "",
+        "level2": "",
+        "level3": "",
+        "level4": "",
+        "timezone": "",
+        "codes": ["", "", "", "", ""],
+        "callout_types": {ct: False for ct in DEFAULT_CALLOUT_TYPES},
+        "callout_reasons": ""
+    }
+
+def _new_event_type(event_id, description):
+    """Return an event type with default values for the columns the export omits"""
+    template = next((e for e in initialize_default_event_types() if e["id"] == event_id), None)
+    event = dict(template) if template else {
+        "charged_or_excused": "",
+        "available_on_inbound": "",
+        "employee_on_exception": "",
+        "release_mobile": False,
+        "release_auto": False,
+        "make_unavailable": False,
+        "place_status": False,
+        "min_duration": "",
+        "max_duration": ""
+    }
+    event.update({"id": event_id, "description": description})
+    return event
+
+def _read_location_hierarchy(worksheet, state):
+    """Read the 'Location Hierarchy' sheet into hierarchy entries"""
+    entries = state["hierarchy_entries"]
+    for record in _iter_sheet_records(worksheet):
+        entry = _new_hierarchy_entry()
+        for n in range(1, 5):
+            entry[f"level{n}"] = _cell_str(record.get(f"Level {n}"))
+        entry["timezone"] = _cell_str(record.get("Time Zone"))
+        entry["codes"] = [_cell_str(record.get(f"Code {n}")) for n in range(1, 6)]
+        entries.append(entry)
+
+def _read_co_type_matrix(worksheet, state):
+    """Read the 'Matrix of CO Types' sheet, keyed by Level 4 location"""
+    matrix = state["co_type_matrix"]
+    for record in _iter_sheet_records(worksheet):
+        location = _cell_str(record.get("Location"))
+        if location:
+            matrix[location] = {ct: _is_marked(record.get(ct)) for ct in DEFAULT_CALLOUT_TYPES}
+
+def _read_reasons_matrix(worksheet, state):
+    """Read the 'Matrix of Reasons' sheet, keyed by the full hierarchy path"""
+    matrix = state["reasons_matrix"]
+    for record in _iter_sheet_records(worksheet):
+        path = tuple(_cell_str(record.get(f"Level {n}")) for n in range(1, 5))
+        matrix[path] = _cell_str(record.get("Callout Reasons"))
+
+def _read_job_classifications(worksheet, state):
+    """Read the 'Job Classifications' sheet"""
+    for record in _iter_sheet_records(worksheet):
+        state["job_classifications"].append({
+            "type": _cell_str(record.get("Type")),
+            "title": _cell_str(record.get("Classification")),
+            "ids": [_cell_str(record.get(f"ID {n}")) for n in range(1, 6)],
+            "recording": _cell_str(record.get("Recording"))
+        })
+
+def _read_callout_reasons(worksheet, state):
+    """Read the 'Callout Reasons' sheet into the selected and default reason IDs"""
+    state["selected_callout_reasons"] = []
+    state["default_callout_reason"] = ""
+    for record in _iter_sheet_records(worksheet):
+        reason_id = _cell_str(record.get("ID"))
+        if _is_marked(record.get("Use?")):
+            state["selected_callout_reasons"].append(reason_id)
+        if _is_marked(record.get("Default?")):
+            state["default_callout_reason"] = reason_id
+
+def _read_trouble_locations(worksheet, state):
+    """Read the 'Trouble Locations' sheet"""
+    for record in _iter_sheet_records(worksheet):
+        state["trouble_locations"].append({
+            "recording_needed": _is_marked(record.get("Recording Needed")),
+            "id": _cell_str(record.get("ID")),
+            "location": _cell_str(record.get("Trouble Location")),
+            "verbiage": _cell_str(record.get("Pronunciation"))
+        })
+
+def _read_event_types(worksheet, state):
+    """Read the 'Event Types' sheet"""
+    for record in _iter_sheet_records(worksheet):
+        event = _new_event_type(_cell_str(record.get("ID")), _cell_str(record.get("Description")))
+        event["use"] = _is_marked(record.get("Use?"))
+        event["use_in_dropdown"] = _is_marked(record.get("Use in Dropdown"))
+        event["include_in_override"] = _is_marked(record.get("Override"))
+        state["event_types"].append(event)
+
+def _read_other_configurations(worksheet, state):
+    """Read the 'Other Configurations' sheet back into response keys"""
+    for record in _iter_sheet_records(worksheet):
+        tab = _cell_str(record.get("Tab"))
+        section = _cell_str(record.get("Section"))
+        if tab and section:
+            state["responses"][f"{tab}_{section}"] = _cell_value(record.get("Response"))
+
+# Sheet name (as written by the Excel exporter) mapped to its reader
+SHEET_READERS = {
+    "Location Hierarchy": _read_location_hierarchy,
+    "Matrix of CO Types": _read_co_type_matrix,
+    "Matrix of Reasons": _read_reasons_matrix,
+    "Job Classifications": _read_job_classifications,
+    "Callout Reasons": _read_callout_reasons,
+    "Trouble Locations": _read_trouble_locations,
+    "Event Types": _read_event_types,
+    "Other Configurations": _read_other_configurations
+}
+
+def read_sig_workbook(file):
+    """
+    Read an exported SIG workbook into a dictionary of session state values
+
+    Args:
+        file: Path or binary file-like object of the .xlsx workbook
+
+    Returns:
+        dict: Session state keys mapped to their reconstructed values. Only the
+        keys for sheets present in the workbook are included.
+    """
+    from openpyxl import load_workbook
+
+    state = {
+        "hierarchy_entries": [],
+        "co_type_matrix": {},
+        "reasons_matrix": {},
+        "job_classifications": [],
+        "trouble_locations": [],
+        "event_types": [],
+        "responses": {}
+    }
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheets_found = [name for name in workbook.sheetnames if name in SHEET_READERS]
+        for name in sheets_found:
+            SHEET_READERS[name](workbook[name], state)
+    finally:
+        workbook.close()
+
+    imported = {}
+
+    # Rebuild the hierarchy, folding the two matrices back into the entries
+    if "Location Hierarchy" in sheets_found:
+        entries = state["hierarchy_entries"]
+        timezones = Counter(e["timezone"] for e in entries if e["timezone"])
+        current_default = st.session_state.hierarchy_data["timezone"] if "hierarchy_data" in st.session_state else ""
+        if current_default in timezones:
+            default_timezone = current_default
+        else:
+            default_timezone = timezones.most_common(1)[0][0] if timezones else "ET / CT / MT / PT"
+
+        for entry in entries:
+            # Entries exported with the default time zone did not set their own
+            if entry["timezone"] == default_timezone:
+                entry["timezone"] = ""
+            if entry["level4"] in state["co_type_matrix"]:
+                entry["callout_types"] = dict(state["co_type_matrix"][entry["level4"]])
+            path = tuple(entry[f"level{n}"] for n in range(1, 5))
+            entry["callout_reasons"] = state["reasons_matrix"].get(path, "")
+
+        imported["hierarchy_data"] = {
+            "levels": ["Level 1", "Level 2", "Level 3", "Level 4"],
+            "labels": list(st.session_state.hierarchy_data["labels"]) if "hierarchy_data" in st.session_state
+                      else ["Parent Company", "Business Unit", "Division", "OpCenter"],
+            "entries": entries or [_new_hierarchy_entry()],
+            "timezone": default_timezone
+        }
+
+    if "Job Classifications" in sheets_found:
+        imported["job_classifications"] = state["job_classifications"]
+
+    if "Callout Reasons" in sheets_found:
+        imported["selected_callout_reasons"] = state["selected_callout_reasons"]
+        imported["default_callout_reason"] = state["default_callout_reason"]
+
+    if "Trouble Locations" in sheets_found:
+        imported["trouble_locations"] = state["trouble_locations"]
+        if PRONUNCIATION_FILL_ON_IMPORT:
+            # Suggest pronunciations for locations that need a recording but have none
+            imported["trouble_locations"], _ = fill_pronunciations(state["trouble_locations"])
+
+    if "Event Types" in sheets_found:
+        imported["event_types"] = state["event_types"]
+
+    if "Other Configurations" in sheets_found:
+        imported["responses"] = state["responses"]
+
+    return imported
+
+def apply_imported_state(imported):
+    """
+    Replace session state with imported values in one bulk update
+
+    Args:
+        imported (dict): Session state keys mapped to their new values
+    """
+    # Drop cached widget values so the tables render the imported rows
+    stale_keys = [key for key in st.session_state.keys()
+                  if isinstance(key, str) and key.startswith(WIDGET_KEY_PREFIXES)]
+    for key in stale_keys:
+        del st.session_state[key]
+
+    st.session_state.update(imported)
+
+def import_from_excel(file):
+    """
+    Import an exported SIG workbook into session state
+
+    Args:
+        file: Path or binary file-like object of the .xlsx workbook
+
+    Returns:
+        list: Names of the session state keys that were replaced
+    """
+    imported = read_sig_workbook(file)
+    apply_imported_state(imported)
+    return list(imported.keys())
@@ -5,9 +5,33 @@
 # It handles initialization of the client, sending requests, and handling responses.
 # ============================================================================
 
-import openai
+import os
+import re
+import json
+import time
+import uuid
+import hashlib
+import queue
+import asyncio
+import threading
 import streamlit as st
-from app.config import DEFAULT_MODEL, DEFAULT_MAX_TOKENS, DEFAULT_TEMPERATURE, SYSTEM_PROMPT_PATH
+from app.config import (
+    DEFAULT_MODEL, DEFAULT_MAX_TOKENS, DEFAULT_TEMPERATURE, SYSTEM_PROMPT_PATH,
+    OPENAI_MAX_CONNECTIONS, OPENAI_MAX_KEEPALIVE_CONNECTIONS, OPENAI_KEEPALIVE_EXPIRY,
+    OPENAI_REQUEST_TIMEOUT, OPENAI_HEALTH_CHECK_TIMEOUT, OPENAI_BASE_URL,
+    SYSTEM_PROMPT_CHECK_INTERVAL, DEFAULT_SYSTEM_PROMPT, TAB_CONTEXT_TEMPLATE, TAB_NAMES,
+    OPENAI_CALL_DEADLINE, OPENAI_STREAM_IDLE_TIMEOUT, OPENAI_MAX_ATTEMPTS, OPENAI_BACKOFF_BASE,
+    OPENAI_BACKOFF_MAX, OPENAI_CIRCUIT_FAILURE_THRESHOLD, OPENAI_CIRCUIT_RESET_SECONDS,
+    OPENAI_RATE_LIMIT_PER_MINUTE, OPENAI_RATE_LIMIT_BURST, MODEL_ROUTER_ENABLED, MODEL_ROUTES,
+    ROUTER_INTENT_ROUTES, ROUTER_FAST_MAX_QUESTION_TOKENS, ROUTER_LARGE_MIN_PROMPT_TOKENS,
+    ROUTER_LARGE_TABS, ROUTER_COMPLEX_KEYWORDS
+)
+from app.telemetry import get_telemetry
+from app.assistant_context import count_tokens
+from app.openai_resilience import (
+    AssistantUnavailableError, CircuitOpenError, RateLimiterBusyError, InvalidAnswerError, CircuitBreaker,
+    BackgroundEventLoop, SingleFlight, FairRateLimiter, is_retryable_error, backoff_delay
+)
 
 class DummyClient:
     """
@@ -18,69 +42,801 @@ class DummyClient:
         self.chat = self
         self.completions = self
     
-    def create(self, **kwargs):
+    PLACEHOLDER_RESPONSE = "This is a placeholder response since the OpenAI API key is not configured. In a real deployment, this would be a helpful response from the AI model."
+    
+    def create(self, stream=False, **kwargs):
         from collections import namedtuple
+        if stream:
+            return self._stream()
+        
         Choice = namedtuple('Choice', ['message'])
         Message = namedtuple('Message', ['content'])
         Response = namedtuple('Response', ['choices'])
         
-        msg = Message(content="This is a placeholder response since the OpenAI API key is not configured. In a real deployment, this would be a helpful response from the AI model.")
+        msg = Message(content=self.PLACEHOLDER_RESPONSE)
         choices = [Choice(message=msg)]
         return Response(choices=choices)
+    
+    def _stream(self):
+        """Yield the placeholder response word by word, like a streamed completion"""
+        from collections import namedtuple
+        Chunk = namedtuple('Chunk', ['choices'])
+        Choice = namedtuple('Choice', ['delta'])
+        Delta = namedtuple('Delta', ['content'])
+        
+        words = self.PLACEHOLDER_RESPONSE.split(" ")
+        for i, word in enumerate(words):
+            yield Chunk(choices=[Choice(delta=Delta(content=word if i == 0 else " " + word))])
+
+async def _iterate_async(items):
+    """Expose a plain iterable as an async iterator"""
+    for item in items:
+        yield item
+
+class AsyncDummyClient(DummyClient):
+    """The dummy client with the awaitable interface of openai.AsyncOpenAI"""
+    async def create(self, stream=False, **kwargs):
+        response = DummyClient.create(self, stream=stream, **kwargs)
+        return _iterate_async(response) if stream else response
+
+def _get_setting(name, default):
+    """Read a setting from the Streamlit secrets, falling back to the config default"""
+    try:
+        return type(default)(st.secrets.get(name, default))
+    except Exception:
+        return default
+
+def get_openai_pool_settings():
+    """
+    Get the connection pool settings for the OpenAI client
+    
+    Returns:
+        dict: Pool limits and timeouts, from secrets or the config defaults
+    """
+    return {
+        "max_connections": _get_setting("OPENAI_MAX_CONNECTIONS", OPENAI_MAX_CONNECTIONS),
+        "max_keepalive_connections": _get_setting("OPENAI_MAX_KEEPALIVE_CONNECTIONS", OPENAI_MAX_KEEPALIVE_CONNECTIONS),
+        "keepalive_expiry": _get_setting("OPENAI_KEEPALIVE_EXPIRY", OPENAI_KEEPALIVE_EXPIRY),
+        "timeout": _get_setting("OPENAI_REQUEST_TIMEOUT", OPENAI_REQUEST_TIMEOUT)
+    }
+
+def get_openai_credentials():
+    """
+    Get the API key and base URL for the OpenAI clients
+    
+    Returns:
+        dict: "api_key" and "base_url" (None for the OpenAI API). A local
+        server configured through OPENAI_BASE_URL needs no real API key.
+        
+    Raises:
+        KeyError: No API key is configured and no local server is set
+    """
+    base_url = _get_setting("OPENAI_BASE_URL", OPENAI_BASE_URL) or None
+    try:
+        api_key = st.secrets["OPENAI_API_KEY"]
+    except Exception:
+        if base_url is None:
+            raise KeyError("OPENAI_API_KEY is not configured")
+        api_key = "local"
+    return {"api_key": api_key, "base_url": base_url}
+
+def pooled_http_client_options(client_factory):
+    """
+    Build the keyword arguments that give an OpenAI client the tuned connection pool
+    
+    The pool is created through openai's own factory (DefaultHttpxClient or
+    DefaultAsyncHttpxClient), and the limits use the class of openai's default
+    limits, so it works with whichever HTTP library the installed openai uses.
+    
+    Args:
+        client_factory (callable): openai.DefaultHttpxClient or openai.DefaultAsyncHttpxClient
+        
+    Returns:
+        dict: {"http_client": ...}, or {} (openai's default pool) if the settings could not be applied
+    """
+    try:
+        import openai
+        settings = get_openai_pool_settings()
+        limits = type(openai.DEFAULT_CONNECTION_LIMITS)(
+            max_connections=settings["max_connections"],
+            max_keepalive_connections=settings["max_keepalive_connections"],
+            keepalive_expiry=settings["keepalive_expiry"]
+        )
+        return {"http_client": client_factory(limits=limits, timeout=settings["timeout"])}
+    except Exception as e:
+        print(f"Warning: OpenAI connection pool settings could not be applied - {str(e)}")
+        return {}
 
 def initialize_openai_client():
-    """Initialize and return OpenAI client for API calls"""
+    """
+    Initialize and return a new OpenAI client for API calls.
+    
+    The assistant itself uses the async client of get_openai_runtime(); this
+    synchronous client is for scripts. The dummy client is only used when no
+    API key is configured; if the pool cannot be tuned, openai's default pool
+    is used.
+    """
     try:
-        client = openai.OpenAI(api_key=st.secrets["OPENAI_API_KEY"])
-        return client
+        # Imported on first use; openai takes longer to import than the rest of the app
+        import openai
+        credentials = get_openai_credentials()
     except Exception as e:
         print(f"Warning: OpenAI client initialization failed - {str(e)}")
         # Create a dummy client for demo purposes when API key is not available
         return DummyClient()
+    return openai.OpenAI(**credentials, **pooled_http_client_options(openai.DefaultHttpxClient))
+
+def initialize_async_openai_client():
+    """
+    Initialize and return a new async OpenAI client with the same pool settings.
+    
+    Retries are disabled in the client because the calls below retry with
+    their own backoff, deadline and circuit breaker.
+    """
+    try:
+        import openai
+        credentials = get_openai_credentials()
+    except Exception as e:
+        print(f"Warning: Async OpenAI client initialization failed - {str(e)}")
+        return AsyncDummyClient()
+    return openai.AsyncOpenAI(**credentials, **pooled_http_client_options(openai.DefaultAsyncHttpxClient),
+                              max_retries=0)
+
+@st.cache_resource(show_spinner=False)
+def get_openai_runtime():
+    """
+    Get the process-wide async client, the event loop it runs on and the
+    circuit breaker shared by all sessions.
+    
+    Returns:
+        dict: "loop" (BackgroundEventLoop), "client", "breaker" (CircuitBreaker),
+        "singleflight" (SingleFlight), "limiter" (FairRateLimiter) and
+        "settings" (deadline and retry settings)
+    """
+    return {
+        "loop": BackgroundEventLoop(),
+        "client": initialize_async_openai_client(),
+        "singleflight": SingleFlight(on_call=lambda outcome: get_telemetry().record_cache("coalesced", outcome)),
+        "limiter": FairRateLimiter(
+            _get_setting("OPENAI_RATE_LIMIT_PER_MINUTE", OPENAI_RATE_LIMIT_PER_MINUTE),
+            _get_setting("OPENAI_RATE_LIMIT_BURST", OPENAI_RATE_LIMIT_BURST)
+        ),
+        "breaker": CircuitBreaker(
+            _get_setting("OPENAI_CIRCUIT_FAILURE_THRESHOLD", OPENAI_CIRCUIT_FAILURE_THRESHOLD),
+            _get_setting("OPENAI_CIRCUIT_RESET_SECONDS", OPENAI_CIRCUIT_RESET_SECONDS)
+        ),
+        "settings": {
+            "deadline": _get_setting("OPENAI_CALL_DEADLINE", OPENAI_CALL_DEADLINE),
+            "idle_timeout": _get_setting("OPENAI_STREAM_IDLE_TIMEOUT", OPENAI_STREAM_IDLE_TIMEOUT),
+            "max_attempts": _get_setting("OPENAI_MAX_ATTEMPTS", OPENAI_MAX_ATTEMPTS),
+            "backoff_base": _get_setting("OPENAI_BACKOFF_BASE", OPENAI_BACKOFF_BASE),
+            "backoff_max": _get_setting("OPENAI_BACKOFF_MAX", OPENAI_BACKOFF_MAX)
+        }
+    }
+
+def is_openai_configured():
+    """
+    Check whether assistant requests reach a real model
+    
+    Returns:
+        bool: False when the client serving requests is the placeholder dummy client
+    """
+    return not isinstance(get_openai_runtime()["client"], DummyClient)
+
+def check_openai_client_health():
+    """
+    Check that the client serving assistant requests can reach the API
+    
+    Returns:
+        dict: "ok" (bool), "latency_ms" (float), "client" (class name) and "error" (str or None)
+    """
+    runtime = get_openai_runtime()
+    client = runtime["client"]
+    result = {"ok": True, "latency_ms": 0.0, "client": type(client).__name__, "error": None}
+    
+    # The dummy client has no connection to check
+    if isinstance(client, DummyClient):
+        return result
+    
+    timeout = _get_setting("OPENAI_HEALTH_CHECK_TIMEOUT", OPENAI_HEALTH_CHECK_TIMEOUT)
+    
+    async def list_models():
+        return await client.with_options(timeout=timeout, max_retries=0).models.list()
+    
+    start = time.perf_counter()
+    try:
+        runtime["loop"].submit(list_models()).result(timeout=timeout + 1)
+    except Exception as e:
+        result["ok"] = False
+        result["error"] = str(e) or type(e).__name__
+    result["latency_ms"] = (time.perf_counter() - start) * 1000
+    return result
+
+# Process-wide system prompt cache, keyed by the modification time of prompt.txt.
+# "messages" holds the assembled system message for each context string.
+_system_prompt_cache = {"mtime": None, "prompt": None, "checked_at": 0.0, "messages": {}}
+_system_prompt_lock = threading.Lock()
+
+# Upper bound on cached system messages for free-form (non-tab) contexts
+MAX_CACHED_SYSTEM_MESSAGES = 256
+
+def _build_system_message(prompt, context):
+    """Assemble the system message for a context"""
+    content = f"{prompt}\n\nCurrent context: {context}" if context else prompt
+    return {"role": "system", "content": content}
+
+def _refresh_system_prompt():
+    """
+    Reload prompt.txt if its modification time changed. Must hold _system_prompt_lock.
+    
+    When the prompt is (re)loaded, the system messages for every tab context
+    are precompiled so later lookups need no file I/O or string building.
+    """
+    now = time.monotonic()
+    cache = _system_prompt_cache
+    if cache["prompt"] is not None and now - cache["checked_at"] < SYSTEM_PROMPT_CHECK_INTERVAL:
+        return
+    cache["checked_at"] = now
+    
+    try:
+        mtime = os.stat(SYSTEM_PROMPT_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    
+    if cache["prompt"] is not None and mtime == cache["mtime"]:
+        return
+    
+    if mtime is None:
+        print(f"Warning: System prompt file '{SYSTEM_PROMPT_PATH}' not found - using the default system prompt")
+        prompt = DEFAULT_SYSTEM_PROMPT
+    else:
+        try:
+            with open(SYSTEM_PROMPT_PATH, 'r') as file:
+                prompt = file.read()
+        except Exception as e:
+            print(f"Warning: Failed to load system prompt - {str(e)}")
+            prompt = DEFAULT_SYSTEM_PROMPT
+    
+    messages = {"": _build_system_message(prompt, "")}
+    for tab in TAB_NAMES:
+        context = TAB_CONTEXT_TEMPLATE.format(tab=tab)
+        messages[context] = _build_system_message(prompt, context)
+    
+    cache.update({"mtime": mtime, "prompt": prompt, "messages": messages})
 
 def load_system_prompt():
-    """Load the system prompt from prompt.txt file"""
+    """Load the system prompt from prompt.txt, cached until the file changes"""
+    with _system_prompt_lock:
+        _refresh_system_prompt()
+        return _system_prompt_cache["prompt"]
+
+def get_system_message(context=""):
+    """
+    Get the assembled system message for a context
+    
+    Args:
+        context (str): Additional context about what the user is doing
+        
+    Returns:
+        dict: The system message; treat it as read-only since it is shared
+    """
+    with _system_prompt_lock:
+        _refresh_system_prompt()
+        messages = _system_prompt_cache["messages"]
+        message = messages.get(context)
+        if message is None:
+            message = _build_system_message(_system_prompt_cache["prompt"], context)
+            if len(messages) < len(TAB_NAMES) + 1 + MAX_CACHED_SYSTEM_MESSAGES:
+                messages[context] = message
+        return message
+
+def _describe_error(error):
+    """Turn an API failure into a message that can be shown to the user"""
+    import openai
+    if isinstance(error, AssistantUnavailableError):
+        return str(error)
+    if isinstance(error, (asyncio.TimeoutError, openai.APITimeoutError)):
+        return "The AI service did not respond in time. Please try again."
+    if isinstance(error, openai.RateLimitError):
+        return "The AI service is busy right now. Please try again in a moment."
+    if isinstance(error, openai.APIConnectionError):
+        return "Could not connect to the AI service. Please try again."
+    if isinstance(error, openai.APIStatusError):
+        return f"The AI service returned an error ({error.status_code}). Please try again."
+    return f"The AI service request failed: {str(error)}"
+
+async def _acquire_request_slot(runtime, session_id, deadline):
+    """Wait for the process-wide rate limiter, at most until the deadline"""
     try:
-        with open(SYSTEM_PROMPT_PATH, 'r') as file:
-            return file.read()
+        await asyncio.wait_for(runtime["limiter"].acquire(session_id), timeout=max(0.0, deadline - time.monotonic()))
+    except asyncio.TimeoutError:
+        # Waiting on our own limit says nothing about the API's health
+        raise RateLimiterBusyError("The AI Assistant is busy with other requests. Please try again in a moment.")
+
+def _estimate_tokens(messages, text, model):
+    """Estimate prompt and completion tokens when the API reports no usage"""
+    prompt_tokens = sum(count_tokens(str(m.get("content", "")), model) for m in messages)
+    return prompt_tokens, count_tokens(text or "", model)
+
+def _record_usage(metrics, usage, messages, text, model):
+    """Store the token usage of a call, estimating it if the API did not report it"""
+    if usage is not None and getattr(usage, "prompt_tokens", None) is not None:
+        metrics["prompt_tokens"] = usage.prompt_tokens
+        metrics["completion_tokens"] = usage.completion_tokens
+    else:
+        metrics["prompt_tokens"], metrics["completion_tokens"] = _estimate_tokens(messages, text, model)
+
+async def _record_call(kind, model, metrics, coroutine):
+    """
+    Await an API call and record its telemetry
+    
+    Args:
+        kind (str): "chat" or "completion"
+        model (str): The model called
+        metrics (dict): Filled in by the call: "attempts", "ttft",
+            "prompt_tokens" and "completion_tokens"
+        coroutine: The call, e.g. from _call_with_retries
+    """
+    start = time.monotonic()
+    metrics["started_at"] = start
+    outcome, error_class = "ok", None
+    try:
+        return await coroutine
+    except asyncio.CancelledError:
+        outcome = "cancelled"
+        raise
     except Exception as e:
-        print(f"Warning: Failed to load system prompt - {str(e)}")
-        return "You are a helpful expert on ARCOS system implementation."
+        outcome = "error"
+        error_class = type(e.__cause__ or e).__name__
+        raise
+    finally:
+        get_telemetry().record_call(
+            kind, model, outcome, time.monotonic() - start,
+            ttft=metrics.get("ttft"),
+            prompt_tokens=metrics.get("prompt_tokens", 0),
+            completion_tokens=metrics.get("completion_tokens", 0),
+            retries=max(0, metrics.get("attempts", 1) - 1),
+            error_class=error_class
+        )
 
-def get_openai_response(prompt, context="", model=DEFAULT_MODEL, max_tokens=DEFAULT_MAX_TOKENS, temperature=DEFAULT_TEMPERATURE):
+async def _call_with_retries(runtime, deadline, attempt_fn, progress=None, session_id=None, metrics=None):
+    """
+    Run an API call with backoff, a deadline and the circuit breaker
+    
+    Args:
+        runtime (dict): Result of get_openai_runtime
+        deadline (float): time.monotonic() value by which the call must end
+        attempt_fn (callable): Coroutine function making one attempt; it
+            receives the seconds left before the deadline
+        progress (dict): For streams, "started" is set once text was
+            delivered; a stream that started is never retried
+        session_id (str): Session the request is queued under by the rate limiter
+        metrics (dict): Receives the number of "attempts" for telemetry
+    
+    Returns:
+        The result of the successful attempt
+    """
+    breaker = runtime["breaker"]
+    settings = runtime["settings"]
+    breaker.before_call()
+    
+    attempt = 0
+    while True:
+        attempt += 1
+        if metrics is not None:
+            metrics["attempts"] = attempt
+        try:
+            await _acquire_request_slot(runtime, session_id, deadline)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            result = await attempt_fn(remaining)
+            breaker.record_success()
+            return result
+        except asyncio.CancelledError:
+            breaker.release_trial()
+            raise
+        except RateLimiterBusyError:
+            # No API call was made
+            breaker.release_trial()
+            raise
+        except InvalidAnswerError:
+            # The API itself answered
+            breaker.record_success()
+            raise
+        except Exception as e:
+            retryable = is_retryable_error(e)
+            if retryable and attempt < settings["max_attempts"] and not (progress and progress["started"]):
+                delay = backoff_delay(attempt, settings["backoff_base"], settings["backoff_max"], e)
+                if time.monotonic() + delay < deadline:
+                    print(f"Warning: OpenAI request attempt {attempt} failed - {str(e) or type(e).__name__}; retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+            if retryable:
+                breaker.record_failure()
+            else:
+                breaker.release_trial()
+            raise AssistantUnavailableError(_describe_error(e)) from e
+
+def get_session_id():
+    """Identify the calling session for fair queuing (the thread outside Streamlit)"""
+    if not st.runtime.exists():
+        return f"thread-{threading.get_ident()}"
+    if "ai_session_id" not in st.session_state:
+        st.session_state.ai_session_id = uuid.uuid4().hex
+    return st.session_state.ai_session_id
+
+def _request_key(model, messages, max_tokens, temperature):
+    """Identify identical requests: same model, messages and parameters"""
+    payload = json.dumps([model, messages, max_tokens, temperature], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _track_inflight(future):
+    """Remember the session's in-flight request so a newer action can cancel it"""
+    # Outside 'streamlit run' (tools, benchmarks) there are no sessions and
+    # concurrent calls must not cancel each other
+    if not st.runtime.exists():
+        return
+    cancel_inflight_request()
+    st.session_state.ai_inflight_request = future
+
+def cancel_inflight_request():
+    """Cancel the session's in-flight AI request, if any (new question or tab switch)"""
+    if not st.runtime.exists():
+        return
+    future = st.session_state.get("ai_inflight_request")
+    if future is not None and not future.done():
+        future.cancel()
+
+def _build_messages(prompt, context, history=None):
+    """Assemble the messages for a question, using the cached system message"""
+    return [get_system_message(context)] + list(history or []) + [{"role": "user", "content": prompt}]
+
+_COMPLEX_PATTERN = re.compile(
+    r"\b(" + "|".join(re.escape(keyword) for keyword in ROUTER_COMPLEX_KEYWORDS) + r")\b", re.IGNORECASE
+)
+
+def choose_model_route(prompt, tab_name="", intent=None, history=None):
+    """
+    Pick the model route for a request
+    
+    Args:
+        prompt (str): The user's query
+        tab_name (str): The tab the request comes from
+        intent (str): What the caller is doing, e.g. "help" or "review"; an
+            intent listed in ROUTER_INTENT_ROUTES decides the route outright
+        history (list): Messages sent between the system message and the question
+        
+    Returns:
+        str: "fast" for short, topic-style questions, otherwise "large"
+    """
+    if intent in ROUTER_INTENT_ROUTES:
+        return ROUTER_INTENT_ROUTES[intent]
+    
+    question_tokens = count_tokens(prompt)
+    history_tokens = sum(count_tokens(str(m.get("content", ""))) for m in history or [])
+    if question_tokens + history_tokens >= ROUTER_LARGE_MIN_PROMPT_TOKENS:
+        return "large"
+    if question_tokens > ROUTER_FAST_MAX_QUESTION_TOKENS or tab_name in ROUTER_LARGE_TABS:
+        return "large"
+    if _COMPLEX_PATTERN.search(prompt):
+        return "large"
+    return "fast"
+
+def _route_plan(prompt, model, max_tokens, tab_name, intent, history=None):
+    """
+    List the routes a request may use, the preferred one first
+    
+    A model chosen by the caller is used as is, without a fallback.
+    
+    Returns:
+        list: Routes, each a dict with "route", "model", "max_tokens" and
+        "deadline" (seconds, or None for the whole call deadline)
+    """
+    if model is not None or not MODEL_ROUTER_ENABLED:
+        return [{"route": "fixed", "model": model or DEFAULT_MODEL,
+                 "max_tokens": max_tokens or DEFAULT_MAX_TOKENS, "deadline": None}]
+    
+    route = choose_model_route(prompt, tab_name, intent, history)
+    plan = []
+    for name in dict.fromkeys([route, MODEL_ROUTES[route].get("fallback")]):
+        if name in MODEL_ROUTES:
+            settings = MODEL_ROUTES[name]
+            plan.append({"route": name, "model": settings["model"],
+                         "max_tokens": max_tokens or settings["max_tokens"], "deadline": settings.get("deadline")})
+    return plan
+
+def get_help_route(prompt="", tab_name=""):
+    """Return the preferred route of contextual help (a dict with "model" and "max_tokens")"""
+    return _route_plan(prompt, None, None, tab_name, "help")[0]
+
+def get_help_model(prompt="", tab_name=""):
+    """Return the model that answers contextual help (help answers are cached per model)"""
+    return get_help_route(prompt, tab_name)["model"]
+
+async def _call_routes(kind, plan, deadline, call_route, progress=None, served=None):
+    """
+    Run a request on its routes in turn until one succeeds
+    
+    Args:
+        kind (str): "chat" or "completion", for telemetry
+        plan (list): Routes from _route_plan
+        deadline (float): time.monotonic() value by which the whole request must end
+        call_route (callable): Takes a route, its deadline and a metrics dict
+            and returns the coroutine of one call on that route
+        progress (dict): For streams; a stream that delivered text never falls back
+        served (dict): Receives the "route" and "model" that answered
+        
+    Returns:
+        The result of the first route that succeeded
+    """
+    for index, route in enumerate(plan):
+        start = time.monotonic()
+        route_deadline = deadline if route["deadline"] is None else min(deadline, start + route["deadline"])
+        metrics = {}
+        outcome = "error"
+        try:
+            result = await _record_call(kind, route["model"], metrics, call_route(route, route_deadline, metrics))
+            outcome = "ok"
+            if served is not None:
+                served.update(route=route["route"], model=route["model"])
+            return result
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except AssistantUnavailableError as e:
+            # Fall back on API failures, timeouts and answers in the wrong format (the
+            # other model may follow the schema). Not while the circuit is open or our
+            # own rate limiter is saturated, where another route only adds queued work,
+            # and never once text was shown.
+            last = index == len(plan) - 1
+            if (last or isinstance(e, (CircuitOpenError, RateLimiterBusyError))
+                    or (progress and progress["started"]) or time.monotonic() >= deadline):
+                raise
+            outcome = "fallback"
+            print(f"Warning: Model route '{route['route']}' failed - {str(e)} Falling back to '{plan[index + 1]['route']}'.")
+        finally:
+            get_telemetry().record_route(route["route"], route["model"], outcome, time.monotonic() - start)
+
+def get_openai_response(prompt, context="", model=None, max_tokens=None, temperature=DEFAULT_TEMPERATURE,
+                        intent=None, tab_name="", served=None):
     """
     Get response from OpenAI API
     
+    The call runs on the shared background event loop with a deadline,
+    retries with backoff on rate limits and server errors, and is refused
+    while the circuit breaker is open. The calling thread waits at most
+    until the deadline. Concurrent identical requests (e.g. many sessions
+    asking for the same help topic) share a single API call, and every API
+    call waits its turn in the process-wide rate limiter. Unless a model is
+    given, the model router picks one and falls back to the other route if
+    the call fails.
+    
     Args:
         prompt (str): The user's query
         context (str): Additional context about what the user is doing
-        model (str): The OpenAI model to use
-        max_tokens (int): Maximum tokens in the response
+        model (str): The OpenAI model to use, or None to let the router choose
+        max_tokens (int): Maximum tokens in the response, or None for the route's default
         temperature (float): Creativity of the response (0.0-1.0)
+        intent (str): What the caller is doing (e.g. "help"), for the router
+        tab_name (str): The tab the request comes from, for the router
+        served (dict): Receives the "route" and "model" that answered, e.g.
+            to cache the answer under the model that actually produced it
         
     Returns:
         str: The model's response text
+        
+    Raises:
+        AssistantUnavailableError: The call failed, timed out or was refused
     """
-    client = initialize_openai_client()
+    runtime = get_openai_runtime()
+    client = runtime["client"]
+    deadline = time.monotonic() + runtime["settings"]["deadline"]
+    messages = _build_messages(prompt, context)
+    plan = _route_plan(prompt, model, max_tokens, tab_name, intent)
+    session_id = get_session_id()
+    
+    def call_route(route, route_deadline, metrics):
+        async def attempt(remaining):
+            response = await asyncio.wait_for(
+                client.chat.completions.create(
+                    model=route["model"],
+                    messages=messages,
+                    max_tokens=route["max_tokens"],
+                    temperature=temperature
+                ),
+                timeout=remaining
+            )
+            text = response.choices[0].message.content
+            _record_usage(metrics, getattr(response, "usage", None), messages, text, route["model"])
+            return text
+        
+        return _call_with_retries(runtime, route_deadline, attempt, session_id=session_id, metrics=metrics)
+    
+    async def call_routes():
+        # Coalesced callers share the result, so the serving route travels with it
+        route = {}
+        text = await _call_routes("completion", plan, deadline, call_route, served=route)
+        return text, route
+    
+    key = _request_key(plan[0]["model"], messages, plan[0]["max_tokens"], temperature)
+    future = runtime["loop"].submit(runtime["singleflight"].do(key, call_routes))
+    _track_inflight(future)
     try:
-        # Load the system prompt
-        system_prompt = load_system_prompt()
-        
-        # Add context to the system prompt if provided
-        if context:
-            system_prompt += f"\n\nCurrent context: {context}"
-        
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt}
-        ]
-        
-        response = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            max_tokens=max_tokens,
-            temperature=temperature
-        )
-        return response.choices[0].message.content
+        # A little slack so the loop reports its own timeout first
+        text, route = future.result(timeout=max(0.0, deadline - time.monotonic()) + 1.0)
+        if served is not None:
+            served.update(route)
+        return text
+    except AssistantUnavailableError:
+        raise
     except Exception as e:
-        return f"Error: {str(e)}"
\ No newline at end of file
+        # Cancelled by a newer request, or the deadline passed
+        raise AssistantUnavailableError(_describe_error(asyncio.TimeoutError()) if not future.cancelled()
+                                        else "The request was cancelled.") from e
+    finally:
+        future.cancel()
+
+async def request_structured_output(runtime, messages, schema_name, schema, intent="batch",
+                                    max_tokens=None, session_id=None, kind="batch", served=None):
+    """
+    Make one structured-output request and parse its JSON
+    
+    A coroutine for the shared event loop, so callers can run several
+    requests with bounded parallelism. The request goes through the model
+    router (with fallback), the rate limiter, retries and the circuit breaker
+    like every other call.
+    
+    Args:
+        runtime (dict): Result of get_openai_runtime
+        messages (list): The messages to send
+        schema_name (str): Name of the JSON schema
+        schema (dict): JSON schema the answer must follow (strict mode)
+        intent (str): Declared intent, for the router
+        max_tokens (int): Maximum tokens in the response, or None for the route's default
+        session_id (str): Session the requests are queued under by the rate limiter
+        kind (str): Kind the call is recorded under in telemetry ("batch" or "review")
+        served (dict): Receives the "route" and "model" that answered
+        
+    Returns:
+        dict: The parsed answer
+        
+    Raises:
+        AssistantUnavailableError: The call failed or did not return valid JSON
+    """
+    client = runtime["client"]
+    if isinstance(client, DummyClient):
+        raise AssistantUnavailableError("The AI service is not configured (OPENAI_API_KEY is missing).")
+    deadline = time.monotonic() + runtime["settings"]["deadline"]
+    plan = _route_plan("", None, max_tokens, "", intent)
+    
+    def call_route(route, route_deadline, metrics):
+        async def attempt(remaining):
+            response = await asyncio.wait_for(
+                client.chat.completions.create(
+                    model=route["model"],
+                    messages=messages,
+                    max_tokens=route["max_tokens"],
+                    temperature=0,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {"name": schema_name, "strict": True, "schema": schema}
+                    }
+                ),
+                timeout=remaining
+            )
+            text = response.choices[0].message.content or ""
+            _record_usage(metrics, getattr(response, "usage", None), messages, text, route["model"])
+            try:
+                return json.loads(text)
+            except ValueError as e:
+                raise InvalidAnswerError("The AI service returned an answer that is not valid JSON.") from e
+        
+        return _call_with_retries(runtime, route_deadline, attempt, session_id=session_id, metrics=metrics)
+    
+    return await _call_routes(kind, plan, deadline, call_route, served=served)
+
+_STREAM_END = object()
+
+def stream_openai_response(prompt, context="", model=None, max_tokens=None, temperature=DEFAULT_TEMPERATURE,
+                           history=None, intent=None, tab_name=""):
+    """
+    Stream a response from OpenAI API as it is generated
+    
+    The stream runs on the shared background event loop. Closing the
+    generator (e.g. when Streamlit stops the script for a new question or a
+    tab switch) cancels the request. A stream that stalls for longer than
+    the idle timeout, or runs past the deadline, is abandoned. Unless a
+    model is given, the model router picks one; a stream that fails before
+    its first text falls back to the other route.
+    
+    Args:
+        prompt (str): The user's query
+        context (str): Additional context about what the user is doing
+        model (str): The OpenAI model to use, or None to let the router choose
+        max_tokens (int): Maximum tokens in the response, or None for the route's default
+        temperature (float): Creativity of the response (0.0-1.0)
+        history (list): Messages sent between the system message and the
+            question, e.g. from build_assistant_history
+        intent (str): What the caller is doing (e.g. "review"), for the router
+        tab_name (str): The tab the request comes from, for the router
+        
+    Yields:
+        str: Text deltas of the model's response, in order
+        
+    Raises:
+        AssistantUnavailableError: The call failed, timed out or was refused
+    """
+    runtime = get_openai_runtime()
+    client = runtime["client"]
+    idle_timeout = runtime["settings"]["idle_timeout"]
+    deadline = time.monotonic() + runtime["settings"]["deadline"]
+    messages = _build_messages(prompt, context, history)
+    plan = _route_plan(prompt, model, max_tokens, tab_name, intent, history)
+    deltas = queue.Queue()
+    progress = {"started": False}
+    session_id = get_session_id()
+    
+    def call_route(route, route_deadline, metrics):
+        async def attempt(remaining):
+            stream = await asyncio.wait_for(
+                client.chat.completions.create(
+                    model=route["model"],
+                    messages=messages,
+                    max_tokens=route["max_tokens"],
+                    temperature=temperature,
+                    stream=True,
+                    stream_options={"include_usage": True}
+                ),
+                timeout=remaining
+            )
+            parts = []
+            usage = None
+            try:
+                chunks = stream.__aiter__()
+                while True:
+                    timeout = min(idle_timeout, route_deadline - time.monotonic())
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), timeout=max(0.0, timeout))
+                    except StopAsyncIteration:
+                        break
+                    # The final chunk carries the usage and no choices
+                    usage = getattr(chunk, "usage", None) or usage
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        if not progress["started"]:
+                            progress["started"] = True
+                            metrics["ttft"] = time.monotonic() - metrics["started_at"]
+                        parts.append(chunk.choices[0].delta.content)
+                        deltas.put_nowait(chunk.choices[0].delta.content)
+            finally:
+                _record_usage(metrics, usage, messages, "".join(parts), route["model"])
+                close = getattr(stream, "close", None) or getattr(stream, "aclose", None)
+                if close is not None:
+                    await close()
+        
+        return _call_with_retries(runtime, route_deadline, attempt, progress, session_id, metrics)
+    
+    async def run():
+        try:
+            await _call_routes("chat", plan, deadline, call_route, progress)
+        finally:
+            deltas.put_nowait(_STREAM_END)
+    
+    future = runtime["loop"].submit(run())
+    _track_inflight(future)
+    try:
+        while True:
+            try:
+                delta = deltas.get(timeout=max(0.0, deadline - time.monotonic()) + 1.0)
+            except queue.Empty:
+                raise AssistantUnavailableError(_describe_error(asyncio.TimeoutError()))
+            if delta is _STREAM_END:
+                break
+            yield delta
+        
+        # Surface the failure, if the stream ended with one
+        error = future.exception(timeout=1.0) if not future.cancelled() else None
+        if error is not None:
+            raise error
+    finally:
+        future.cancel()
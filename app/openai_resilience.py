@@ -0,0 +1,258 @@
+# ============================================================================
+# ARCOS SIG Form Application - OpenAI Resilience
+# ============================================================================
+# This file contains the building blocks that keep slow or failing model calls
+# from tying up Streamlit: a background event loop that runs the async calls,
+# exponential backoff with jitter, a circuit breaker that fails fast while the
+# upstream API is unhealthy, request coalescing and a fair rate limiter.
+# ============================================================================
+
+import asyncio
+import random
+import threading
+import time
+
+class AssistantUnavailableError(Exception):
+    """Raised when the AI Assistant cannot produce an answer"""
+
+class CircuitOpenError(AssistantUnavailableError):
+    """Raised without calling the API while the circuit breaker is open"""
+
+class RateLimiterBusyError(AssistantUnavailableError):
+    """Raised without calling the API when the rate limiter gave no slot before the deadline"""
+
+class InvalidAnswerError(AssistantUnavailableError):
+    """Raised when the API answered, but not in the format that was asked for"""
+
+def is_retryable_error(error):
+    """
+    Return True for errors worth retrying: rate limits, server errors,
+    connection problems and timeouts
+    """
+    # Only reached after a client (and so openai) has been created
+    import openai
+    if isinstance(error, (asyncio.TimeoutError, openai.APIConnectionError, openai.RateLimitError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code >= 500
+    return False
+
+def backoff_delay(attempt, base, cap, error=None):
+    """
+    Delay before the next retry, using exponential backoff with full jitter
+
+    Args:
+        attempt (int): Number of the attempt that just failed (1 for the first)
+        base (float): Delay scale in seconds
+        cap (float): Maximum delay in seconds
+        error (Exception): The failure; a Retry-After header is honoured if present
+
+    Returns:
+        float: Seconds to wait
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+class CircuitBreaker:
+    """
+    Fail fast after repeated upstream failures.
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    are refused for reset_seconds. Then a single trial call is let through
+    (half-open); its success closes the circuit and its failure reopens it.
+    """
+    def __init__(self, failure_threshold, reset_seconds):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self):
+        """'closed', 'open' or 'half-open'"""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return "open"
+            return "half-open"
+
+    def before_call(self):
+        """Raise CircuitOpenError if the call must not reach the API"""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_seconds - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial_in_flight:
+                raise CircuitOpenError(
+                    f"The AI service is temporarily unavailable. Please try again in {max(1, int(remaining))} seconds."
+                )
+            self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """Let another trial through when a half-open trial ended without a verdict (e.g. cancelled)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+class BackgroundEventLoop:
+    """
+    An asyncio event loop running in a daemon thread.
+
+    Streamlit runs each script in a worker thread without an event loop, so
+    the async API calls are scheduled here and the script thread only waits
+    on the returned concurrent.futures.Future, with a deadline.
+    """
+    def __init__(self, name="openai-event-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, coroutine):
+        """
+        Schedule a coroutine on the loop
+
+        Returns:
+            concurrent.futures.Future: Cancelling it cancels the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def call_soon(self, callback, *args):
+        """Run a plain callback on the loop thread"""
+        self.loop.call_soon_threadsafe(callback, *args)
+
+class SingleFlight:
+    """
+    Share one in-flight call among concurrent identical requests.
+
+    Only used from the event loop thread. Each caller awaits the shared call
+    through a shield, so a cancelled caller leaves the others waiting; the
+    shared call is cancelled only when every caller has gone.
+    """
+    def __init__(self, on_call=None):
+        self._calls = {}
+        self.started = 0
+        self.coalesced = 0
+        # Called with "miss" when a call starts and "hit" when one is joined
+        self._on_call = on_call
+
+    async def do(self, key, coroutine_function):
+        """
+        Run coroutine_function() once per key at a time
+
+        Args:
+            key (str): Identifies identical requests
+            coroutine_function (callable): Starts the call when none is in flight
+
+        Returns:
+            The shared call's result (its exception is raised to every caller)
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = {"task": asyncio.ensure_future(coroutine_function()), "waiters": 0}
+            self._calls[key] = call
+            self.started += 1
+            call["task"].add_done_callback(lambda task: self._forget(key, call))
+        else:
+            self.coalesced += 1
+        if self._on_call is not None:
+            self._on_call("hit" if call["waiters"] else "miss")
+
+        call["waiters"] += 1
+        try:
+            return await asyncio.shield(call["task"])
+        finally:
+            call["waiters"] -= 1
+            if call["waiters"] == 0 and not call["task"].done():
+                call["task"].cancel()
+
+    def _forget(self, key, call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+class FairRateLimiter:
+    """
+    A process-wide token bucket that serves waiting sessions in turn.
+
+    Only used from the event loop thread. Requests queue per session and
+    free tokens are handed out round-robin across sessions, so one busy
+    session cannot starve the others.
+    """
+    def __init__(self, requests_per_minute, burst):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1.0, float(burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._queues = {}
+        self._timer = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, session_id):
+        """Wait for a token; callers of the same session are served in order"""
+        if self.rate <= 0:
+            return
+        self._refill()
+        if not self._queues and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(session_id, []).append(waiter)
+        if self._timer is None:
+            self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as the caller gave up: return the token
+                self._tokens = min(self.capacity, self._tokens + 1)
+            else:
+                queue = self._queues.get(session_id, [])
+                if waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._queues[session_id]
+            raise
+
+    def _dispatch(self):
+        """Hand out available tokens round-robin and wait for the next one"""
+        self._timer = None
+        self._refill()
+        while self._queues and self._tokens >= 1:
+            # Serve the session at the front, then move it to the back
+            session_id = next(iter(self._queues))
+            queue = self._queues.pop(session_id)
+            waiter = queue.pop(0)
+            if queue:
+                self._queues[session_id] = queue
+            if not waiter.done():
+                self._tokens -= 1
+                waiter.set_result(None)
+
+        if self._queues and self._timer is None:
+            delay = (1 - self._tokens) / self.rate
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
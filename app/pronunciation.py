@@ -0,0 +1,279 @@
+# ============================================================================
+# ARCOS SIG Form Application - Pronunciation
+# ============================================================================
+# This file contains an offline, rule-based pronunciation generator for the
+# verbiage of trouble locations. Names are respelled the way the SIG examples
+# are written ("Rockford" -> "rok-ferd"): an exception dictionary first, then
+# common place-name endings, then syllabification and spelling-to-sound rules.
+# It needs no network and is fast enough to run on every workbook import.
+# ============================================================================
+
+import re
+import json
+from functools import lru_cache
+from app.config import PRONUNCIATION_EXCEPTIONS_JSON_PATH, PRONUNCIATION_CACHE_SIZE
+
+# Common place-name endings and their respellings, longest first
+SUFFIX_RESPELLINGS = [
+    ("borough", "bur-oh"), ("ington", "ing-tuhn"), ("burgh", "berg"), ("field", "feeld"),
+    ("ville", "vil"), ("shire", "sher"), ("mouth", "muhth"), ("worth", "werth"), ("ridge", "rij"),
+    ("burg", "berg"), ("ford", "ferd"), ("wood", "wud"), ("land", "luhnd"), ("dale", "dayl"),
+    ("view", "vyoo"), ("wick", "wik"), ("port", "port"), ("tion", "shuhn"), ("ton", "tuhn"),
+    ("son", "suhn")
+]
+
+# Abbreviations read differently at the start of a name: "St Charles" is
+# Saint Charles, while "Main St" (in the exception dictionary) is Main Street
+LEADING_RESPELLINGS = {"st": "saynt"}
+
+# Letter names, for short all-capital codes such as "OPC" and words without vowels
+LETTER_NAMES = {
+    "a": "ay", "b": "bee", "c": "see", "d": "dee", "e": "ee", "f": "ef", "g": "jee", "h": "aych",
+    "i": "eye", "j": "jay", "k": "kay", "l": "el", "m": "em", "n": "en", "o": "oh", "p": "pee",
+    "q": "kyoo", "r": "ar", "s": "es", "t": "tee", "u": "yoo", "v": "vee", "w": "dub-uhl-yoo",
+    "x": "eks", "y": "wy", "z": "zee"
+}
+
+# Spellings rewritten before syllabification. Upper-case letters are markers
+# for sounds that must not be split or rewritten again.
+_SPELLING_RULES = [
+    (re.compile(r"^kn"), "n"), (re.compile(r"^wr"), "r"), (re.compile(r"^x"), "z"),
+    (re.compile(r"igh"), "I"), (re.compile(r"tch"), "ch"), (re.compile(r"dge"), "J"),
+    (re.compile(r"ph"), "f"), (re.compile(r"wh"), "w"), (re.compile(r"ck"), "k"),
+    (re.compile(r"qu"), "kw"), (re.compile(r"sch"), "sk"), (re.compile(r"c(?=[eiy])"), "s"),
+    (re.compile(r"c(?!h)"), "k"), (re.compile(r"x"), "ks"), (re.compile(r"gh"), ""), (re.compile(r"gn$"), "n")
+]
+
+# A final 'le' after a consonant ('kittle'), and a silent final 'e' or 'es'
+# after a single consonant that lengthens the vowel before it ('gales')
+_FINAL_LE = re.compile(r"(?<=[^aeiouyl])le$")
+_MAGIC_E = re.compile(r"([aeiouy])([^aeiouy])e(s?)$")
+_SILENT_E = re.compile(r"(?<=[^aeiouy])e$")
+_SILENT_ES = re.compile(r"(?<=[^aeiouysxz])es$")
+
+# Vowel pairs read as one sound
+_VOWEL_DIGRAPHS = {
+    "ee": "ee", "ea": "ee", "ie": "ee", "ei": "ay", "ey": "ay", "ai": "ay", "ay": "ay",
+    "oo": "oo", "ou": "ow", "ow": "ow", "oa": "oh", "oe": "oh", "oi": "oy", "oy": "oy",
+    "au": "aw", "aw": "aw", "ew": "oo", "ue": "oo", "ui": "oo", "eu": "yoo"
+}
+
+_SHORT_VOWELS = {"a": "a", "e": "e", "i": "i", "o": "o", "u": "uh", "y": "i"}
+_LONG_VOWELS = {"a": "ay", "e": "ee", "i": "eye", "o": "oh", "u": "yoo", "y": "eye"}
+_OPEN_VOWELS = {"a": "ay", "e": "ee", "i": "eye", "o": "oh", "u": "oo", "y": "eye"}
+_R_VOWELS = {"a": "ar", "e": "er", "i": "er", "o": "or", "u": "er", "y": "er"}
+
+# Consonant pairs kept together at the start of a syllable
+_ONSET_PAIRS = {"ch", "sh", "th", "bl", "br", "cl", "cr", "dr", "fl", "fr", "gl", "gr",
+                "kl", "kr", "kw", "pl", "pr", "sk", "sl", "sm", "sn", "sp", "st", "sw", "tr", "tw"}
+
+_TOKEN_PATTERN = re.compile(r"[A-Za-z']+|\d+")
+
+_exceptions = None
+
+def load_pronunciation_exceptions():
+    """Load the exception dictionary (lower-case word -> respelling)"""
+    global _exceptions
+    if _exceptions is None:
+        try:
+            with open(PRONUNCIATION_EXCEPTIONS_JSON_PATH, 'r') as file:
+                _exceptions = {word.lower(): respelling for word, respelling in json.load(file).items()}
+        except Exception as e:
+            print(f"Error loading pronunciation exceptions: {str(e)}")
+            _exceptions = {}
+    return _exceptions
+
+def _is_vowel(word, i):
+    if word[i] in "aeiouAEIOUY":
+        return True
+    # 'y' is a vowel except at the start of a syllable
+    return word[i] == "y" and i > 0 and word[i - 1] not in "aeiou"
+
+def _nuclei(word):
+    """Find the vowel sounds of a word as (start, end) spans"""
+    spans = []
+    i = 0
+    while i < len(word):
+        if not _is_vowel(word, i):
+            i += 1
+            continue
+        if word[i:i + 2] in _VOWEL_DIGRAPHS:
+            spans.append((i, i + 2))
+            i += 2
+        else:
+            spans.append((i, i + 1))
+            i += 1
+    return spans
+
+def _split_cluster(cluster):
+    """Split the consonants between two vowels into (coda, onset)"""
+    if len(cluster) <= 1:
+        return "", cluster
+    if cluster[-2:] in _ONSET_PAIRS:
+        coda, onset = cluster[:-2], cluster[-2:]
+    else:
+        coda, onset = cluster[:-1], cluster[-1:]
+    # A doubled consonant is spoken once, at the end of the first syllable
+    if coda and onset.startswith(coda[-1]):
+        onset = onset[1:]
+    return coda, onset
+
+def _respell_vowel(vowel, coda, last, next_is_vowel, multisyllable):
+    """Respell one vowel sound, returning (sound, remaining coda)"""
+    if vowel.isupper():
+        return _LONG_VOWELS[vowel.lower()], coda
+    if vowel in _VOWEL_DIGRAPHS:
+        return _VOWEL_DIGRAPHS[vowel], coda
+    if coda.startswith("r"):
+        return _R_VOWELS[vowel], coda[1:]
+    if coda:
+        # Unstressed final syllables such as '-on', '-en' and '-am' are reduced
+        if last and multisyllable and vowel in "aeo" and coda in ("n", "m", "l"):
+            return "uh", coda
+        return _SHORT_VOWELS[vowel], coda
+    if vowel == "a" and last and multisyllable:
+        return "uh", coda
+    if vowel in "iy" and (next_is_vowel or (last and multisyllable)):
+        return "ee", coda
+    return _OPEN_VOWELS[vowel], coda
+
+def _respell_consonants(letters):
+    """Respell consonants, dropping doubled letters"""
+    letters = re.sub(r"(.)\1", r"\1", letters)
+    return letters.replace("J", "j")
+
+def _syllables(word):
+    """Respell a word with no known ending as a list of syllables"""
+    # The syllable of a final 'le' takes the consonant before it if that is
+    # single ('maple' -> 'may-puhl'), otherwise it stands alone ('kittle' -> 'kit-uhl')
+    tail = []
+    if len(_nuclei(word)) > 1:
+        if _FINAL_LE.search(word):
+            word = word[:-2]
+            if len(word) > 1 and _is_vowel(word, len(word) - 2):
+                word, tail = word[:-1], [_respell_consonants(word[-1]) + "uhl"]
+            else:
+                tail = ["uhl"]
+        else:
+            match = _MAGIC_E.search(word)
+            if match and not (match.start() > 0 and word[match.start() - 1] in "aeiou"):
+                word = word[:match.start()] + match.group(1).upper() + match.group(2) + match.group(3)
+            else:
+                word = _SILENT_ES.sub("s", _SILENT_E.sub("", word))
+
+    spans = _nuclei(word)
+    if not spans:
+        return [_respell_consonants(word)] + tail
+
+    syllables = []
+    onset = word[:spans[0][0]]
+    for index, (start, end) in enumerate(spans):
+        last = index == len(spans) - 1
+        following = word[end:spans[index + 1][0]] if not last else word[end:]
+        coda, next_onset = (following, "") if last else _split_cluster(following)
+        sound, coda = _respell_vowel(word[start:end], coda, last, not last and not following, len(spans) > 1)
+        # Written 'eye' on its own ('eye-dah-hoh') but 'y' after a consonant ('hy-luhnd')
+        if sound == "eye" and onset:
+            sound = "y"
+        syllables.append(_respell_consonants(onset) + sound + _respell_consonants(coda))
+        onset = next_onset
+    return syllables + tail
+
+def _join_syllables(syllables):
+    """Join syllables, moving the 's' of a final 'ks' onto a following consonant ('paks-tuhn' -> 'pak-stuhn')"""
+    syllables = [s for s in syllables if s]
+    for i in range(len(syllables) - 1):
+        if syllables[i].endswith("ks") and syllables[i + 1][:1] in ("t", "p", "k", "w", "l", "m", "n"):
+            syllables[i] = syllables[i][:-1]
+            syllables[i + 1] = "s" + syllables[i + 1]
+    return "-".join(syllables)
+
+def _respell_letters(letters):
+    """Respell a lower-case word by its ending and spelling rules, as a list of syllables"""
+    for ending, respelling in SUFFIX_RESPELLINGS:
+        stem = letters[:-len(ending)]
+        if letters.endswith(ending) and stem and any(_is_vowel(stem, i) for i in range(len(stem))):
+            return _respell_letters(stem) + respelling.split("-")
+
+    for pattern, replacement in _SPELLING_RULES:
+        letters = pattern.sub(replacement, letters)
+    return _syllables(letters)
+
+@lru_cache(maxsize=PRONUNCIATION_CACHE_SIZE)
+def respell_word(word):
+    """
+    Respell one word of a name
+
+    Args:
+        word (str): A word without spaces, e.g. "Rockford" or "OPC"
+
+    Returns:
+        str: The respelling, e.g. "rok-ferd"; numbers are returned unchanged
+    """
+    if word.isdigit():
+        return word
+    exceptions = load_pronunciation_exceptions()
+    lower = word.lower().replace("'", "")
+    if lower in exceptions:
+        return exceptions[lower]
+    # Short all-capital codes, and words without a vowel ("Xr"), are read letter by letter
+    nuclei = _nuclei(lower)
+    if (word.isupper() and 2 <= len(word) <= 4 and len(nuclei) < 2) or not nuclei:
+        return "-".join(LETTER_NAMES[letter] for letter in lower if letter in LETTER_NAMES)
+
+    prefix = []
+    if lower.startswith("mc") and len(lower) > 3:
+        prefix, lower = ["muhk"], lower[2:]
+    elif word.lower().startswith("o'") and len(lower) > 2:
+        prefix, lower = ["oh"], lower[1:]
+
+    return _join_syllables(prefix + _respell_letters(lower))
+
+@lru_cache(maxsize=PRONUNCIATION_CACHE_SIZE)
+def suggest_pronunciation(name):
+    """
+    Suggest the pronunciation verbiage of a trouble location
+
+    Args:
+        name (str): The location name, e.g. "Paxton Sub 12"
+
+    Returns:
+        str: The respelling, e.g. "pak-stuhn sub-stay-shuhn 12", or an empty
+        string if the name has no words
+    """
+    tokens = _TOKEN_PATTERN.findall(name.strip())
+    words = [respell_word(token) for token in tokens]
+    if len(tokens) > 1 and tokens[0].lower() in LEADING_RESPELLINGS:
+        words[0] = LEADING_RESPELLINGS[tokens[0].lower()]
+    return " ".join(words)
+
+def fill_pronunciations(rows, overwrite=False):
+    """
+    Fill the verbiage of every trouble location that needs a recording
+
+    Each distinct name is respelled once, then the rows are updated in a
+    single pass.
+
+    Args:
+        rows (list): Trouble location rows ("recording_needed", "location", "verbiage")
+        overwrite (bool): Replace verbiage that is already filled in
+
+    Returns:
+        tuple: (new list of rows, indices of the rows that changed)
+    """
+    wanted = [
+        index for index, row in enumerate(rows)
+        if row.get("recording_needed") and str(row.get("location", "")).strip()
+        and (overwrite or not str(row.get("verbiage", "")).strip())
+    ]
+    respellings = {name: suggest_pronunciation(name)
+                   for name in dict.fromkeys(str(rows[index]["location"]).strip() for index in wanted)}
+
+    updated_rows = list(rows)
+    changed = []
+    for index in wanted:
+        verbiage = respellings[str(rows[index]["location"]).strip()]
+        if verbiage and verbiage != rows[index].get("verbiage"):
+            updated_rows[index] = dict(rows[index], verbiage=verbiage)
+            changed.append(index)
+    return updated_rows, changed
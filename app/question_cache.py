@@ -0,0 +1,279 @@
+# ============================================================================
+# ARCOS SIG Form Application - Similar Question Cache
+# ============================================================================
+# This file contains an in-memory cache of answers to free-form questions.
+# Questions that differ only by casing, punctuation, contractions, plurals or
+# word order ("what is CTT?" / "What's CTT") are normalized to the same key;
+# other near-duplicates are found with MinHash signatures and locality-
+# sensitive hashing, so no embedding service is needed.
+# ============================================================================
+
+import re
+import time
+import random
+import hashlib
+import threading
+from collections import OrderedDict
+from app.retrieval import tokenize
+from app.config import (
+    QUESTION_CACHE_MIN_SIMILARITY, QUESTION_CACHE_LSH_BANDS, QUESTION_CACHE_LSH_ROWS,
+    QUESTION_CACHE_TTL_SECONDS, QUESTION_CACHE_MAX_ENTRIES
+)
+
+# Contractions expanded before tokenizing, so "what's" and "what is" match
+CONTRACTIONS = [
+    (re.compile(r"\bcan't\b"), "can not"),
+    (re.compile(r"\bwon't\b"), "will not"),
+    (re.compile(r"n't\b"), " not"),
+    (re.compile(r"'s\b"), " is"),
+    (re.compile(r"'re\b"), " are"),
+    (re.compile(r"'ll\b"), " will"),
+    (re.compile(r"'ve\b"), " have"),
+    (re.compile(r"'d\b"), " would"),
+    (re.compile(r"'m\b"), " am")
+]
+
+# Filler words ignored when comparing questions. Unlike the retrieval
+# stopwords, interrogatives and verbs are kept: "what is CTT?" and "how do I
+# set up CTT?" are different questions.
+QUESTION_STOPWORDS = frozenset("""
+a an the of to in on at by for from with about and or as
+i me my we our you your it its this that these those there their
+please arcos
+""".split())
+
+# Words that change a question's meaning however similar the rest is
+NEGATIONS = frozenset(["not", "no", "never", "without", "except"])
+
+# Mersenne prime modulus of the MinHash permutations
+_PRIME = (1 << 61) - 1
+
+def normalize_question(question):
+    """
+    Reduce a question to its meaningful words
+
+    Args:
+        question (str): The question as typed
+
+    Returns:
+        list: Sorted, de-duplicated lowercase word tokens without QUESTION_STOPWORDS
+    """
+    text = question.lower().replace("’", "'")
+    for pattern, replacement in CONTRACTIONS:
+        text = pattern.sub(replacement, text)
+    return sorted(set(tokenize(text, QUESTION_STOPWORDS)))
+
+def question_shingles(tokens):
+    """
+    Return the features compared between two questions
+
+    Each word contributes itself and its character trigrams, so small typos
+    and word forms ("configure" / "configuring") still overlap.
+
+    Args:
+        tokens (list): Tokens from normalize_question
+
+    Returns:
+        frozenset: The question's shingles
+    """
+    shingles = set()
+    for token in tokens:
+        shingles.add(token)
+        padded = f"^{token}$"
+        shingles.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(shingles)
+
+def _guard_words(tokens):
+    """Numbers and negations, which must be identical for two questions to match"""
+    return frozenset(token for token in tokens if token.isdigit() or token in NEGATIONS)
+
+def jaccard(a, b):
+    """Jaccard similarity of two sets (1.0 for two empty sets)"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+class MinHasher:
+    """
+    MinHash signatures of shingle sets.
+
+    Two signatures agree at each position with probability equal to the
+    Jaccard similarity of their sets. The permutations are seeded, so
+    signatures are comparable across instances.
+    """
+    def __init__(self, num_perm, seed=1):
+        rng = random.Random(seed)
+        self.permutations = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, shingles):
+        """
+        Compute the signature of a set of shingles
+
+        Returns:
+            tuple: num_perm minimum hash values
+        """
+        if not shingles:
+            return tuple([_PRIME] * len(self.permutations))
+        hashes = [int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+                  for shingle in shingles]
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self.permutations)
+
+def question_scope(tab_name, context=""):
+    """
+    Build the scope a cached answer can be reused in
+
+    Args:
+        tab_name (str): The tab the question was asked on
+        context (str): Anything else the answer depends on, e.g. the tab's form data summary
+
+    Returns:
+        str: The scope key
+    """
+    return tab_name + "\x1f" + hashlib.sha256(context.encode("utf-8")).hexdigest()
+
+class QuestionCache:
+    """
+    A size-bounded, expiring cache of answers to free-form questions.
+
+    Answers are stored per scope (see question_scope). A lookup first tries
+    the question's normalized form, then the LSH buckets of its MinHash
+    signature; candidates are confirmed by the exact Jaccard similarity of
+    the two questions' shingles and by identical numbers and negations.
+    Entries older than ttl_seconds are misses, and the least recently used
+    entries are evicted beyond max_entries.
+    """
+    def __init__(self, min_similarity=QUESTION_CACHE_MIN_SIMILARITY, bands=QUESTION_CACHE_LSH_BANDS,
+                 rows=QUESTION_CACHE_LSH_ROWS, ttl_seconds=QUESTION_CACHE_TTL_SECONDS,
+                 max_entries=QUESTION_CACHE_MAX_ENTRIES):
+        self.min_similarity = min_similarity
+        self.bands = bands
+        self.rows = rows
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._hasher = MinHasher(bands * rows)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._exact = {}
+        self._buckets = {}
+        self._next_id = 0
+        self.counts = {"exact": 0, "similar": 0, "miss": 0}
+
+    def _band_keys(self, scope, signature):
+        return [(scope, band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def _remove(self, entry_id):
+        entry = self._entries.pop(entry_id)
+        if self._exact.get(entry["exact_key"]) == entry_id:
+            del self._exact[entry["exact_key"]]
+        for key in entry["band_keys"]:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _expired(self, entry, now):
+        return now - entry["created_at"] > self.ttl_seconds
+
+    def get(self, question, scope):
+        """
+        Look up the answer to a question or a near-duplicate of it
+
+        Args:
+            question (str): The question as typed
+            scope (str): Key from question_scope
+
+        Returns:
+            dict: "answer", "question" (the cached question) and "similarity",
+            or None on a miss
+        """
+        tokens = normalize_question(question)
+        if not tokens:
+            return None
+        now = time.time()
+        with self._lock:
+            # Same words after normalization
+            entry_id = self._exact.get((scope, tuple(tokens)))
+            match, similarity, kind = None, 0.0, "miss"
+            if entry_id is not None and not self._expired(self._entries[entry_id], now):
+                match, similarity, kind = entry_id, 1.0, "exact"
+            else:
+                # Near-duplicates sharing at least one LSH band
+                shingles = question_shingles(tokens)
+                guard = _guard_words(tokens)
+                candidates = set()
+                for key in self._band_keys(scope, self._hasher.signature(shingles)):
+                    candidates.update(self._buckets.get(key, ()))
+                for candidate in candidates:
+                    entry = self._entries[candidate]
+                    if self._expired(entry, now) or entry["guard"] != guard:
+                        continue
+                    score = jaccard(shingles, entry["shingles"])
+                    if score >= self.min_similarity and score > similarity:
+                        match, similarity, kind = candidate, score, "similar"
+
+            self.counts[kind] += 1
+            if match is None:
+                return None
+            self._entries.move_to_end(match)
+            entry = self._entries[match]
+            entry["hits"] += 1
+            return {"answer": entry["answer"], "question": entry["question"], "similarity": similarity}
+
+    def set(self, question, scope, answer):
+        """
+        Store the answer to a question
+
+        Args:
+            question (str): The question as typed
+            scope (str): Key from question_scope
+            answer (str): The answer to reuse
+        """
+        tokens = normalize_question(question)
+        if not tokens:
+            return
+        shingles = question_shingles(tokens)
+        signature = self._hasher.signature(shingles)
+        now = time.time()
+        with self._lock:
+            exact_key = (scope, tuple(tokens))
+            if exact_key in self._exact:
+                self._remove(self._exact[exact_key])
+            entry_id = self._next_id
+            self._next_id += 1
+            entry = {
+                "question": question, "answer": answer, "exact_key": exact_key, "shingles": shingles,
+                "guard": _guard_words(tokens), "band_keys": self._band_keys(scope, signature),
+                "created_at": now, "hits": 0
+            }
+            self._entries[entry_id] = entry
+            self._exact[exact_key] = entry_id
+            for key in entry["band_keys"]:
+                self._buckets.setdefault(key, set()).add(entry_id)
+
+            # Expired entries first, then the least recently used
+            for old_id in [i for i, e in self._entries.items() if self._expired(e, now)]:
+                self._remove(old_id)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def stats(self):
+        """
+        Return the cache size and lookup counts
+
+        Returns:
+            dict: "entries", "exact" and "similar" (hits by kind), "miss" and "hit_rate"
+        """
+        with self._lock:
+            stats = dict(self.counts, entries=len(self._entries))
+        lookups = stats["exact"] + stats["similar"] + stats["miss"]
+        stats["hit_rate"] = (stats["exact"] + stats["similar"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Remove every answer and reset the counts"""
+        with self._lock:
+            self._entries.clear()
+            self._exact.clear()
+            self._buckets.clear()
+            self.counts = {"exact": 0, "similar": 0, "miss": 0}
@@ -0,0 +1,197 @@
+# ============================================================================
+# ARCOS SIG Form Application - Retrieval Index
+# ============================================================================
+# This file contains a local BM25 index over the SIG descriptions, the SIG
+# structure questions and the callout reasons catalog. The best matching
+# snippets ground the assistant's prompts, and questions the guide answers
+# outright can be answered from the index without calling the model.
+# ============================================================================
+
+import math
+import re
+from collections import Counter
+from app.config import (
+    RETRIEVAL_TOP_K, RETRIEVAL_MIN_SCORE, RETRIEVAL_LOCAL_ANSWER_MIN_CONFIDENCE
+)
+
+# Common words that carry no meaning for matching
+STOPWORDS = frozenset("""
+a about an and are as at be by can do does for from how i if in is it its me my
+of on or should the their there these this to was what when where which who why
+will with you your we our need know arcos tab set up
+""".split())
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+def _stem(token):
+    """Reduce simple plurals ('codes', 'zones') to their singular form"""
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+def tokenize(text, stopwords=STOPWORDS):
+    """Split text into lowercase, singular word tokens without stopwords"""
+    return [_stem(token) for token in _TOKEN_PATTERN.findall(text.lower()) if token not in stopwords]
+
+def build_sig_documents(descriptions, structure, callout_reasons):
+    """
+    Turn the SIG reference data into retrievable documents
+
+    Args:
+        descriptions (dict): Contents of sig_descriptions.json
+        structure (dict): Contents of sig_structure.json
+        callout_reasons (list): Contents of callout_reasons.json
+
+    Returns:
+        list: Documents with "id", "tab", "title", "text" and "answerable"
+        (False for question lists, which ground prompts but answer nothing)
+    """
+    documents = []
+
+    for tab_name, tab_desc in descriptions.items():
+        documents.append({
+            "id": f"description:{tab_name}",
+            "tab": tab_name,
+            "title": tab_name,
+            "text": tab_desc.get("description", ""),
+            "answerable": True
+        })
+        for field_name, field_info in tab_desc.get("fields", {}).items():
+            parts = [field_info.get("description", "")]
+            if field_info.get("example"):
+                parts.append(f"Example: {field_info['example']}")
+            if field_info.get("best_practices"):
+                parts.append(f"Best practices: {field_info['best_practices']}")
+            documents.append({
+                "id": f"field:{tab_name}:{field_name}",
+                "tab": tab_name,
+                "title": f"{tab_name} - {field_name}",
+                "text": "\n".join(parts),
+                "answerable": True
+            })
+
+    for tab_name, tab_structure in structure.items():
+        for section in tab_structure.get("sections", []):
+            questions = "\n".join(f"- {q}" for q in section.get("questions", []))
+            documents.append({
+                "id": f"section:{tab_name}:{section.get('name', '')}",
+                "tab": tab_name,
+                "title": f"{tab_name} - {section.get('name', '')} (questions to answer)",
+                "text": f"{section.get('description', '')}\nQuestions to answer:\n{questions}",
+                "answerable": False
+            })
+
+    for reason in callout_reasons:
+        label = reason.get("Callout Reason Drop-Down Label", "")
+        if label:
+            documents.append({
+                "id": f"callout_reason:{reason.get('ID', '')}",
+                "tab": "Callout Reasons",
+                "title": f"Callout reason {reason.get('ID', '')}",
+                "text": f"Callout reason {reason.get('ID', '')} is '{label}' (verbiage: {reason.get('Verbiage', '') or 'n/a'}).",
+                "answerable": True
+            })
+
+    return documents
+
+class BM25Index:
+    """
+    An in-memory Okapi BM25 index.
+
+    The index is built once; searching only touches the postings of the
+    query terms, so a lookup costs far less than a model call.
+    """
+    def __init__(self, documents, k1=1.5, b=0.75):
+        self.documents = documents
+        self.k1 = k1
+        self.b = b
+
+        # Index the title with the text so field names match strongly
+        self._postings = {}
+        self._lengths = []
+        for doc_index, document in enumerate(documents):
+            term_counts = Counter(tokenize(f"{document['title']} {document['text']}"))
+            self._lengths.append(sum(term_counts.values()))
+            for term, count in term_counts.items():
+                self._postings.setdefault(term, []).append((doc_index, count))
+
+        count = len(documents)
+        self._average_length = (sum(self._lengths) / count) if count else 0.0
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+        self._unknown_idf = math.log(1 + (count + 0.5) / 0.5)
+
+    def search(self, query, k=RETRIEVAL_TOP_K):
+        """
+        Find the documents that best match a query
+
+        Args:
+            query (str): The question
+            k (int): Number of results
+
+        Returns:
+            list: Up to k results, best first, each a dict with "document",
+            "score" and "confidence". Confidence (0.0-1.0) is the IDF-weighted
+            share of the query terms that the document contains.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.documents:
+            return []
+        # Terms the guide never mentions weigh as much as the rarest known term
+        query_weight = sum(self._idf.get(term, self._unknown_idf) for term in terms)
+
+        scores = {}
+        matched_weight = {}
+        for term in terms:
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for doc_index, count in self._postings[term]:
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_index] / self._average_length)
+                scores[doc_index] = scores.get(doc_index, 0.0) + idf * count * (self.k1 + 1) / (count + norm)
+                matched_weight[doc_index] = matched_weight.get(doc_index, 0.0) + idf
+
+        best = sorted(scores, key=scores.get, reverse=True)[:k]
+        return [{
+            "document": self.documents[doc_index],
+            "score": scores[doc_index],
+            "confidence": matched_weight[doc_index] / query_weight
+        } for doc_index in best if scores[doc_index] >= RETRIEVAL_MIN_SCORE]
+
+def format_snippets(results):
+    """
+    Format search results as prompt context
+
+    Returns:
+        str: One titled excerpt per result, or an empty string if there are none
+    """
+    if not results:
+        return ""
+    excerpts = [f"[{r['document']['title']}]\n{r['document']['text']}" for r in results]
+    return "Relevant excerpts from the ARCOS SIG guide:\n\n" + "\n\n".join(excerpts)
+
+def find_local_answer(results):
+    """
+    Answer from the index when the best match is confident enough
+
+    Args:
+        results (list): Results of BM25Index.search for the question
+
+    Returns:
+        str: A Markdown answer quoting the guide, or None if the model is needed
+    """
+    results = [r for r in results if r["document"]["answerable"]]
+    if not results or results[0]["confidence"] < RETRIEVAL_LOCAL_ANSWER_MIN_CONFIDENCE:
+        return None
+    # A near tie means the question spans several topics; let the model combine them
+    if len(results) > 1 and results[1]["score"] >= 0.9 * results[0]["score"]:
+        return None
+    document = results[0]["document"]
+    return f"**{document['title']}** (from the SIG guide)\n\n{document['text']}"
+
+def build_sig_index():
+    """Build the BM25 index over the SIG reference data files"""
+    from app.helpers import load_sig_descriptions, load_sig_structure, load_callout_reasons
+    return BM25Index(build_sig_documents(load_sig_descriptions(), load_sig_structure(), load_callout_reasons()))
@@ -7,6 +7,7 @@
 
 import streamlit as st
 from app.config import DEFAULT_CALLOUT_TYPES, DEFAULT_CALLOUT_REASONS
+from app.chat_history import ChatHistory
 
 def initialize_session_state():
     """Initialize session state variables if they don't exist"""
@@ -15,7 +16,7 @@ def initialize_session_state():
         st.session_state.responses = {}
     
     if 'chat_history' not in st.session_state:
-        st.session_state.chat_history = []
+        st.session_state.chat_history = ChatHistory()
     
     if 'current_tab' not in st.session_state:
         st.session_state.current_tab = "Location Hierarchy"
@@ -23,30 +24,7 @@ def initialize_session_state():
     # Location hierarchy data
     if 'hierarchy_data' not in st.session_state:
         # Initialize with some sample data, now including callout types and reasons
-        st.session_state.hierarchy_data = {
-            "levels": ["Level 1", "Level 2", "Level 3", "Level 4"],
-            "labels": ["Parent Company", "Business Unit", "Division", "OpCenter"],
-            "entries": [
-                {
-                    "level1": "", 
-                    "level2": "", 
-                    "level3": "", 
-                    "level4": "", 
-                    "timezone": "", 
-                    "codes": ["", "", "", "", ""],
-                    "callout_types": {
-                        "Normal": False,
-                        "All Hands on Deck": False,
-                        "Fill Shift": False,
-                        "Travel": False,
-                        "Notification": False,
-                        "Notification (No Response)": False
-                    },
-                    "callout_reasons": ""
-                }
-            ],
-            "timezone": "ET / CT / MT / PT"
-        }
+        st.session_state.hierarchy_data = initialize_default_hierarchy_data()
     
     # Ensure all hierarchy entries have callout_types and callout_reasons fields
     if 'hierarchy_data' in st.session_state:
@@ -72,9 +50,7 @@ def initialize_session_state():
         
     # Job classifications
     if 'job_classifications' not in st.session_state:
-        st.session_state.job_classifications = [
-            {"type": "", "title": "", "ids": ["", "", "", "", ""], "recording": ""}
-        ]
+        st.session_state.job_classifications = initialize_default_job_classifications()
         
     # Event types
     if 'event_types' not in st.session_state:
@@ -82,9 +58,46 @@ def initialize_session_state():
         
     # Trouble locations
     if 'trouble_locations' not in st.session_state:
-        st.session_state.trouble_locations = [
-            {"recording_needed": True, "id": "", "location": "", "verbiage": ""}
-        ]
+        st.session_state.trouble_locations = initialize_default_trouble_locations()
+
+def initialize_default_hierarchy_data():
+    """Initialize the default location hierarchy with one empty entry"""
+    return {
+        "levels": ["Level 1", "Level 2", "Level 3", "Level 4"],
+        "labels": ["Parent Company", "Business Unit", "Division", "OpCenter"],
+        "entries": [
+            {
+                "level1": "", 
+                "level2": "", 
+                "level3": "", 
+                "level4": "", 
+                "timezone": "", 
+                "codes": ["", "", "", "", ""],
+                "callout_types": {
+                    "Normal": False,
+                    "All Hands on Deck": False,
+                    "Fill Shift": False,
+                    "Travel": False,
+                    "Notification": False,
+                    "Notification (No Response)": False
+                },
+                "callout_reasons": ""
+            }
+        ],
+        "timezone": "ET / CT / MT / PT"
+    }
+
+def initialize_default_job_classifications():
+    """Initialize the default job classifications with one empty row"""
+    return [
+        {"type": "", "title": "", "ids": ["", "", "", "", ""], "recording": ""}
+    ]
+
+def initialize_default_trouble_locations():
+    """Initialize the default trouble locations with one empty row"""
+    return [
+        {"recording_needed": True, "id": "", "location": "", "verbiage": ""}
+    ]
 
 def initialize_default_event_types():
     """Initialize default event types for the application"""
@@ -0,0 +1,342 @@
+# ============================================================================
+# ARCOS SIG Form Application - SIG Review
+# ============================================================================
+# This file contains the "Review my SIG" feature. The export tables are
+# serialized compactly and reviewed by the AI Assistant in one structured-
+# output request (or a few, for large SIGs) that returns findings per tab.
+# Findings are cached by a hash of the reviewed data and shown inline on
+# each tab.
+# ============================================================================
+
+import json
+import time
+import asyncio
+import hashlib
+import concurrent.futures
+import streamlit as st
+from app.openai_client import get_openai_runtime, get_session_id, request_structured_output
+from app.openai_resilience import AssistantUnavailableError
+from app.exporters.arrow_exporter import collect_table_rows
+from app.assistant_context import RESPONSE_KEY_PREFIXES, count_tokens
+from app.help_cache import HelpCache
+from app.sig_state import SIGState
+from app.config import (
+    TAB_NAMES, MODEL_ROUTES, SIG_REVIEW_CACHE_PATH, SIG_REVIEW_CACHE_TTL_SECONDS, SIG_REVIEW_CACHE_MAX_ENTRIES,
+    SIG_REVIEW_CHUNK_TOKENS, SIG_REVIEW_MAX_CONCURRENCY, SIG_REVIEW_MAX_TOKENS,
+    SIG_REVIEW_MAX_FINDINGS_PER_TAB, SIG_REVIEW_MAX_MESSAGE_LENGTH
+)
+
+# Tab each export table belongs to (other responses are assigned by key prefix)
+REVIEW_TABLE_TABS = {
+    "location_hierarchy": "Location Hierarchy",
+    "co_type_matrix": "Location Hierarchy",
+    "reasons_matrix": "Location Hierarchy",
+    "trouble_locations": "Trouble Locations",
+    "job_classifications": "Job Classifications",
+    "callout_reasons": "Callout Reasons",
+    "event_types": "Event Types",
+    "callout_type_configs": "Callout Type Configuration"
+}
+
+REVIEW_SEVERITIES = ["error", "warning", "suggestion"]
+
+REVIEW_INSTRUCTIONS = (
+    "You review ARCOS System Implementation Guide (SIG) forms before they are handed to the ARCOS "
+    "implementation team. The user message is the SIG data as JSON: each tab maps table names to "
+    "their columns and rows. Report problems that would block or complicate the implementation: "
+    "missing or inconsistent values, duplicates, contradictions between tabs, values in the wrong "
+    "format and settings that look unintended. Each finding names its tab, a severity (error, warning "
+    "or suggestion), the row or setting it is about and a short, actionable message. Report nothing "
+    "for tabs without problems; do not repeat the data back."
+)
+
+# JSON schema of the answer to one review request
+REVIEW_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "findings": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "tab": {"type": "string", "enum": TAB_NAMES},
+                    "severity": {"type": "string", "enum": REVIEW_SEVERITIES},
+                    "item": {"type": "string"},
+                    "message": {"type": "string"}
+                },
+                "required": ["tab", "severity", "item", "message"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["findings"],
+    "additionalProperties": False
+}
+
+@st.cache_resource(show_spinner=False)
+def get_review_cache():
+    """
+    Return the SIG review cache shared by every session of this server process
+
+    Returns:
+        HelpCache: Findings (as JSON) keyed by review_cache_key
+    """
+    return HelpCache(path=SIG_REVIEW_CACHE_PATH, ttl_seconds=SIG_REVIEW_CACHE_TTL_SECONDS,
+                     max_entries=SIG_REVIEW_CACHE_MAX_ENTRIES)
+
+def _response_tab(key):
+    """Return the tab a response key belongs to, or None"""
+    for tab_name, prefix in RESPONSE_KEY_PREFIXES.items():
+        if key.startswith(prefix):
+            return tab_name
+    return next((tab_name for tab_name in TAB_NAMES if key.startswith(f"{tab_name}_")), None)
+
+def build_review_snapshot(state=None):
+    """
+    Collect the SIG data to review, grouped by tab
+
+    Tables are the export tables, stored as a column list and a list of row
+    values. Callout reasons are limited to those in use.
+
+    Args:
+        state (SIGState): Data to review; defaults to the session state
+
+    Returns:
+        dict: Tab name mapped to {table name: {"columns": [...], "rows": [[...], ...]}}
+    """
+    if state is None:
+        state = SIGState.from_session_state()
+    tables = collect_table_rows(state)
+    tables["callout_reasons"] = [row for row in tables["callout_reasons"] if row["use"]]
+
+    snapshot = {}
+    for table_name, rows in tables.items():
+        if table_name == "other_responses":
+            continue
+        if rows:
+            columns = list(rows[0])
+            snapshot.setdefault(REVIEW_TABLE_TABS[table_name], {})[table_name] = {
+                "columns": columns, "rows": [[row[column] for column in columns] for row in rows]
+            }
+
+    # Option tabs keep their answers in the responses
+    for key, value in state.responses.items():
+        tab_name = _response_tab(key)
+        if tab_name is None or not value or key.startswith(("matrix_", "reason_")):
+            continue
+        prefix = RESPONSE_KEY_PREFIXES.get(tab_name, f"{tab_name}_")
+        table = snapshot.setdefault(tab_name, {}).setdefault("responses", {"columns": ["setting", "value"], "rows": []})
+        table["rows"].append([key[len(prefix):].replace("_", " "), str(value)])
+    return snapshot
+
+def serialize_review_snapshot(snapshot):
+    """Serialize a review snapshot as compact JSON, in a stable key order"""
+    return json.dumps(snapshot, sort_keys=True, separators=(",", ":"), default=str)
+
+def _review_model():
+    """The model reviews are asked of (the large route's)"""
+    return MODEL_ROUTES.get("large", {}).get("model", "")
+
+def review_cache_key(snapshot):
+    """
+    Build the cache key of the findings for a snapshot
+
+    The key also covers the instructions and the model, so findings are
+    requested again when either changes.
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    raw = "\x1f".join([_review_model(), REVIEW_INSTRUCTIONS, serialize_review_snapshot(snapshot)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def chunk_review_snapshot(snapshot, max_tokens=SIG_REVIEW_CHUNK_TOKENS):
+    """
+    Split a snapshot into parts of at most about max_tokens tokens
+
+    Tabs are kept together while they fit; a table too large for one part
+    is split between rows, and each part repeats the table's columns.
+
+    Args:
+        snapshot (dict): Result of build_review_snapshot
+        max_tokens (int): Token budget of one part
+
+    Returns:
+        list: Snapshots, each in the format of build_review_snapshot
+    """
+    chunks = [{}]
+    used = 0
+    for tab_name in sorted(snapshot):
+        for table_name, table in sorted(snapshot[tab_name].items()):
+            header_tokens = count_tokens(json.dumps([tab_name, table_name, table["columns"]]))
+            for row in table["rows"]:
+                row_tokens = count_tokens(json.dumps(row, separators=(",", ":"), default=str))
+                target = chunks[-1].get(tab_name, {}).get(table_name)
+                needed = row_tokens + (0 if target is not None else header_tokens)
+                if used and used + needed > max_tokens:
+                    chunks.append({})
+                    used, target, needed = 0, None, row_tokens + header_tokens
+                if target is None:
+                    target = chunks[-1].setdefault(tab_name, {})[table_name] = {"columns": table["columns"], "rows": []}
+                target["rows"].append(row)
+                used += needed
+    return [chunk for chunk in chunks if chunk]
+
+def validate_review_findings(data):
+    """
+    Check the answer to one review request
+
+    Args:
+        data (dict): The parsed answer
+
+    Returns:
+        list: Findings ({"tab", "severity", "item", "message"}) with a known
+        tab and severity and a non-empty message; messages are shortened to
+        SIG_REVIEW_MAX_MESSAGE_LENGTH characters
+    """
+    findings = []
+    items = data.get("findings") if isinstance(data, dict) else None
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict) or item.get("tab") not in TAB_NAMES or item.get("severity") not in REVIEW_SEVERITIES:
+            continue
+        message = item.get("message")
+        if not isinstance(message, str) or not message.strip():
+            continue
+        findings.append({
+            "tab": item["tab"],
+            "severity": item["severity"],
+            "item": str(item.get("item") or "").strip()[:SIG_REVIEW_MAX_MESSAGE_LENGTH],
+            "message": message.strip()[:SIG_REVIEW_MAX_MESSAGE_LENGTH]
+        })
+    return findings
+
+def group_review_findings(findings):
+    """
+    Group findings by tab, most severe first
+
+    Returns:
+        dict: Tab name mapped to at most SIG_REVIEW_MAX_FINDINGS_PER_TAB findings
+    """
+    grouped = {}
+    for finding in sorted(findings, key=lambda f: REVIEW_SEVERITIES.index(f["severity"])):
+        tab_findings = grouped.setdefault(finding["tab"], [])
+        if len(tab_findings) < SIG_REVIEW_MAX_FINDINGS_PER_TAB and finding not in tab_findings:
+            tab_findings.append(finding)
+    return grouped
+
+async def _review_chunks(runtime, chunks, session_id, progress):
+    semaphore = asyncio.Semaphore(SIG_REVIEW_MAX_CONCURRENCY)
+    findings, errors, models = [], [], set()
+
+    async def review_chunk(index, chunk):
+        part = f" This is part {index + 1} of {len(chunks)} of the SIG." if len(chunks) > 1 else ""
+        messages = [
+            {"role": "system", "content": REVIEW_INSTRUCTIONS + part},
+            {"role": "user", "content": serialize_review_snapshot(chunk)}
+        ]
+        async with semaphore:
+            served = {}
+            try:
+                data = await request_structured_output(
+                    runtime, messages, "sig_review", REVIEW_SCHEMA, intent="review",
+                    max_tokens=SIG_REVIEW_MAX_TOKENS, session_id=session_id, kind="review", served=served
+                )
+                findings.extend(validate_review_findings(data))
+                models.add(served["model"])
+            except AssistantUnavailableError as e:
+                errors.append(str(e))
+            finally:
+                progress["done"] += 1
+
+    await asyncio.gather(*[review_chunk(index, chunk) for index, chunk in enumerate(chunks)])
+    return findings, errors, models
+
+def review_sig(snapshot, cache=None, on_progress=None, session_id=None):
+    """
+    Review a SIG snapshot, using cached findings when the data has not changed
+
+    Findings are cached only when every request succeeded and was answered
+    by the large model, which the cache key names.
+
+    Args:
+        snapshot (dict): Result of build_review_snapshot
+        cache (HelpCache): Cache of findings; defaults to the process-wide review cache
+        on_progress (callable): Called with (requests done, requests in total)
+        session_id (str): Session the requests are queued under by the rate
+            limiter; defaults to the calling session
+
+    Returns:
+        dict: "key" (review_cache_key), "findings" (grouped by tab), "errors"
+        (messages from failed requests), "requests" (requests sent, 0 when
+        cached) and "reviewed_at" (time.time() of the review)
+    """
+    cache = cache if cache is not None else get_review_cache()
+    key = review_cache_key(snapshot)
+    cached = cache.get(key)
+    if cached is not None:
+        return dict(json.loads(cached), key=key, requests=0)
+
+    chunks = chunk_review_snapshot(snapshot)
+    if not chunks:
+        # Nothing filled in yet, so nothing to review
+        return {"findings": {}, "errors": [], "reviewed_at": time.time(), "key": key, "requests": 0}
+    runtime = get_openai_runtime()
+    progress = {"done": 0}
+    future = runtime["loop"].submit(_review_chunks(runtime, chunks, session_id or get_session_id(), progress))
+    try:
+        while True:
+            try:
+                findings, errors, models = future.result(timeout=0.25)
+                break
+            except concurrent.futures.TimeoutError:
+                if on_progress is not None:
+                    on_progress(progress["done"], len(chunks))
+    finally:
+        future.cancel()
+
+    result = {"findings": group_review_findings(findings), "errors": errors, "reviewed_at": time.time()}
+    # The key names the large model; findings a fallback model produced are not cached under it
+    if not errors and models == {_review_model()}:
+        cache.set(key, json.dumps(result), topic="sig_review", model=_review_model())
+    return dict(result, key=key, requests=len(chunks))
+
+def render_sig_review_button():
+    """Render the "Review my SIG" button and run the review when it is clicked"""
+    if st.button("Review my SIG", help="Check the whole form for problems in one AI Assistant request"):
+        snapshot = build_review_snapshot()
+        progress_bar = st.progress(0.0, text="Reviewing the SIG...")
+        try:
+            st.session_state.sig_review = review_sig(
+                snapshot,
+                on_progress=lambda done, total: progress_bar.progress(done / total, text=f"{done} of {total} parts reviewed")
+            )
+        except AssistantUnavailableError as e:
+            st.session_state.sig_review = {"findings": {}, "errors": [str(e)], "key": None, "requests": 0}
+        progress_bar.empty()
+
+    review = st.session_state.get("sig_review")
+    if review is not None:
+        count = sum(len(findings) for findings in review["findings"].values())
+        if review["errors"]:
+            st.warning(f"The review is incomplete: {review['errors'][0]}")
+        st.caption(f"Review: {count} finding(s) on {len(review['findings'])} tab(s)"
+                   + (" (cached)" if review["requests"] == 0 and review["key"] else ""))
+
+def render_review_findings(tab_name):
+    """
+    Render the findings of the last SIG review for a tab
+
+    Args:
+        tab_name (str): The tab being shown
+    """
+    review = st.session_state.get("sig_review")
+    if review is None or not review["findings"].get(tab_name):
+        return
+
+    findings = review["findings"][tab_name]
+    with st.expander(f"SIG review: {len(findings)} finding(s) on this tab", expanded=True):
+        if review["key"] != review_cache_key(build_review_snapshot()):
+            st.caption("The SIG has changed since this review.")
+        for finding in findings:
+            text = f"**{finding['item']}**: {finding['message']}" if finding["item"] else finding["message"]
+            {"error": st.error, "warning": st.warning}.get(finding["severity"], st.info)(text)
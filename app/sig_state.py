@@ -0,0 +1,98 @@
+# ============================================================================
+# ARCOS SIG Form Application - SIG State
+# ============================================================================
+# This file contains a plain container for the SIG data that the exporters
+# work on. It can be built from the Streamlit session state or loaded from a
+# saved JSON state file, so exports also run without Streamlit.
+# ============================================================================
+
+import json
+from app.session_manager import (
+    initialize_default_hierarchy_data, initialize_default_job_classifications,
+    initialize_default_trouble_locations, initialize_default_event_types
+)
+
+# Session state keys that make up a saved SIG
+SIG_STATE_KEYS = [
+    "hierarchy_data",
+    "job_classifications",
+    "trouble_locations",
+    "event_types",
+    "callout_type_configs",
+    "selected_callout_reasons",
+    "default_callout_reason",
+    "responses",
+    "sig_baseline"
+]
+
+class SIGState:
+    """
+    The SIG data used by the exporters, independent of Streamlit.
+
+    Attributes mirror the session state keys in SIG_STATE_KEYS.
+    selected_callout_reasons is None when the Callout Reasons tab has never
+    been visited, and sig_baseline is None when no baseline has been set.
+    """
+    def __init__(self, hierarchy_data=None, job_classifications=None, trouble_locations=None,
+                 event_types=None, callout_type_configs=None, selected_callout_reasons=None,
+                 default_callout_reason="", responses=None, sig_baseline=None):
+        self.hierarchy_data = hierarchy_data if hierarchy_data is not None else initialize_default_hierarchy_data()
+        self.job_classifications = job_classifications if job_classifications is not None else initialize_default_job_classifications()
+        self.trouble_locations = trouble_locations if trouble_locations is not None else initialize_default_trouble_locations()
+        self.event_types = event_types if event_types is not None else initialize_default_event_types()
+        self.callout_type_configs = callout_type_configs if callout_type_configs is not None else []
+        self.selected_callout_reasons = selected_callout_reasons
+        self.default_callout_reason = default_callout_reason or ""
+        self.responses = responses if responses is not None else {}
+        self.sig_baseline = sig_baseline
+
+    @classmethod
+    def from_session_state(cls):
+        """
+        Build a state object referencing the current Streamlit session state
+
+        Returns:
+            SIGState: State sharing (not copying) the session state values
+        """
+        import streamlit as st
+        return cls(**{key: st.session_state[key] for key in SIG_STATE_KEYS if key in st.session_state})
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a state object from a dictionary of session state values
+
+        Args:
+            data (dict): Values keyed by the names in SIG_STATE_KEYS; unknown keys are ignored
+
+        Returns:
+            SIGState: The new state object
+        """
+        return cls(**{key: data[key] for key in SIG_STATE_KEYS if key in data})
+
+    def to_dict(self):
+        """Return the state as a JSON-serializable dictionary"""
+        return {key: getattr(self, key) for key in SIG_STATE_KEYS}
+
+    def to_json(self):
+        """Serialize the state to a JSON string"""
+        return json.dumps(self.to_dict(), indent=2)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a state object from a saved JSON state file
+
+        Args:
+            path (str): Path of the JSON file written by save or to_json
+
+        Returns:
+            SIGState: The loaded state object
+        """
+        with open(path, 'r') as file:
+            return cls.from_dict(json.load(file))
+
+    def save(self, path):
+        """Save the state to a JSON state file"""
+        with open(path, 'w') as file:
+            file.write(self.to_json())
@@ -2,31 +2,55 @@
 # ARCOS SIG Form Application - Tabs Package
 # ============================================================================
 # This file initializes the tabs package for the ARCOS SIG Form application.
-# It imports and exports all tab-specific modules.
+# It holds the registry of tab modules. A tab module (and what it imports,
+# e.g. pandas) is imported the first time its tab is rendered, so a rerun
+# only loads the tabs the user has actually opened.
 # ============================================================================
 
-# Import tab modules
-from app.tabs.location_hierarchy import render_form as location_hierarchy
-from app.tabs.trouble_locations import render_form as trouble_locations
-from app.tabs.job_classifications import render_form as job_classifications
-from app.tabs.callout_reasons import render_form as callout_reasons
-from app.tabs.event_types import render_form as event_types
-from app.tabs.callout_type_config import render_form as callout_type_config
-from app.tabs.global_config import render_form as global_config
-from app.tabs.data_interfaces import render_form as data_interfaces
-from app.tabs.additions import render_form as additions
-from app.tabs.generic_tab import render_form as generic_tab
-
-# Export all tab modules
+import importlib
+
+# Module rendering each tab; other tabs use the generic form renderer
+TAB_MODULES = {
+    "Location Hierarchy": "app.tabs.location_hierarchy",
+    "Trouble Locations": "app.tabs.trouble_locations",
+    "Job Classifications": "app.tabs.job_classifications",
+    "Callout Reasons": "app.tabs.callout_reasons",
+    "Event Types": "app.tabs.event_types",
+    "Callout Type Configuration": "app.tabs.callout_type_config",
+    "Global Configuration Options": "app.tabs.global_config",
+    "Data and Interfaces": "app.tabs.data_interfaces",
+    "Additions": "app.tabs.additions"
+}
+GENERIC_TAB_MODULE = "app.tabs.generic_tab"
+
+def get_tab_renderer(tab_name):
+    """
+    Return the function that renders a tab, importing its module on first use
+
+    Args:
+        tab_name (str): The tab to render
+
+    Returns:
+        callable: A function without arguments that renders the tab
+    """
+    module_name = TAB_MODULES.get(tab_name)
+    if module_name is None:
+        generic_form = importlib.import_module(GENERIC_TAB_MODULE).render_form
+        return lambda: generic_form(tab_name)
+    return importlib.import_module(module_name).render_form
+
+def render_tab(tab_name):
+    """
+    Render a tab of the SIG form
+
+    Args:
+        tab_name (str): The tab to render
+    """
+    get_tab_renderer(tab_name)()
+
+# Export the registry
 __all__ = [
-    'location_hierarchy',
-    'trouble_locations',
-    'job_classifications',
-    'callout_reasons',
-    'event_types',
-    'callout_type_config',
-    'global_config',
-    'data_interfaces',
-    'additions',
-    'generic_tab'
-]
\ No newline at end of file
+    'TAB_MODULES',
+    'get_tab_renderer',
+    'render_tab'
+]
@@ -7,8 +7,19 @@
 
 import streamlit as st
 from app.styles import styled_header
+from app.helpers import set_response, render_batch_edit_toggle, option_section
 from app.ai_assistant import get_contextual_help
 
+# Topics offered by the "Need Help?" section, and the tab name sent with them
+HELP_TAB_NAME = "Additions"
+HELP_TOPICS = [
+    "Closest to the Trouble",
+    "Qualifications",
+    "J/A Rules",
+    "Email Alerts Configuration",
+    "Vacation Management"
+]
+
 def render_form():
     """Render the Additions form with interactive elements"""
     styled_header("Additions", "tab")
@@ -22,6 +33,9 @@ def render_form():
         Please provide your preferences for each section based on your operational needs.
         """)
     
+    # Batched editing groups each section into a form with one Save button
+    batched = render_batch_edit_toggle("additions")
+    
     # Create tabs for different sections
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "CTT Configuration", 
@@ -31,33 +45,29 @@ def render_form():
         "Vacation Management"
     ])
     
-    with tab1:
+    with tab1, option_section("additions_ctt_configuration", batched):
         render_ctt_configuration()
         
-    with tab2:
+    with tab2, option_section("additions_qualifications", batched):
         render_qualifications()
         
-    with tab3:
+    with tab3, option_section("additions_ja_rule_usage", batched):
         render_ja_rule_usage()
         
-    with tab4:
+    with tab4, option_section("additions_email_alerts", batched):
         render_email_alerts()
         
-    with tab5:
+    with tab5, option_section("additions_vacation_management", batched):
         render_vacation_management()
     
     # Help section
     st.markdown("<hr>", unsafe_allow_html=True)
     styled_header("Need Help?", "section")
     
-    help_topic = st.selectbox(
-        "Select topic for help",
-        ["Closest to the Trouble", "Qualifications", "J/A Rules", 
-         "Email Alerts Configuration", "Vacation Management"]
-    )
+    help_topic = st.selectbox("Select topic for help", HELP_TOPICS)
     
     if st.button("Get Help"):
-        help_response = get_contextual_help(help_topic, "Additions")
+        help_response = get_contextual_help(help_topic, HELP_TAB_NAME)
         st.info(help_response)
 
 def render_ctt_configuration():
@@ -81,7 +91,7 @@ def render_ctt_configuration():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Truck_In_Garage"] = truck_in_garage
+    set_response("Additions_Truck_In_Garage", truck_in_garage)
     
     # CTT sort base
     st.markdown("### Location Basis")
@@ -95,7 +105,7 @@ def render_ctt_configuration():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_CTT_Sort_Base"] = ctt_sort_base
+    set_response("Additions_CTT_Sort_Base", ctt_sort_base)
     
     # CTT method
     st.markdown("### Distance Calculation")
@@ -109,7 +119,7 @@ def render_ctt_configuration():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_CTT_Method"] = ctt_method
+    set_response("Additions_CTT_Method", ctt_method)
     
     # Additional CTT options
     st.markdown("### Additional CTT Options")
@@ -123,7 +133,7 @@ def render_ctt_configuration():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_CTT_Options"] = ", ".join(ctt_options)
+    set_response("Additions_CTT_Options", ", ".join(ctt_options))
 
 def render_qualifications():
     """Render the qualifications section"""
@@ -146,7 +156,7 @@ def render_qualifications():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Qual_Version"] = qual_version
+    set_response("Additions_Qual_Version", qual_version)
     
     # Callout types with qualifications
     st.markdown("### Callout Types Using Qualifications")
@@ -164,7 +174,7 @@ def render_qualifications():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Qual_Callout_Types"] = ", ".join(qual_callout_types)
+    set_response("Additions_Qual_Callout_Types", ", ".join(qual_callout_types))
     
     # Extended attributes
     st.markdown("### Qualification Attributes")
@@ -177,7 +187,7 @@ def render_qualifications():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Need_Extended"] = "Yes" if need_extended else "No"
+    set_response("Additions_Need_Extended", "Yes" if need_extended else "No")
     
     if need_extended:
         extended_attrs = st.text_area(
@@ -188,7 +198,7 @@ def render_qualifications():
         )
         
         # Store in session state
-        st.session_state.responses["Additions_Extended_Attrs"] = extended_attrs
+        set_response("Additions_Extended_Attrs", extended_attrs)
 
 def render_ja_rule_usage():
     """Render the Journeyman/Apprentice rule usage section"""
@@ -211,7 +221,7 @@ def render_ja_rule_usage():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_JA_Requirements"] = ja_requirements
+    set_response("Additions_JA_Requirements", ja_requirements)
     
     if ja_requirements == "Custom ratio":
         custom_ratio = st.text_input(
@@ -221,7 +231,7 @@ def render_ja_rule_usage():
         )
         
         # Store in session state
-        st.session_state.responses["Additions_Custom_Ratio"] = custom_ratio
+        set_response("Additions_Custom_Ratio", custom_ratio)
     
     # Apprentice limitations
     st.markdown("### Apprentice Limitations")
@@ -234,7 +244,7 @@ def render_ja_rule_usage():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_One_Apprentice"] = "Yes" if one_apprentice else "No"
+    set_response("Additions_One_Apprentice", "Yes" if one_apprentice else "No")
     
     single_unavailable = st.checkbox(
         "For single-person callouts, should Apprentices be unavailable?",
@@ -244,7 +254,7 @@ def render_ja_rule_usage():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Single_Unavailable"] = "Yes" if single_unavailable else "No"
+    set_response("Additions_Single_Unavailable", "Yes" if single_unavailable else "No")
     
     # Additional J/A rules
     st.markdown("### Additional J/A Rules")
@@ -258,7 +268,7 @@ def render_ja_rule_usage():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Additional_JA_Rules"] = additional_ja_rules
+    set_response("Additions_Additional_JA_Rules", additional_ja_rules)
 
 def render_email_alerts():
     """Render the email alerts section"""
@@ -281,7 +291,7 @@ def render_email_alerts():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Email_Alerts"] = email_alerts
+    set_response("Additions_Email_Alerts", email_alerts)
     
     if email_alerts == "Yes":
         # Alert events
@@ -296,7 +306,7 @@ def render_email_alerts():
         )
         
         # Store in session state
-        st.session_state.responses["Additions_Alert_Events"] = ", ".join(alert_events)
+        set_response("Additions_Alert_Events", ", ".join(alert_events))
         
         # Alert recipients
         st.markdown("### Alert Recipients")
@@ -317,7 +327,7 @@ def render_email_alerts():
         
         # Store in session state as a formatted string
         recipients_str = "; ".join([f"{event}: {', '.join(recips)}" for event, recips in recipients.items()])
-        st.session_state.responses["Additions_Alert_Recipients"] = recipients_str
+        set_response("Additions_Alert_Recipients", recipients_str)
 
 def render_vacation_management():
     """Render the vacation management section"""
@@ -340,7 +350,7 @@ def render_vacation_management():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_VLG_Config"] = vlg_config
+    set_response("Additions_VLG_Config", vlg_config)
     
     # Vacation award
     st.markdown("### Vacation Time Awarding")
@@ -354,7 +364,7 @@ def render_vacation_management():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Award_Basis"] = award_basis
+    set_response("Additions_Award_Basis", award_basis)
     
     # Availability rules
     st.markdown("### Minimum Availability Requirements")
@@ -373,7 +383,7 @@ def render_vacation_management():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Min_Available"] = f"{min_available}%"
+    set_response("Additions_Min_Available", f"{min_available}%")
     
     # Additional vacation settings
     st.markdown("### Additional Vacation Settings")
@@ -387,4 +397,4 @@ def render_vacation_management():
     )
     
     # Store in session state
-    st.session_state.responses["Additions_Vacation_Settings"] = ", ".join(vacation_settings)
\ No newline at end of file
+    set_response("Additions_Vacation_Settings", ", ".join(vacation_settings))
\ No newline at end of file
@@ -59,25 +59,9 @@ def render_form():
                     st.rerun()
     
     # Apply filters
-    filtered_reasons = callout_reasons.copy()  # Create a copy to avoid modifying the original
-    
-    if search_term:
-        search_term = search_term.lower().strip()  # Normalize and clean the search term
-        
-        # Create a new filtered list based on search term
-        filtered_reasons = []
-        for reason in callout_reasons:
-            # Convert values to strings to avoid type errors
-            reason_id = str(reason.get("ID", "")).lower()
-            reason_label = str(reason.get("Callout Reason Drop-Down Label", "")).lower()
-            
-            # Check if search term appears in either ID or label
-            if search_term in reason_id or search_term in reason_label:
-                filtered_reasons.append(reason)
-    
-    # Apply selected-only filter
-    if show_selected_only:
-        filtered_reasons = [r for r in filtered_reasons if r.get("ID") in st.session_state.selected_callout_reasons]
+    filtered_reasons = filter_callout_reasons(
+        callout_reasons, search_term, show_selected_only, st.session_state.selected_callout_reasons
+    )
     
     # 2. Results count and pagination in separate container
     pagination_container = st.container()
@@ -124,6 +108,41 @@ def render_form():
     # 4. Preview section in separate container
     render_selected_reasons_preview(callout_reasons)
 
+def filter_callout_reasons(callout_reasons, search_term, show_selected_only, selected_reasons):
+    """
+    Filter the callout reasons by search term and selection
+    
+    Args:
+        callout_reasons (list): The full callout reasons catalog
+        search_term (str): Text to match against the reason ID or label
+        show_selected_only (bool): Keep only the selected reasons
+        selected_reasons (list): IDs of the selected reasons
+        
+    Returns:
+        list: The reasons that pass the filters
+    """
+    filtered_reasons = callout_reasons.copy()  # Create a copy to avoid modifying the original
+    
+    if search_term:
+        search_term = search_term.lower().strip()  # Normalize and clean the search term
+        
+        # Create a new filtered list based on search term
+        filtered_reasons = []
+        for reason in callout_reasons:
+            # Convert values to strings to avoid type errors
+            reason_id = str(reason.get("ID", "")).lower()
+            reason_label = str(reason.get("Callout Reason Drop-Down Label", "")).lower()
+            
+            # Check if search term appears in either ID or label
+            if search_term in reason_id or search_term in reason_label:
+                filtered_reasons.append(reason)
+    
+    # Apply selected-only filter
+    if show_selected_only:
+        filtered_reasons = [r for r in filtered_reasons if r.get("ID") in selected_reasons]
+    
+    return filtered_reasons
+
 def render_paginated_reasons(filtered_reasons, items_per_page, total_reasons):
     """Render the paginated list of callout reasons"""
     results_container = st.container()
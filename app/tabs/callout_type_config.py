@@ -6,10 +6,19 @@
 # ============================================================================
 
 import streamlit as st
-import pandas as pd
 from app.styles import styled_header
 from app.ai_assistant import get_contextual_help
 
+# Topics offered by the "Need Help?" section, and the tab name sent with them
+HELP_TAB_NAME = "Callout Type Configuration"
+HELP_TOPICS = [
+    "Callout Types",
+    "Callout Attributes",
+    "Overlap Configuration",
+    "Exception Overrides",
+    "Best Practices"
+]
+
 def render_form():
     """Render the Callout Type Configuration form with interactive elements"""
     styled_header("Callout Type Configuration", "tab")
@@ -47,13 +56,10 @@ def render_form():
     st.markdown("<hr>", unsafe_allow_html=True)
     styled_header("Need Help?", "section")
     
-    help_topic = st.selectbox(
-        "Select topic for help",
-        ["Callout Types", "Callout Attributes", "Overlap Configuration", "Exception Overrides", "Best Practices"]
-    )
+    help_topic = st.selectbox("Select topic for help", HELP_TOPICS)
     
     if st.button("Get Help"):
-        help_response = get_contextual_help(help_topic, "Callout Type Configuration")
+        help_response = get_contextual_help(help_topic, HELP_TAB_NAME)
         st.info(help_response)
 
 def render_basic_configuration():
@@ -8,8 +8,19 @@
 
 import streamlit as st
 from app.styles import styled_header
+from app.helpers import set_response, render_batch_edit_toggle, option_section
 from app.ai_assistant import get_contextual_help
 
+# Topics offered by the "Need Help?" section, and the tab name sent with them
+HELP_TAB_NAME = "Data and Interfaces"
+HELP_TOPICS = [
+    "Employee Data Elements",
+    "Web Traffic Requirements",
+    "HR Interface",
+    "Overtime Tracking",
+    "Contact Devices Configuration"
+]
+
 def render_form():
     """Render the Data and Interfaces form with interactive elements"""
     styled_header("Data and Interfaces", "tab")
@@ -24,6 +35,9 @@ def render_form():
         are established correctly before your ARCOS implementation.
         """)
     
+    # Batched editing groups each section into a form with one Save button
+    batched = render_batch_edit_toggle("data_interfaces")
+    
     # Create tabs for different sections
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "Employee Data", 
@@ -33,33 +47,29 @@ def render_form():
         "Contact Devices"
     ])
     
-    with tab1:
+    with tab1, option_section("data_interfaces_employee_data", batched):
         render_employee_data()
         
-    with tab2:
+    with tab2, option_section("data_interfaces_web_traffic", batched):
         render_web_traffic()
         
-    with tab3:
+    with tab3, option_section("data_interfaces_hr_interface", batched):
         render_hr_interface()
         
-    with tab4:
+    with tab4, option_section("data_interfaces_overtime_interface", batched):
         render_overtime_interface()
         
-    with tab5:
+    with tab5, option_section("data_interfaces_contact_devices", batched):
         render_contact_devices()
     
     # Help section
     st.markdown("<hr>", unsafe_allow_html=True)
     styled_header("Need Help?", "section")
     
-    help_topic = st.selectbox(
-        "Select topic for help",
-        ["Employee Data Elements", "Web Traffic Requirements", 
-         "HR Interface", "Overtime Tracking", "Contact Devices Configuration"]
-    )
+    help_topic = st.selectbox("Select topic for help", HELP_TOPICS)
     
     if st.button("Get Help"):
-        help_response = get_contextual_help(help_topic, "Data and Interfaces")
+        help_response = get_contextual_help(help_topic, HELP_TAB_NAME)
         st.info(help_response)
 
 def render_employee_data():
@@ -85,7 +95,7 @@ def render_employee_data():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Required_Elements"] = ", ".join(selected_required)
+    set_response("Data_Interfaces_Required_Elements", ", ".join(selected_required))
     
     # Optional data elements
     st.markdown("### Optional Data Elements")
@@ -98,7 +108,7 @@ def render_employee_data():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Optional_Elements"] = ", ".join(selected_optional)
+    set_response("Data_Interfaces_Optional_Elements", ", ".join(selected_optional))
     
     # Employee ID configuration
     st.markdown("### Employee ID Configuration")
@@ -111,7 +121,7 @@ def render_employee_data():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Leading_Zeros"] = leading_zeros
+    set_response("Data_Interfaces_Leading_Zeros", leading_zeros)
     
     id_format = st.radio(
         "Is the employee ID fixed or variable length?",
@@ -121,7 +131,7 @@ def render_employee_data():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_ID_Format"] = id_format
+    set_response("Data_Interfaces_ID_Format", id_format)
     
     if id_format == "Fixed Length":
         id_length = st.number_input(
@@ -134,7 +144,7 @@ def render_employee_data():
         )
         
         # Store in session state
-        st.session_state.responses["Data_Interfaces_ID_Length"] = str(id_length)
+        set_response("Data_Interfaces_ID_Length", str(id_length))
     
     # Personally Identifiable Information
     st.markdown("### Personally Identifiable Information (PII)")
@@ -147,7 +157,7 @@ def render_employee_data():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_PII_Elements"] = ", ".join(pii_elements)
+    set_response("Data_Interfaces_PII_Elements", ", ".join(pii_elements))
 
 def render_web_traffic():
     """Render the web traffic interface section"""
@@ -187,7 +197,7 @@ def render_web_traffic():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Network_Restrictions"] = network_restrictions
+    set_response("Data_Interfaces_Network_Restrictions", network_restrictions)
     
     if network_restrictions == "Yes":
         restriction_details = st.text_area(
@@ -198,7 +208,7 @@ def render_web_traffic():
         )
         
         # Store in session state
-        st.session_state.responses["Data_Interfaces_Restriction_Details"] = restriction_details
+        set_response("Data_Interfaces_Restriction_Details", restriction_details)
     
     # Security requirements
     st.markdown("### Security Requirements")
@@ -211,7 +221,7 @@ def render_web_traffic():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Security_Requirements"] = ", ".join(security_requirements)
+    set_response("Data_Interfaces_Security_Requirements", ", ".join(security_requirements))
 
 def render_hr_interface():
     """Render the HR interface section"""
@@ -233,7 +243,7 @@ def render_hr_interface():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Initial_Load"] = initial_load
+    set_response("Data_Interfaces_Initial_Load", initial_load)
     
     if initial_load == "Other":
         other_load = st.text_input(
@@ -243,7 +253,7 @@ def render_hr_interface():
         )
         
         # Store in session state
-        st.session_state.responses["Data_Interfaces_Other_Load"] = other_load
+        set_response("Data_Interfaces_Other_Load", other_load)
     
     # Update method
     st.markdown("### Ongoing Updates")
@@ -256,7 +266,7 @@ def render_hr_interface():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Update_Method"] = update_method
+    set_response("Data_Interfaces_Update_Method", update_method)
     
     if update_method in ["Automated Electronic Updates", "Hybrid Approach"]:
         update_frequency = st.selectbox(
@@ -267,7 +277,7 @@ def render_hr_interface():
         )
         
         # Store in session state
-        st.session_state.responses["Data_Interfaces_Update_Frequency"] = update_frequency
+        set_response("Data_Interfaces_Update_Frequency", update_frequency)
     
     # Fields not to overwrite
     st.markdown("### Update Protection")
@@ -280,7 +290,7 @@ def render_hr_interface():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Protected_Fields"] = ", ".join(protected_fields)
+    set_response("Data_Interfaces_Protected_Fields", ", ".join(protected_fields))
 
 def render_overtime_interface():
     """Render the overtime interface section"""
@@ -302,7 +312,7 @@ def render_overtime_interface():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_OT_Update_Method"] = ot_update_method
+    set_response("Data_Interfaces_OT_Update_Method", ot_update_method)
     
     if ot_update_method in ["Electronically", "Both"]:
         ot_loading = st.radio(
@@ -313,7 +323,7 @@ def render_overtime_interface():
         )
         
         # Store in session state
-        st.session_state.responses["Data_Interfaces_OT_Loading"] = ot_loading
+        set_response("Data_Interfaces_OT_Loading", ot_loading)
         
         ot_frequency = st.selectbox(
             "How frequently will overtime hours be updated?",
@@ -323,7 +333,7 @@ def render_overtime_interface():
         )
         
         # Store in session state
-        st.session_state.responses["Data_Interfaces_OT_Frequency"] = ot_frequency
+        set_response("Data_Interfaces_OT_Frequency", ot_frequency)
     
     # Required fields
     if ot_update_method in ["Manually", "Both"]:
@@ -337,7 +347,7 @@ def render_overtime_interface():
         )
         
         # Store in session state
-        st.session_state.responses["Data_Interfaces_Manual_OT_Fields"] = ", ".join(manual_ot_fields)
+        set_response("Data_Interfaces_Manual_OT_Fields", ", ".join(manual_ot_fields))
     
     # Multiple paycodes
     st.markdown("### Paycode Configuration")
@@ -350,7 +360,7 @@ def render_overtime_interface():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Multiple_Paycodes"] = "Yes" if multiple_paycodes else "No"
+    set_response("Data_Interfaces_Multiple_Paycodes", "Yes" if multiple_paycodes else "No")
     
     if multiple_paycodes:
         paycode_list = st.text_area(
@@ -361,7 +371,7 @@ def render_overtime_interface():
         )
         
         # Store in session state
-        st.session_state.responses["Data_Interfaces_Paycode_List"] = paycode_list
+        set_response("Data_Interfaces_Paycode_List", paycode_list)
 
 def render_contact_devices():
     """Render the contact devices section"""
@@ -384,7 +394,7 @@ def render_contact_devices():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Require_Standby"] = require_standby
+    set_response("Data_Interfaces_Require_Standby", require_standby)
     
     # Number of devices
     st.markdown("### Device Limits")
@@ -399,7 +409,7 @@ def render_contact_devices():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Max_Contact_Devices"] = str(max_devices)
+    set_response("Data_Interfaces_Max_Contact_Devices", str(max_devices))
     
     # Temporary contact info
     st.markdown("### Temporary Contact Information")
@@ -412,7 +422,7 @@ def render_contact_devices():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Temp_Contact_Method"] = temp_contact_method
+    set_response("Data_Interfaces_Temp_Contact_Method", temp_contact_method)
     
     temp_duration = st.selectbox(
         "Maximum duration for temporary contact information",
@@ -422,7 +432,7 @@ def render_contact_devices():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Temp_Duration"] = temp_duration
+    set_response("Data_Interfaces_Temp_Duration", temp_duration)
     
     # Device verification
     st.markdown("### Device Verification")
@@ -435,4 +445,4 @@ def render_contact_devices():
     )
     
     # Store in session state
-    st.session_state.responses["Data_Interfaces_Verification_Method"] = verification_method
\ No newline at end of file
+    set_response("Data_Interfaces_Verification_Method", verification_method)
\ No newline at end of file
@@ -7,9 +7,19 @@
 
 import streamlit as st
 from app.styles import styled_header
+from app.helpers import fragment
 from datetime import datetime
 from app.ai_assistant import get_contextual_help
 
+# Topics offered by the "Need Help?" section, and the tab name sent with them
+HELP_TAB_NAME = "Event Types"
+HELP_TOPICS = [
+    "Event Types",
+    "Schedule Exceptions",
+    "Override Configuration",
+    "Mobile Configuration"
+]
+
 def render_form():
     """Render the Event Types form with interactive elements matching the Excel format"""
     styled_header("Event Types", "tab")
@@ -112,141 +122,7 @@ def render_form():
         
         # Create each row for event types
         for i, event in enumerate(filtered_events):
-            # Event row
-            event_cols = st.columns([2, 1, 1, 3, 3, 3, 3, 2, 2, 2, 2, 2, 2])
-            
-            with event_cols[0]:
-                # Description
-                event["description"] = st.text_input(
-                    "Description", 
-                    value=event["description"], 
-                    key=f"event_desc_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[1]:
-                # Use checkbox
-                event["use"] = st.checkbox(
-                    "Use", 
-                    value=event["use"], 
-                    key=f"event_use_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[2]:
-                # Use in dropdown checkbox
-                event["use_in_dropdown"] = st.checkbox(
-                    "Use in Dropdown", 
-                    value=event["use_in_dropdown"], 
-                    key=f"event_dropdown_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[3]:
-                # Override checkbox
-                event["include_in_override"] = st.checkbox(
-                    "Include in Override", 
-                    value=event["include_in_override"], 
-                    key=f"event_override_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[4]:
-                # Charged or excused selection for non-accept
-                event["charged_or_excused"] = st.selectbox(
-                    "Charged or Excused", 
-                    ["", "Charged", "Excused"], 
-                    index=0 if not event["charged_or_excused"] else 
-                          (1 if event["charged_or_excused"] == "Charged" else 2),
-                    key=f"event_charge1_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[5]:
-                # Charged or excused selection for skipped
-                event["employee_on_exception"] = st.selectbox(
-                    "Charged or Excused", 
-                    ["", "Charged", "Excused"], 
-                    index=0 if not event["employee_on_exception"] else 
-                          (1 if event["employee_on_exception"] == "Charged" else 2),
-                    key=f"event_charge2_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[6]:
-                # Can place on inbound selection
-                event["available_on_inbound"] = st.selectbox(
-                    "Available on Inbound", 
-                    ["", "Yes", "No"], 
-                    index=0 if not event["available_on_inbound"] else 
-                          (1 if event["available_on_inbound"] == "Yes" else 2),
-                    key=f"event_inbound_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[7]:
-                # Release via mobile
-                event["release_mobile"] = st.checkbox(
-                    "Release via Mobile", 
-                    value=event["release_mobile"], 
-                    key=f"event_release_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[8]:
-                # Auto rest status
-                event["release_auto"] = st.checkbox(
-                    "Auto Rest", 
-                    value=event["release_auto"], 
-                    key=f"event_auto_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[9]:
-                # Make unavailable
-                event["make_unavailable"] = st.checkbox(
-                    "Make Unavailable", 
-                    value=event["make_unavailable"], 
-                    key=f"event_unavail_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[10]:
-                # Place on status
-                event["place_status"] = st.checkbox(
-                    "Place Status", 
-                    value=event["place_status"], 
-                    key=f"event_status_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[11]:
-                # Min duration
-                event["min_duration"] = st.text_input(
-                    "Min Duration", 
-                    value=event["min_duration"], 
-                    key=f"event_min_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with event_cols[12]:
-                # Max duration
-                event["max_duration"] = st.text_input(
-                    "Max Duration", 
-                    value=event["max_duration"], 
-                    key=f"event_max_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            # Add remove button for this event type
-            remove_cols = st.columns([12, 1])
-            with remove_cols[1]:
-                if st.button("🗑️", key=f"remove_event_{i}"):
-                    st.session_state.event_types.pop(i)
-                    st.rerun()
-            
-            # Add a horizontal line between rows for better readability
-            st.markdown("<hr style='margin: 5px 0; border: none; border-top: 1px solid #ddd;'>", unsafe_allow_html=True)
+            render_event_type_row(event, i)
     
     # Side panel with help content
     col1, col2 = st.columns([3, 1])
@@ -254,11 +130,155 @@ def render_form():
     with col2:
         # Help section
         styled_header("Need Help?", "section")
-        help_topic = st.selectbox(
-            "Select topic for help",
-            ["Event Types", "Schedule Exceptions", "Override Configuration", "Mobile Configuration"]
-        )
+        help_topic = st.selectbox("Select topic for help", HELP_TOPICS)
         
         if st.button("Get Help"):
-            help_response = get_contextual_help(help_topic, "Event Types")
-            st.info(help_response)
\ No newline at end of file
+            help_response = get_contextual_help(help_topic, HELP_TAB_NAME)
+            st.info(help_response)
+
+@fragment
+def render_event_type_row(event, i):
+    """
+    Render one event type row
+
+    Runs as a fragment, so editing the row reruns only the row.
+
+    Args:
+        event (dict): The event type, edited in place
+        i (int): Index of the row in the displayed list
+    """
+    # Event row
+    event_cols = st.columns([2, 1, 1, 3, 3, 3, 3, 2, 2, 2, 2, 2, 2])
+    
+    with event_cols[0]:
+        # Description
+        event["description"] = st.text_input(
+            "Description", 
+            value=event["description"], 
+            key=f"event_desc_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[1]:
+        # Use checkbox
+        event["use"] = st.checkbox(
+            "Use", 
+            value=event["use"], 
+            key=f"event_use_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[2]:
+        # Use in dropdown checkbox
+        event["use_in_dropdown"] = st.checkbox(
+            "Use in Dropdown", 
+            value=event["use_in_dropdown"], 
+            key=f"event_dropdown_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[3]:
+        # Override checkbox
+        event["include_in_override"] = st.checkbox(
+            "Include in Override", 
+            value=event["include_in_override"], 
+            key=f"event_override_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[4]:
+        # Charged or excused selection for non-accept
+        event["charged_or_excused"] = st.selectbox(
+            "Charged or Excused", 
+            ["", "Charged", "Excused"], 
+            index=0 if not event["charged_or_excused"] else 
+                  (1 if event["charged_or_excused"] == "Charged" else 2),
+            key=f"event_charge1_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[5]:
+        # Charged or excused selection for skipped
+        event["employee_on_exception"] = st.selectbox(
+            "Charged or Excused", 
+            ["", "Charged", "Excused"], 
+            index=0 if not event["employee_on_exception"] else 
+                  (1 if event["employee_on_exception"] == "Charged" else 2),
+            key=f"event_charge2_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[6]:
+        # Can place on inbound selection
+        event["available_on_inbound"] = st.selectbox(
+            "Available on Inbound", 
+            ["", "Yes", "No"], 
+            index=0 if not event["available_on_inbound"] else 
+                  (1 if event["available_on_inbound"] == "Yes" else 2),
+            key=f"event_inbound_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[7]:
+        # Release via mobile
+        event["release_mobile"] = st.checkbox(
+            "Release via Mobile", 
+            value=event["release_mobile"], 
+            key=f"event_release_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[8]:
+        # Auto rest status
+        event["release_auto"] = st.checkbox(
+            "Auto Rest", 
+            value=event["release_auto"], 
+            key=f"event_auto_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[9]:
+        # Make unavailable
+        event["make_unavailable"] = st.checkbox(
+            "Make Unavailable", 
+            value=event["make_unavailable"], 
+            key=f"event_unavail_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[10]:
+        # Place on status
+        event["place_status"] = st.checkbox(
+            "Place Status", 
+            value=event["place_status"], 
+            key=f"event_status_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[11]:
+        # Min duration
+        event["min_duration"] = st.text_input(
+            "Min Duration", 
+            value=event["min_duration"], 
+            key=f"event_min_{i}",
+            label_visibility="collapsed"
+        )
+    
+    with event_cols[12]:
+        # Max duration
+        event["max_duration"] = st.text_input(
+            "Max Duration", 
+            value=event["max_duration"], 
+            key=f"event_max_{i}",
+            label_visibility="collapsed"
+        )
+    
+    # Add remove button for this event type
+    remove_cols = st.columns([12, 1])
+    with remove_cols[1]:
+        if st.button("🗑️", key=f"remove_event_{i}"):
+            st.session_state.event_types.pop(i)
+            st.rerun()
+    
+    # Add a horizontal line between rows for better readability
+    st.markdown("<hr style='margin: 5px 0; border: none; border-top: 1px solid #ddd;'>", unsafe_allow_html=True)
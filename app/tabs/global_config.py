@@ -7,8 +7,20 @@
 
 import streamlit as st
 from app.styles import styled_header
+from app.helpers import set_response, render_batch_edit_toggle, option_section
 from app.ai_assistant import get_contextual_help
 
+# Topics offered by the "Need Help?" section, and the tab name sent with them
+HELP_TAB_NAME = "Global Configuration Options"
+HELP_TOPICS = [
+    "Roster Administration",
+    "Callout Behavior",
+    "ARCOS Add-Ons",
+    "Resequencing Options",
+    "Paycodes",
+    "VRU Configuration"
+]
+
 def render_form():
     """Render the Global Configuration Options form with interactive elements"""
     styled_header("Global Configuration Options", "tab")
@@ -29,6 +41,9 @@ def render_form():
         if you have questions about specific options.
         """)
     
+    # Batched editing groups each section into a form with one Save button
+    batched = render_batch_edit_toggle("global_config")
+    
     # Create tabs for different sections
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
         "Roster Preferences", 
@@ -39,36 +54,32 @@ def render_form():
         "VRU Configuration"
     ])
     
-    with tab1:
+    with tab1, option_section("global_config_roster_preferences", batched):
         render_roster_preferences()
         
-    with tab2:
+    with tab2, option_section("global_config_callout_options", batched):
         render_callout_options()
         
-    with tab3:
+    with tab3, option_section("global_config_arcos_addons", batched):
         render_arcos_addons()
         
-    with tab4:
+    with tab4, option_section("global_config_resequence_options", batched):
         render_resequence_options()
         
-    with tab5:
+    with tab5, option_section("global_config_paycodes", batched):
         render_paycodes()
         
-    with tab6:
+    with tab6, option_section("global_config_vru_configuration", batched):
         render_vru_configuration()
     
     # Help section
     st.markdown("<hr>", unsafe_allow_html=True)
     styled_header("Need Help?", "section")
     
-    help_topic = st.selectbox(
-        "Select topic for help",
-        ["Roster Administration", "Callout Behavior", "ARCOS Add-Ons", 
-         "Resequencing Options", "Paycodes", "VRU Configuration"]
-    )
+    help_topic = st.selectbox("Select topic for help", HELP_TOPICS)
     
     if st.button("Get Help"):
-        help_response = get_contextual_help(help_topic, "Global Configuration Options")
+        help_response = get_contextual_help(help_topic, HELP_TAB_NAME)
         st.info(help_response)
 
 def render_roster_preferences():
@@ -89,7 +100,7 @@ def render_roster_preferences():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Roster_Sorting"] = sorting_method
+    set_response("Global_Configuration_Options_Roster_Sorting", sorting_method)
     
     # Pointer-based progression
     use_pointer = st.checkbox(
@@ -100,7 +111,7 @@ def render_roster_preferences():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Use_Pointer"] = "Yes" if use_pointer else "No"
+    set_response("Global_Configuration_Options_Use_Pointer", "Yes" if use_pointer else "No")
     
     # Exclusive rosters
     use_exclusive_rosters = st.checkbox(
@@ -111,7 +122,7 @@ def render_roster_preferences():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Exclusive_Rosters"] = "Yes" if use_exclusive_rosters else "No"
+    set_response("Global_Configuration_Options_Exclusive_Rosters", "Yes" if use_exclusive_rosters else "No")
     
     # Additional roster preferences
     st.markdown("### Additional Roster Preferences")
@@ -125,7 +136,7 @@ def render_roster_preferences():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Roster_Preferences"] = ", ".join(roster_prefs)
+    set_response("Global_Configuration_Options_Roster_Preferences", ", ".join(roster_prefs))
 
 def render_callout_options():
     """Render the callout options section"""
@@ -145,7 +156,7 @@ def render_callout_options():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Blast_Calling"] = "Enabled" if enable_blast else "Disabled"
+    set_response("Global_Configuration_Options_Blast_Calling", "Enabled" if enable_blast else "Disabled")
     
     # CTT handling
     ctt_method = st.selectbox(
@@ -157,7 +168,7 @@ def render_callout_options():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_CTT_Method"] = ctt_method
+    set_response("Global_Configuration_Options_CTT_Method", ctt_method)
     
     # Overlap times
     overlap_minutes = st.number_input(
@@ -171,7 +182,7 @@ def render_callout_options():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Overlap_Minutes"] = str(overlap_minutes)
+    set_response("Global_Configuration_Options_Overlap_Minutes", str(overlap_minutes))
     
     # Additional callout options
     st.markdown("### Additional Callout Options")
@@ -185,7 +196,7 @@ def render_callout_options():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Additional_Callout_Options"] = ", ".join(callout_options)
+    set_response("Global_Configuration_Options_Additional_Callout_Options", ", ".join(callout_options))
 
 def render_arcos_addons():
     """Render the ARCOS add-ons section"""
@@ -205,7 +216,7 @@ def render_arcos_addons():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_ARCOS_Mobile"] = "Enabled" if mobile_enabled else "Disabled"
+    set_response("Global_Configuration_Options_ARCOS_Mobile", "Enabled" if mobile_enabled else "Disabled")
     
     # Web & Inbound Callout Activations
     web_activations = st.checkbox(
@@ -216,7 +227,7 @@ def render_arcos_addons():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Web_Activations"] = "Enabled" if web_activations else "Disabled"
+    set_response("Global_Configuration_Options_Web_Activations", "Enabled" if web_activations else "Disabled")
     
     # Other add-ons
     st.markdown("### Other Add-On Features")
@@ -231,7 +242,7 @@ def render_arcos_addons():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Other_Addons"] = ", ".join(other_addons)
+    set_response("Global_Configuration_Options_Other_Addons", ", ".join(other_addons))
 
 def render_resequence_options():
     """Render the resequence options section"""
@@ -250,7 +261,7 @@ def render_resequence_options():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Switchover_Date"] = switchover_date.strftime("%m/%d/%Y")
+    set_response("Global_Configuration_Options_Switchover_Date", switchover_date.strftime("%m/%d/%Y"))
     
     # Days between switchovers
     days_between = st.number_input(
@@ -264,7 +275,7 @@ def render_resequence_options():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Days_Between_Switchovers"] = str(days_between)
+    set_response("Global_Configuration_Options_Days_Between_Switchovers", str(days_between))
     
     # Apply changes to future rosters
     apply_to_future = st.checkbox(
@@ -275,7 +286,7 @@ def render_resequence_options():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Apply_To_Future"] = "Yes" if apply_to_future else "No"
+    set_response("Global_Configuration_Options_Apply_To_Future", "Yes" if apply_to_future else "No")
     
     # Number of future roster periods
     future_periods = st.number_input(
@@ -289,7 +300,7 @@ def render_resequence_options():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Future_Periods"] = str(future_periods)
+    set_response("Global_Configuration_Options_Future_Periods", str(future_periods))
 
 def render_paycodes():
     """Render the paycodes section"""
@@ -311,7 +322,7 @@ def render_paycodes():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_OT_Paycode"] = ot_paycode
+    set_response("Global_Configuration_Options_OT_Paycode", ot_paycode)
     
     dt_paycode = st.text_input(
         "Double Time Paycode",
@@ -321,7 +332,7 @@ def render_paycodes():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_DT_Paycode"] = dt_paycode
+    set_response("Global_Configuration_Options_DT_Paycode", dt_paycode)
     
     # Additional paycodes
     st.markdown("### Additional Paycodes")
@@ -340,7 +351,7 @@ def render_paycodes():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Additional_Paycodes"] = additional_paycodes
+    set_response("Global_Configuration_Options_Additional_Paycodes", additional_paycodes)
 
 def render_vru_configuration():
     """Render the VRU configuration section"""
@@ -363,7 +374,7 @@ def render_vru_configuration():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Max_Devices"] = str(max_devices)
+    set_response("Global_Configuration_Options_Max_Devices", str(max_devices))
     
     # Modifiable devices
     modifiable_devices = st.multiselect(
@@ -375,7 +386,7 @@ def render_vru_configuration():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Modifiable_Devices"] = ", ".join(modifiable_devices)
+    set_response("Global_Configuration_Options_Modifiable_Devices", ", ".join(modifiable_devices))
     
     # Maximum temporary numbers
     max_temp_numbers = st.number_input(
@@ -389,7 +400,7 @@ def render_vru_configuration():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_Max_Temp_Numbers"] = str(max_temp_numbers)
+    set_response("Global_Configuration_Options_Max_Temp_Numbers", str(max_temp_numbers))
     
     # Additional VRU settings
     st.markdown("### Additional VRU Settings")
@@ -404,4 +415,4 @@ def render_vru_configuration():
     )
     
     # Store in session state
-    st.session_state.responses["Global_Configuration_Options_VRU_Prompts"] = ", ".join(vru_prompts)
\ No newline at end of file
+    set_response("Global_Configuration_Options_VRU_Prompts", ", ".join(vru_prompts))
\ No newline at end of file
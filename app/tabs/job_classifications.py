@@ -9,6 +9,7 @@ import streamlit as st
 import pandas as pd
 import uuid
 from app.styles import styled_header
+from app.batch_jobs import render_batch_fill
 
 def render_form():
     """Render the Job Classifications form with interactive elements"""
@@ -89,6 +90,9 @@ def render_form():
                 st.session_state.job_classifications.pop(i)
                 st.rerun()
     
+    # Recording verbiage for many classifications at once
+    render_batch_fill("job_classification_recording")
+    
     # Preview in separate container
     preview_container = st.container()
     with preview_container:
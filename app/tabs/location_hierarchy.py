@@ -6,9 +6,9 @@
 # ============================================================================
 
 import streamlit as st
-import pandas as pd
 import uuid
 from app.styles import styled_header
+from app.helpers import fragment
 
 def render_form():
     """Render the Location Hierarchy form with interactive elements"""
@@ -86,56 +86,101 @@ def render_form():
 
     # Instead of nesting columns, we'll create a separate row for each entry
     for i, entry in enumerate(st.session_state.hierarchy_data["entries"]):
-        # Creating separate containers for each row to avoid nesting columns
-        entry_container = st.container()
+        render_hierarchy_entry(entry, i, session_id)
+    
+    # Show preview in a separate container to avoid nesting
+    render_hierarchy_preview()
+
+@fragment
+def render_hierarchy_entry(entry, i, session_id):
+    """
+    Render one hierarchy entry with its sub-branch buttons and Level 4 configuration
+
+    Runs as a fragment, so editing the entry reruns only the entry; the
+    preview is refreshed on the next full rerun.
+
+    Args:
+        entry (dict): The entry, edited in place
+        i (int): Index of the entry
+        session_id (str): Suffix of the widget keys
+    """
+    labels = st.session_state.hierarchy_data["labels"]
+
+    # Creating separate containers for each row to avoid nesting columns
+    entry_container = st.container()
+    
+    # Use a simple single-level column layout for each entry
+    with entry_container:
+        row_cols = st.columns([0.5, 2, 2, 2, 2, 2, 0.5])
         
-        # Use a simple single-level column layout for each entry
-        with entry_container:
-            row_cols = st.columns([0.5, 2, 2, 2, 2, 2, 0.5])
-            
-            with row_cols[0]:
-                st.write(f"#{i+1}")
-            
-            with row_cols[1]:
-                entry["level1"] = st.text_input("Level 1", value=entry["level1"], key=f"lvl1_{i}_{session_id}",
-                                              placeholder=f"Enter {labels[0]}", label_visibility="collapsed")
-            
-            with row_cols[2]:
-                entry["level2"] = st.text_input("Level 2", value=entry["level2"], key=f"lvl2_{i}_{session_id}",
-                                              placeholder=f"Enter {labels[1]}", label_visibility="collapsed")
-            
-            with row_cols[3]:
-                entry["level3"] = st.text_input("Level 3", value=entry["level3"], key=f"lvl3_{i}_{session_id}",
-                                              placeholder=f"Enter {labels[2]}", label_visibility="collapsed")
-            
-            with row_cols[4]:
-                entry["level4"] = st.text_input("Level 4", value=entry["level4"], key=f"lvl4_{i}_{session_id}",
-                                              placeholder=f"Enter {labels[3]}", label_visibility="collapsed")
-            
-            with row_cols[5]:
-                entry["timezone"] = st.text_input("Time Zone", value=entry.get("timezone", ""), key=f"tz_{i}_{session_id}",
-                                               placeholder=st.session_state.hierarchy_data["timezone"],
-                                               label_visibility="collapsed")
+        with row_cols[0]:
+            st.write(f"#{i+1}")
+        
+        with row_cols[1]:
+            entry["level1"] = st.text_input("Level 1", value=entry["level1"], key=f"lvl1_{i}_{session_id}",
+                                          placeholder=f"Enter {labels[0]}", label_visibility="collapsed")
+        
+        with row_cols[2]:
+            entry["level2"] = st.text_input("Level 2", value=entry["level2"], key=f"lvl2_{i}_{session_id}",
+                                          placeholder=f"Enter {labels[1]}", label_visibility="collapsed")
+        
+        with row_cols[3]:
+            entry["level3"] = st.text_input("Level 3", value=entry["level3"], key=f"lvl3_{i}_{session_id}",
+                                          placeholder=f"Enter {labels[2]}", label_visibility="collapsed")
+        
+        with row_cols[4]:
+            entry["level4"] = st.text_input("Level 4", value=entry["level4"], key=f"lvl4_{i}_{session_id}",
+                                          placeholder=f"Enter {labels[3]}", label_visibility="collapsed")
+        
+        with row_cols[5]:
+            entry["timezone"] = st.text_input("Time Zone", value=entry.get("timezone", ""), key=f"tz_{i}_{session_id}",
+                                           placeholder=st.session_state.hierarchy_data["timezone"],
+                                           label_visibility="collapsed")
+        
+        with row_cols[6]:
+            # Delete button
+            if st.button("🗑️", key=f"del_{i}_{session_id}", help="Remove this entry"):
+                st.session_state.hierarchy_data["entries"].pop(i)
+                st.rerun()
+
+    # Sub-branch buttons in a separate container
+    if entry["level1"]:
+        branch_container = st.container()
+        with branch_container:
+            sb_cols = st.columns([4, 2, 2, 2, 2])
             
-            with row_cols[6]:
-                # Delete button
-                if st.button("🗑️", key=f"del_{i}_{session_id}", help="Remove this entry"):
-                    st.session_state.hierarchy_data["entries"].pop(i)
+            # Add Business Unit button (only if level1 is filled)
+            with sb_cols[1]:
+                if st.button(f"+ Add Business Unit", key=f"add_bu_{i}_{session_id}",
+                           help=f"Add a new Business Unit under {entry['level1']}"):
+                    new_entry = {
+                        "level1": entry["level1"],
+                        "level2": "",
+                        "level3": "",
+                        "level4": "",
+                        "timezone": entry.get("timezone", ""),
+                        "codes": ["", "", "", "", ""],
+                        "callout_types": {
+                            "Normal": False,
+                            "All Hands on Deck": False,
+                            "Fill Shift": False,
+                            "Travel": False,
+                            "Notification": False,
+                            "Notification (No Response)": False
+                        },
+                        "callout_reasons": ""
+                    }
+                    st.session_state.hierarchy_data["entries"].append(new_entry)
                     st.rerun()
-
-        # Sub-branch buttons in a separate container
-        if entry["level1"]:
-            branch_container = st.container()
-            with branch_container:
-                sb_cols = st.columns([4, 2, 2, 2, 2])
-                
-                # Add Business Unit button (only if level1 is filled)
-                with sb_cols[1]:
-                    if st.button(f"+ Add Business Unit", key=f"add_bu_{i}_{session_id}",
-                               help=f"Add a new Business Unit under {entry['level1']}"):
+            
+            # Add Division button (only if level1 and level2 are filled)
+            with sb_cols[2]:
+                if entry["level2"]:
+                    if st.button(f"+ Add Division", key=f"add_div_{i}_{session_id}",
+                               help=f"Add a new Division under {entry['level2']}"):
                         new_entry = {
                             "level1": entry["level1"],
-                            "level2": "",
+                            "level2": entry["level2"],
                             "level3": "",
                             "level4": "",
                             "timezone": entry.get("timezone", ""),
@@ -152,62 +197,34 @@ def render_form():
                         }
                         st.session_state.hierarchy_data["entries"].append(new_entry)
                         st.rerun()
-                
-                # Add Division button (only if level1 and level2 are filled)
-                with sb_cols[2]:
-                    if entry["level2"]:
-                        if st.button(f"+ Add Division", key=f"add_div_{i}_{session_id}",
-                                   help=f"Add a new Division under {entry['level2']}"):
-                            new_entry = {
-                                "level1": entry["level1"],
-                                "level2": entry["level2"],
-                                "level3": "",
-                                "level4": "",
-                                "timezone": entry.get("timezone", ""),
-                                "codes": ["", "", "", "", ""],
-                                "callout_types": {
-                                    "Normal": False,
-                                    "All Hands on Deck": False,
-                                    "Fill Shift": False,
-                                    "Travel": False,
-                                    "Notification": False,
-                                    "Notification (No Response)": False
-                                },
-                                "callout_reasons": ""
-                            }
-                            st.session_state.hierarchy_data["entries"].append(new_entry)
-                            st.rerun()
 
-                # Add OpCenter button (only if level1, level2, and level3 are filled)
-                with sb_cols[3]:
-                    if entry["level2"] and entry["level3"]:
-                        if st.button(f"+ Add OpCenter", key=f"add_op_{i}_{session_id}",
-                                   help=f"Add a new OpCenter under {entry['level3']}"):
-                            new_entry = {
-                                "level1": entry["level1"],
-                                "level2": entry["level2"],
-                                "level3": entry["level3"],
-                                "level4": "",
-                                "timezone": entry.get("timezone", ""),
-                                "codes": ["", "", "", "", ""],
-                                "callout_types": {
-                                    "Normal": False,
-                                    "All Hands on Deck": False,
-                                    "Fill Shift": False,
-                                    "Travel": False,
-                                    "Notification": False,
-                                    "Notification (No Response)": False
-                                },
-                                "callout_reasons": ""
-                            }
-                            st.session_state.hierarchy_data["entries"].append(new_entry)
-                            st.rerun()
+            # Add OpCenter button (only if level1, level2, and level3 are filled)
+            with sb_cols[3]:
+                if entry["level2"] and entry["level3"]:
+                    if st.button(f"+ Add OpCenter", key=f"add_op_{i}_{session_id}",
+                               help=f"Add a new OpCenter under {entry['level3']}"):
+                        new_entry = {
+                            "level1": entry["level1"],
+                            "level2": entry["level2"],
+                            "level3": entry["level3"],
+                            "level4": "",
+                            "timezone": entry.get("timezone", ""),
+                            "codes": ["", "", "", "", ""],
+                            "callout_types": {
+                                "Normal": False,
+                                "All Hands on Deck": False,
+                                "Fill Shift": False,
+                                "Travel": False,
+                                "Notification": False,
+                                "Notification (No Response)": False
+                            },
+                            "callout_reasons": ""
+                        }
+                        st.session_state.hierarchy_data["entries"].append(new_entry)
+                        st.rerun()
 
-        # LEVEL 4 CONFIGURATION in a separate container
-        render_level4_configuration(entry, i, session_id)
-    
-    # Show preview in a separate container to avoid nesting
-    render_hierarchy_preview()
+    # LEVEL 4 CONFIGURATION in a separate container
+    render_level4_configuration(entry, i, session_id)
 
 def render_level4_configuration(entry, i, session_id):
     """Render configuration options for a Level 4 location"""
@@ -317,63 +334,72 @@ def render_level4_configuration(entry, i, session_id):
             st.info(f"Enter {st.session_state.hierarchy_data['labels'][3]} to complete this entry and add location codes, callout types, and reasons.")
         st.markdown("<hr style='margin: 10px 0;'>", unsafe_allow_html=True)
 
+def generate_hierarchy_preview(hierarchy_data):
+    """
+    Generate the text preview of the hierarchy tree
+    
+    Args:
+        hierarchy_data (dict): The hierarchy data with its entries
+        
+    Returns:
+        str: Indented bullet list of the hierarchy
+    """
+    # Create a tree structure to organize the hierarchy
+    tree = {}
+    # Populate the tree
+    for entry in hierarchy_data["entries"]:
+        if not entry["level1"]:
+            continue
+        l1 = entry["level1"]
+        if l1 not in tree:
+            tree[l1] = {}
+        if entry["level2"]:
+            l2 = entry["level2"]
+            if l2 not in tree[l1]:
+                tree[l1][l2] = {}
+            if entry["level3"]:
+                l3 = entry["level3"]
+                if l3 not in tree[l1][l2]:
+                    tree[l1][l2][l3] = []
+                if entry["level4"]:
+                    l4_info = {
+                        "name": entry["level4"],
+                        "codes": [c for c in entry["codes"] if c],
+                        "timezone": entry["timezone"],
+                        "callout_types": [ct for ct, enabled in entry["callout_types"].items() if enabled],
+                        "callout_reasons": entry["callout_reasons"]
+                    }
+                    tree[l1][l2][l3].append(l4_info)
+
+    # Generate the text representation
+    lines = []
+    for l1, l1_children in tree.items():
+        lines.append(f"• {l1}")
+        for l2, l2_children in l1_children.items():
+            lines.append(f"  • {l2}")
+            for l3, l3_children in l2_children.items():
+                lines.append(f"    • {l3}")
+                for l4_info in l3_children:
+                    lines.append(f"      • {l4_info['name']}")
+                    if l4_info["codes"]:
+                        lines.append(f"        (Codes: {', '.join(l4_info['codes'])})")
+                    if l4_info["timezone"]:
+                        lines.append(f"        [Time Zone: {l4_info['timezone']}]")
+                    if l4_info["callout_types"]:
+                        lines.append(f"        [Callout Types: {', '.join(l4_info['callout_types'])}]")
+                    if l4_info["callout_reasons"]:
+                        lines.append(f"        [Callout Reasons: {l4_info['callout_reasons']}]")
+    if not lines:
+        return "No entries yet. Use the form on the left to add location hierarchy entries."
+    return "\n".join(lines)
+
 def render_hierarchy_preview():
     """Render a preview of the hierarchy structure"""
     preview_container = st.container()
     with preview_container:
         styled_header("Hierarchy Preview", "section")
         
-        def generate_hierarchy_preview():
-            # Create a tree structure to organize the hierarchy
-            tree = {}
-            # Populate the tree
-            for entry in st.session_state.hierarchy_data["entries"]:
-                if not entry["level1"]:
-                    continue
-                l1 = entry["level1"]
-                if l1 not in tree:
-                    tree[l1] = {}
-                if entry["level2"]:
-                    l2 = entry["level2"]
-                    if l2 not in tree[l1]:
-                        tree[l1][l2] = {}
-                    if entry["level3"]:
-                        l3 = entry["level3"]
-                        if l3 not in tree[l1][l2]:
-                            tree[l1][l2][l3] = []
-                        if entry["level4"]:
-                            l4_info = {
-                                "name": entry["level4"],
-                                "codes": [c for c in entry["codes"] if c],
-                                "timezone": entry["timezone"],
-                                "callout_types": [ct for ct, enabled in entry["callout_types"].items() if enabled],
-                                "callout_reasons": entry["callout_reasons"]
-                            }
-                            tree[l1][l2][l3].append(l4_info)
-
-            # Generate the text representation
-            lines = []
-            for l1, l1_children in tree.items():
-                lines.append(f"• {l1}")
-                for l2, l2_children in l1_children.items():
-                    lines.append(f"  • {l2}")
-                    for l3, l3_children in l2_children.items():
-                        lines.append(f"    • {l3}")
-                        for l4_info in l3_children:
-                            lines.append(f"      • {l4_info['name']}")
-                            if l4_info["codes"]:
-                                lines.append(f"        (Codes: {', '.join(l4_info['codes'])})")
-                            if l4_info["timezone"]:
-                                lines.append(f"        [Time Zone: {l4_info['timezone']}]")
-                            if l4_info["callout_types"]:
-                                lines.append(f"        [Callout Types: {', '.join(l4_info['callout_types'])}]")
-                            if l4_info["callout_reasons"]:
-                                lines.append(f"        [Callout Reasons: {l4_info['callout_reasons']}]")
-            if not lines:
-                return "No entries yet. Use the form on the left to add location hierarchy entries."
-            return "\n".join(lines)
-        
-        st.code(generate_hierarchy_preview())
+        st.code(generate_hierarchy_preview(st.session_state.hierarchy_data))
         
         # Display sample hierarchy from example
         styled_header("Sample Hierarchy", "section")
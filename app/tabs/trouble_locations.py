@@ -8,7 +8,19 @@
 
 import streamlit as st
 from app.styles import styled_header
+from app.helpers import fragment
 from app.ai_assistant import get_contextual_help
+from app.batch_jobs import render_batch_fill
+from app.pronunciation import fill_pronunciations
+
+# Topics offered by the "Need Help?" section, and the tab name sent with them
+HELP_TAB_NAME = "Trouble Locations"
+HELP_TOPICS = [
+    "Trouble Locations",
+    "Pronunciation Guide",
+    "Recording Requirements",
+    "Best Practices"
+]
 
 def render_form():
     """Render the Trouble Locations form with interactive elements"""
@@ -45,47 +57,7 @@ def render_form():
     
     # Display existing entries
     for i, location in enumerate(st.session_state.trouble_locations):
-        location_container = st.container()
-        with location_container:
-            cols = st.columns([1, 1, 2, 2, 0.5])
-            
-            with cols[0]:
-                location["recording_needed"] = st.checkbox(
-                    "Recording Needed", 
-                    value=location.get("recording_needed", True),
-                    key=f"rec_needed_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with cols[1]:
-                location["id"] = st.text_input(
-                    "ID", 
-                    value=location.get("id", ""),
-                    key=f"loc_id_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with cols[2]:
-                location["location"] = st.text_input(
-                    "Trouble Location", 
-                    value=location.get("location", ""),
-                    key=f"loc_name_{i}",
-                    label_visibility="collapsed"
-                )
-            
-            with cols[3]:
-                location["verbiage"] = st.text_input(
-                    "Verbiage (Pronunciation)", 
-                    value=location.get("verbiage", ""),
-                    key=f"loc_verbiage_{i}",
-                    label_visibility="collapsed",
-                    placeholder="e.g., rok-ferd"
-                )
-            
-            with cols[4]:
-                if st.button("🗑️", key=f"del_loc_{i}", help="Remove this location"):
-                    st.session_state.trouble_locations.pop(i)
-                    st.rerun()
+        render_location_row(location, i)
     
     # Add New Entry button
     if st.button("➕ Add Trouble Location"):
@@ -94,6 +66,14 @@ def render_form():
         )
         st.rerun()
     
+    # Pronunciations for many locations at once: offline rules, or the AI Assistant
+    if st.button("🔤 Suggest Pronunciations", help="Fill empty pronunciations of locations that need a recording, using built-in rules"):
+        st.session_state.trouble_locations, changed = fill_pronunciations(st.session_state.trouble_locations)
+        for index in changed:
+            st.session_state.pop(f"loc_verbiage_{index}", None)
+        st.rerun()
+    render_batch_fill("trouble_location_verbiage")
+    
     # Preview section
     st.markdown("<hr>", unsafe_allow_html=True)
     styled_header("Trouble Locations Preview", "section")
@@ -137,11 +117,62 @@ def render_form():
     st.markdown("<hr>", unsafe_allow_html=True)
     styled_header("Need Help?", "section")
     
-    help_topic = st.selectbox(
-        "Select topic for help",
-        ["Trouble Locations", "Pronunciation Guide", "Recording Requirements", "Best Practices"]
-    )
+    help_topic = st.selectbox("Select topic for help", HELP_TOPICS)
     
     if st.button("Get Help"):
-        help_response = get_contextual_help(help_topic, "Trouble Locations")
-        st.info(help_response)
\ No newline at end of file
+        help_response = get_contextual_help(help_topic, HELP_TAB_NAME)
+        st.info(help_response)
+
+@fragment
+def render_location_row(location, i):
+    """
+    Render one trouble location row
+
+    Runs as a fragment, so editing the row reruns only the row; the preview
+    is refreshed on the next full rerun.
+
+    Args:
+        location (dict): The row, edited in place
+        i (int): Index of the row
+    """
+    location_container = st.container()
+    with location_container:
+        cols = st.columns([1, 1, 2, 2, 0.5])
+        
+        with cols[0]:
+            location["recording_needed"] = st.checkbox(
+                "Recording Needed", 
+                value=location.get("recording_needed", True),
+                key=f"rec_needed_{i}",
+                label_visibility="collapsed"
+            )
+        
+        with cols[1]:
+            location["id"] = st.text_input(
+                "ID", 
+                value=location.get("id", ""),
+                key=f"loc_id_{i}",
+                label_visibility="collapsed"
+            )
+        
+        with cols[2]:
+            location["location"] = st.text_input(
+                "Trouble Location", 
+                value=location.get("location", ""),
+                key=f"loc_name_{i}",
+                label_visibility="collapsed"
+            )
+        
+        with cols[3]:
+            location["verbiage"] = st.text_input(
+                "Verbiage (Pronunciation)", 
+                value=location.get("verbiage", ""),
+                key=f"loc_verbiage_{i}",
+                label_visibility="collapsed",
+                placeholder="e.g., rok-ferd"
+            )
+        
+        with cols[4]:
+            if st.button("🗑️", key=f"del_loc_{i}", help="Remove this location"):
+                st.session_state.trouble_locations.pop(i)
+                st.rerun()
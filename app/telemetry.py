@@ -0,0 +1,231 @@
+# ============================================================================
+# ARCOS SIG Form Application - Telemetry
+# ============================================================================
+# This file contains the per-process metrics for AI Assistant calls: latency
+# and time-to-first-token histograms, token and cost counters, retries, cache
+# outcomes and error classes. The metrics are shown in the admin view and
+# written periodically to a Prometheus-style text file.
+# ============================================================================
+
+import os
+import time
+import threading
+from collections import deque
+from app.config import (
+    TELEMETRY_LATENCY_BUCKETS, TELEMETRY_METRICS_PATH, TELEMETRY_FLUSH_INTERVAL,
+    TELEMETRY_RECENT_CALLS, OPENAI_MODEL_PRICING
+)
+
+class Histogram:
+    """A fixed-bucket histogram (cumulative on export, like Prometheus)"""
+    def __init__(self, buckets):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Estimate a quantile (0.0-1.0) as the upper bound of its bucket"""
+        if self.count == 0:
+            return None
+        target = q * self.count
+        running = 0
+        for i, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return float("inf")
+
+def _labels(**labels):
+    """Render labels in Prometheus text form"""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in sorted(labels.items())) + "}"
+
+def estimate_cost(model, prompt_tokens, completion_tokens):
+    """
+    Estimate the cost of a call in US dollars
+
+    Returns:
+        float: Cost from OPENAI_MODEL_PRICING, or 0.0 for unknown models
+    """
+    input_price, output_price = OPENAI_MODEL_PRICING.get(model, (0.0, 0.0))
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+class Telemetry:
+    """
+    Thread-safe metrics shared by every session of the server process.
+
+    Calls are recorded from the event loop thread and cache outcomes from
+    the script threads, so every update holds the lock.
+    """
+    def __init__(self, metrics_path=TELEMETRY_METRICS_PATH, flush_interval=TELEMETRY_FLUSH_INTERVAL):
+        self.metrics_path = metrics_path
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+        self.started_at = time.time()
+        self.calls = {}
+        self.errors = {}
+        self.tokens = {}
+        self.cost = {}
+        self.retries = {}
+        self.cache = {}
+        self.latency = {}
+        self.ttft = {}
+        self.routes = {}
+        self.route_latency = {}
+        self.recent = deque(maxlen=TELEMETRY_RECENT_CALLS)
+
+    def record_call(self, kind, model, outcome, latency, ttft=None, prompt_tokens=0,
+                    completion_tokens=0, retries=0, error_class=None):
+        """
+        Record one API call
+
+        Args:
+            kind (str): "chat" (streamed question), "completion" (e.g. help),
+                "batch" (structured batch request) or "review" (SIG review)
+            model (str): Model that served the call
+            outcome (str): "ok", "error" or "cancelled"
+            latency (float): Total seconds, including retries
+            ttft (float): Seconds to the first token (streams only)
+            prompt_tokens (int): Prompt tokens used
+            completion_tokens (int): Completion tokens used
+            retries (int): Attempts beyond the first
+            error_class (str): Exception class name when the call failed
+        """
+        cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        with self._lock:
+            key = (kind, model, outcome)
+            self.calls[key] = self.calls.get(key, 0) + 1
+            if error_class:
+                self.errors[(kind, error_class)] = self.errors.get((kind, error_class), 0) + 1
+            for token_type, count in (("prompt", prompt_tokens), ("completion", completion_tokens)):
+                self.tokens[(model, token_type)] = self.tokens.get((model, token_type), 0) + count
+            self.cost[model] = self.cost.get(model, 0.0) + cost
+            self.retries[kind] = self.retries.get(kind, 0) + retries
+            self.latency.setdefault((kind, model), Histogram(TELEMETRY_LATENCY_BUCKETS)).observe(latency)
+            if ttft is not None:
+                self.ttft.setdefault((kind, model), Histogram(TELEMETRY_LATENCY_BUCKETS)).observe(ttft)
+            self.recent.append({
+                "time": time.time(), "kind": kind, "model": model, "outcome": outcome,
+                "latency": latency, "ttft": ttft, "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens, "retries": retries,
+                "error_class": error_class, "cost": cost
+            })
+        self._maybe_flush()
+
+    def record_route(self, route, model, outcome, latency):
+        """
+        Record one request served by (or tried on) a model route
+
+        Args:
+            route (str): Route name from MODEL_ROUTES, or "fixed" when the caller chose the model
+            model (str): Model of the route
+            outcome (str): "ok", "error", "cancelled" or "fallback" (failed, then the fallback was tried)
+            latency (float): Seconds spent on the route
+        """
+        with self._lock:
+            key = (route, model, outcome)
+            self.routes[key] = self.routes.get(key, 0) + 1
+            self.route_latency.setdefault((route, model), Histogram(TELEMETRY_LATENCY_BUCKETS)).observe(latency)
+        self._maybe_flush()
+
+    def record_cache(self, cache, outcome):
+        """
+        Record a cache lookup or a question answered without the model
+
+        Args:
+            cache (str): "help", "local_answer", "similar_question" or "coalesced"
+            outcome (str): "hit" or "miss"
+        """
+        with self._lock:
+            self.cache[(cache, outcome)] = self.cache.get((cache, outcome), 0) + 1
+        self._maybe_flush()
+
+    def to_prometheus_text(self, extra_gauges=None):
+        """
+        Render all metrics in the Prometheus text exposition format
+
+        Args:
+            extra_gauges (dict): Additional gauge name mapped to its value
+
+        Returns:
+            str: The metrics text
+        """
+        lines = []
+        with self._lock:
+            lines.append("# TYPE arcos_assistant_calls_total counter")
+            for (kind, model, outcome), count in sorted(self.calls.items()):
+                lines.append(f"arcos_assistant_calls_total{_labels(kind=kind, model=model, outcome=outcome)} {count}")
+            lines.append("# TYPE arcos_assistant_errors_total counter")
+            for (kind, error_class), count in sorted(self.errors.items()):
+                lines.append(f"arcos_assistant_errors_total{_labels(kind=kind, error_class=error_class)} {count}")
+            lines.append("# TYPE arcos_assistant_tokens_total counter")
+            for (model, token_type), count in sorted(self.tokens.items()):
+                lines.append(f"arcos_assistant_tokens_total{_labels(model=model, type=token_type)} {count}")
+            lines.append("# TYPE arcos_assistant_cost_dollars_total counter")
+            for model, cost in sorted(self.cost.items()):
+                lines.append(f"arcos_assistant_cost_dollars_total{_labels(model=model)} {cost:.6f}")
+            lines.append("# TYPE arcos_assistant_retries_total counter")
+            for kind, count in sorted(self.retries.items()):
+                lines.append(f"arcos_assistant_retries_total{_labels(kind=kind)} {count}")
+            lines.append("# TYPE arcos_assistant_cache_total counter")
+            for (cache, outcome), count in sorted(self.cache.items()):
+                lines.append(f"arcos_assistant_cache_total{_labels(cache=cache, outcome=outcome)} {count}")
+            lines.append("# TYPE arcos_assistant_route_calls_total counter")
+            for (route, model, outcome), count in sorted(self.routes.items()):
+                lines.append(f"arcos_assistant_route_calls_total{_labels(route=route, model=model, outcome=outcome)} {count}")
+            for name, label, histograms in (("latency_seconds", "kind", self.latency), ("ttft_seconds", "kind", self.ttft),
+                                            ("route_latency_seconds", "route", self.route_latency)):
+                lines.append(f"# TYPE arcos_assistant_{name} histogram")
+                for (group, model), histogram in sorted(histograms.items()):
+                    labels = {label: group, "model": model}
+                    running = 0
+                    for bound, count in zip(histogram.buckets + ["+Inf"], histogram.counts):
+                        running += count
+                        lines.append(f"arcos_assistant_{name}_bucket{_labels(le=bound, **labels)} {running}")
+                    lines.append(f"arcos_assistant_{name}_sum{_labels(**labels)} {histogram.sum:.6f}")
+                    lines.append(f"arcos_assistant_{name}_count{_labels(**labels)} {histogram.count}")
+        for name, value in sorted((extra_gauges or {}).items()):
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_metrics_file(self, path=None, extra_gauges=None):
+        """Write the metrics text file atomically (for a node exporter or a scraper)"""
+        path = path or self.metrics_path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, 'w') as file:
+            file.write(self.to_prometheus_text(extra_gauges))
+        os.replace(temporary_path, path)
+
+    def _maybe_flush(self):
+        """Write the metrics file at most once per flush interval"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._flushed_at < self.flush_interval:
+                return
+            self._flushed_at = now
+        try:
+            self.write_metrics_file()
+        except OSError as e:
+            print(f"Warning: Failed to write assistant metrics - {str(e)}")
+
+_telemetry = None
+_telemetry_lock = threading.Lock()
+
+def get_telemetry():
+    """Return the telemetry shared by the whole server process"""
+    global _telemetry
+    with _telemetry_lock:
+        if _telemetry is None:
+            _telemetry = Telemetry()
+        return _telemetry
@@ -0,0 +1,7 @@
+# ============================================================================
+# ARCOS SIG Form Application - Benchmarks Package
+# ============================================================================
+# This package contains the exporter benchmark suite and the synthetic SIG
+# generator it runs on. Run it from the repository root with
+# 'python -m benchmarks.run_benchmarks'.
+# ============================================================================
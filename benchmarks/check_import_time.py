@@ -0,0 +1,90 @@
+# ============================================================================
+# ARCOS SIG Form Application - Import Time Budget
+# ============================================================================
+# This file checks how long a fresh interpreter takes to import the app's
+# entry point, on top of Streamlit itself, and that heavy dependencies and
+# tab modules are not imported at startup. It exits with status 1 when the
+# budget is exceeded; tests/test_import_time.py runs the same check as part
+# of the test suite.
+#
+# Usage (from the repository root):
+#   python -m benchmarks.check_import_time
+#   python -m benchmarks.check_import_time --budget 0.1 --repeat 5
+# ============================================================================
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+DEFAULT_BUDGET_SECONDS = 0.25
+DEFAULT_MODULE = "main"
+
+# The probe imports the app from the repository root, wherever it is run from
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported by the code paths that use them
+DEFERRED_MODULES = ["pandas", "openai", "xlsxwriter", "openpyxl", "pyarrow", "tiktoken"]
+DEFERRED_PACKAGES = ["app.tabs.", "app.exporters.csv_exporter", "app.exporters.excel_exporter"]
+
+# Run in a fresh interpreter: Streamlit is imported first and not counted
+_PROBE = """
+import json, sys, time
+import streamlit
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+def measure_import(module=DEFAULT_MODULE):
+    """
+    Import a module in a fresh interpreter
+
+    Args:
+        module (str): Module to import
+
+    Returns:
+        dict: "seconds" (import time, excluding Streamlit) and "modules" (every module loaded)
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        capture_output=True, text=True, check=True, cwd=REPO_ROOT
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def check_import_time(module=DEFAULT_MODULE, budget=DEFAULT_BUDGET_SECONDS, repeat=3):
+    """
+    Check the import time and the modules loaded at import
+
+    The fastest of repeat runs is compared to the budget, so a busy machine
+    does not fail the check by itself.
+
+    Returns:
+        dict: "seconds", "budget", "eager" (deferred modules that were
+        imported anyway) and "ok"
+    """
+    runs = [measure_import(module) for _ in range(repeat)]
+    seconds = min(run["seconds"] for run in runs)
+    loaded = runs[0]["modules"]
+    eager = [name for name in loaded if name in DEFERRED_MODULES
+             or any(name.startswith(prefix) for prefix in DEFERRED_PACKAGES)]
+    return {"seconds": seconds, "budget": budget, "eager": eager, "ok": seconds <= budget and not eager}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the app's import time budget")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="Module to import (default: main)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="Budget in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters to run")
+    args = parser.parse_args(argv)
+
+    result = check_import_time(args.module, args.budget, args.repeat)
+    print(f"import {args.module}: {result['seconds'] * 1000:.0f} ms (budget {args.budget * 1000:.0f} ms)")
+    if result["eager"]:
+        print("Imported at startup but should be deferred: " + ", ".join(result["eager"]))
+    print("OK" if result["ok"] else "FAILED")
+    return 0 if result["ok"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
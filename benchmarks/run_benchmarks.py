@@ -0,0 +1,162 @@
+# ============================================================================
+# ARCOS SIG Form Application - Exporter Benchmarks
+# ============================================================================
+# This file benchmarks the exporters, the hierarchy preview and the callout
+# reasons filter on synthetic SIGs of increasing size. Each benchmark reports
+# wall time, peak memory and output size, and results are saved as JSON so
+# runs can be compared over time.
+#
+# Usage (from the repository root):
+#   python -m benchmarks.run_benchmarks --sizes 10 1000 10000 --output bench.json
+#   python -m benchmarks.run_benchmarks --compare bench.json
+# ============================================================================
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.synthetic_sig import generate_synthetic_sig
+
+DEFAULT_SIZES = [10, 1000, 10000, 100000]
+
+def _output_size(result):
+    """Size of a benchmark result: bytes for exports and text, items for lists"""
+    if isinstance(result, (bytes, bytearray)):
+        return len(result)
+    if isinstance(result, str):
+        return len(result.encode("utf-8"))
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    return None
+
+def measure(func, repeat):
+    """
+    Measure a function's wall time and peak memory
+
+    The wall time is taken from `repeat` untraced runs; peak memory comes from
+    one extra run under tracemalloc, since tracing slows the code down.
+
+    Returns:
+        dict: min/median wall seconds, peak memory bytes and output size
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_seconds_min": min(timings),
+        "wall_seconds_median": statistics.median(timings),
+        "peak_memory_bytes": peak,
+        "output_size": _output_size(result)
+    }
+
+def get_benchmarks(state, catalog):
+    """Return the benchmarked functions, bound to one synthetic SIG"""
+    from app.exporters.csv_exporter import export_to_csv
+    from app.exporters.excel_exporter import export_to_excel
+    from app.tabs.location_hierarchy import generate_hierarchy_preview
+    from app.tabs.callout_reasons import filter_callout_reasons
+
+    return {
+        "export_to_csv": lambda: export_to_csv(state),
+        "export_to_excel": lambda: export_to_excel(state),
+        "generate_hierarchy_preview": lambda: generate_hierarchy_preview(state.hierarchy_data),
+        "filter_callout_reasons": lambda: filter_callout_reasons(
+            catalog, "gas", True, state.selected_callout_reasons
+        )
+    }
+
+def _git_commit():
+    """Return the current git commit, or None outside a git checkout"""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return None
+
+def run_benchmarks(sizes, repeat=3, only=None, seed=0):
+    """
+    Run every benchmark for every hierarchy size
+
+    Args:
+        sizes (list): Numbers of OpCenters to generate
+        repeat (int): Timed runs per benchmark
+        only (list): Benchmark names to run (default: all)
+        seed (int): Seed of the synthetic SIG generator
+
+    Returns:
+        dict: Run metadata and one result per (benchmark, size)
+    """
+    results = []
+    for size in sizes:
+        state, catalog = generate_synthetic_sig(size, seed=seed)
+        for name, func in get_benchmarks(state, catalog).items():
+            if only and name not in only:
+                continue
+            measurement = measure(func, repeat)
+            results.append({"benchmark": name, "opcenters": size, **measurement})
+            print(f"{name:<28} {size:>8} OpCenters  "
+                  f"{measurement['wall_seconds_median'] * 1000:>10.1f} ms  "
+                  f"{measurement['peak_memory_bytes'] / 1e6:>8.1f} MB peak  "
+                  f"size {measurement['output_size']}")
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+        "results": results
+    }
+
+def compare_runs(previous, current):
+    """Print the median wall time change of each benchmark against a previous run"""
+    before = {(r["benchmark"], r["opcenters"]): r for r in previous["results"]}
+    print(f"\nCompared with {previous.get('git_commit') or 'previous run'} ({previous.get('timestamp')}):")
+    for result in current["results"]:
+        old = before.get((result["benchmark"], result["opcenters"]))
+        if old and old["wall_seconds_median"]:
+            ratio = result["wall_seconds_median"] / old["wall_seconds_median"]
+            print(f"{result['benchmark']:<28} {result['opcenters']:>8} OpCenters  {ratio:>6.2f}x time")
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the SIG exporters on synthetic SIGs.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                        help="Numbers of OpCenters to benchmark (default: 10 1000 10000 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark (default: 3)")
+    parser.add_argument("--only", nargs="+", default=None, help="Run only the named benchmarks")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic SIG generator")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Compare against a previous results JSON file")
+    args = parser.parse_args(argv)
+
+    run = run_benchmarks(args.sizes, args.repeat, args.only, args.seed)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(run, file, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            compare_runs(json.load(file), run)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# ============================================================================
+# ARCOS SIG Form Application - Synthetic SIG Generator
+# ============================================================================
+# This file generates deterministic synthetic SIGs of any size for the
+# benchmarks: a 4-level hierarchy, trouble locations, job classifications,
+# event types, responses and a callout reasons catalog.
+# ============================================================================
+
+import math
+import random
+from app.config import DEFAULT_CALLOUT_TYPES
+from app.sig_state import SIGState
+from app.session_manager import initialize_default_event_types
+
+SYLLABLES = ["ash", "bel", "car", "dun", "el", "fair", "glen", "har", "ing", "kel",
+             "lan", "mor", "nor", "ox", "pen", "ross", "sten", "ton", "vale", "wick"]
+
+REASON_WORDS = ["Gas", "Leak", "Fire", "Wires", "Down", "Pole", "Outage", "Storm", "Tree",
+                "Meter", "Odor", "Main", "Service", "Line", "Transformer", "Flood", "Emergency"]
+
+def _place_name(rng, index):
+    """Generate a readable, unique place name (e.g. 'Harmorton 42')"""
+    name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+    return f"{name} {index}"
+
+def generate_hierarchy(rng, opcenters):
+    """
+    Generate a 4-level hierarchy with the given number of OpCenters
+
+    The fan-out grows with the size so large hierarchies stay realistic:
+    roughly sqrt(n) divisions spread over a handful of business units.
+    """
+    divisions = max(1, int(math.sqrt(opcenters)))
+    business_units = max(1, int(math.sqrt(divisions)))
+
+    entries = []
+    for i in range(opcenters):
+        division = i % divisions
+        business_unit = division % business_units
+        callout_types = {ct: rng.random() < 0.5 for ct in DEFAULT_CALLOUT_TYPES}
+        entries.append({
+            "level1": "Synthetic Energy",
+            "level2": f"Business Unit {business_unit}",
+            "level3": f"Division {division}",
+            "level4": _place_name(rng, i),
+            "timezone": rng.choice(["", "", "ET", "CT", "MT", "PT"]),
+            "codes": [f"OC{i}"] + [f"OC{i}-{n}" if rng.random() < 0.3 else "" for n in range(1, 5)],
+            "callout_types": callout_types,
+            "callout_reasons": ", ".join(rng.sample(REASON_WORDS, rng.randint(0, 4)))
+        })
+
+    return {
+        "levels": ["Level 1", "Level 2", "Level 3", "Level 4"],
+        "labels": ["Parent Company", "Business Unit", "Division", "OpCenter"],
+        "entries": entries,
+        "timezone": "ET / CT / MT / PT"
+    }
+
+def generate_callout_reasons(rng, count):
+    """Generate a callout reasons catalog in the format of callout_reasons.json"""
+    reasons = [{"ID": "0", "Callout Reason Drop-Down Label": "", "Use?": "x", "Default?": "x", "Verbiage": "n/a"}]
+    for i in range(1, count):
+        reasons.append({
+            "ID": str(1000 + i),
+            "Callout Reason Drop-Down Label": " ".join(rng.sample(REASON_WORDS, rng.randint(1, 3))) + f" {i}",
+            "Use?": "x" if rng.random() < 0.3 else "",
+            "Default?": "",
+            "Verbiage": rng.choice(["Pre-recorded", "Text to speech", "n/a"])
+        })
+    return reasons
+
+def generate_synthetic_sig(opcenters, trouble_locations=None, job_classifications=None,
+                           callout_reasons=None, seed=0):
+    """
+    Generate a deterministic synthetic SIG
+
+    Args:
+        opcenters (int): Number of Level 4 OpCenters in the hierarchy
+        trouble_locations (int): Number of trouble locations (default: scaled to the hierarchy)
+        job_classifications (int): Number of job classifications (default: scaled to the hierarchy)
+        callout_reasons (int): Size of the callout reasons catalog (default: scaled to the hierarchy)
+        seed (int): Random seed; the same arguments always produce the same SIG
+
+    Returns:
+        tuple: (SIGState, list of callout reason catalog dictionaries)
+    """
+    rng = random.Random(seed)
+
+    if trouble_locations is None:
+        trouble_locations = min(5000, max(10, opcenters // 2))
+    if job_classifications is None:
+        job_classifications = min(2000, max(10, opcenters // 5))
+    if callout_reasons is None:
+        callout_reasons = min(10000, max(200, opcenters // 10))
+
+    hierarchy_data = generate_hierarchy(rng, opcenters)
+    catalog = generate_callout_reasons(rng, callout_reasons)
+
+    jobs = [{
+        "type": rng.choice(["", "Journeyman", "Apprentice"]),
+        "title": f"Job Class {i}",
+        "ids": [f"J{i}"] + [f"J{i}-{n}" if rng.random() < 0.2 else "" for n in range(1, 5)],
+        "recording": rng.choice(["", f"job class {i}"])
+    } for i in range(job_classifications)]
+
+    locations = [{
+        "recording_needed": rng.random() < 0.7,
+        "id": str(i).zfill(5),
+        "location": _place_name(rng, i),
+        "verbiage": ""
+    } for i in range(trouble_locations)]
+
+    responses = {f"Synthetic_Question_{i}": f"Answer {i}" for i in range(200)}
+
+    state = SIGState(
+        hierarchy_data=hierarchy_data,
+        job_classifications=jobs,
+        trouble_locations=locations,
+        event_types=initialize_default_event_types(),
+        selected_callout_reasons=[r["ID"] for r in catalog if r["Use?"] == "x"],
+        default_callout_reason="0",
+        responses=responses
+    )
+    return state, catalog
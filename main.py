@@ -7,20 +7,37 @@
 # ============================================================================
 
 import streamlit as st
-from app.config import setup_page_config
+from app.config import setup_page_config, TAB_NAMES
 from app.styles import load_css
 from app.session_manager import initialize_session_state
-from app.tabs import (
-    location_hierarchy, trouble_locations, job_classifications,
-    callout_reasons, event_types, callout_type_config,
-    global_config, data_interfaces, additions, generic_tab
-)
-from app.helpers import render_color_key
-from app.ai_assistant import render_ai_assistant
-from app.exporters.csv_exporter import export_to_csv
-from app.exporters.excel_exporter import export_to_excel
+from app.tabs import render_tab
+from app.helpers import render_color_key, load_callout_reasons, fragment
+from app.change_tracking import take_baseline_snapshot, get_current_sig_diff, summarize_sig_diff
+from app.ai_assistant import render_ai_assistant, render_assistant_admin
+from app.sig_review import render_sig_review_button, render_review_findings
+from app.openai_client import cancel_inflight_request
+from app.importers.excel_importer import import_from_excel
+from app.sig_state import SIGState
 from datetime import datetime
 
+@fragment
+def render_tab_content(selected_tab):
+    """
+    Render the selected tab (its module is imported on first use)
+    
+    Runs as a fragment, so a change on the tab reruns only the tab, not the
+    header, exports and AI Assistant panel.
+    
+    Args:
+        selected_tab (str): The tab to render
+    """
+    try:
+        render_tab(selected_tab)
+    except Exception as e:
+        st.error(f"Error rendering tab: {str(e)}")
+        import traceback
+        st.code(traceback.format_exc())
+
 def main():
     """Main application function"""
     # Initialize page config
@@ -35,17 +52,7 @@ def main():
         st.session_state.initialized = True
     
     # List of available tabs
-    tabs = [
-        "Location Hierarchy",
-        "Trouble Locations",
-        "Job Classifications",
-        "Callout Reasons",
-        "Event Types",
-        "Callout Type Configuration",
-        "Global Configuration Options",
-        "Data and Interfaces",
-        "Additions"
-    ]
+    tabs = TAB_NAMES
 
     # Display ARCOS logo and title
     col1, col2 = st.columns([1, 5])
@@ -63,6 +70,18 @@ def main():
     # Display color key legend
     render_color_key()
 
+    # Baseline for the Delete / Changes / Moves color key
+    baseline_cols = st.columns([1, 3])
+    with baseline_cols[0]:
+        if st.button("Set Current Data as Baseline"):
+            take_baseline_snapshot()
+    with baseline_cols[1]:
+        if "sig_baseline" in st.session_state and st.button("Compare with Baseline"):
+            diff = get_current_sig_diff([r.get("ID", "") for r in load_callout_reasons()])
+            summary = summarize_sig_diff(diff)
+            st.write(f"Changes since baseline: {summary['deleted']} deleted, {summary['changed']} changed, {summary['moved']} moved. "
+                     "The Excel export colors these rows using the color key.")
+
     # Calculate progress
     completed_tabs = sum(1 for tab in tabs if any(key.startswith(tab.replace(" ", "_")) for key in st.session_state.responses))
     progress = completed_tabs / len(tabs)
@@ -83,13 +102,16 @@ def main():
     
     # Update current tab in session state if changed
     if selected_tab != st.session_state.selected_tab:
+        # Answers for the previous tab are no longer wanted
+        cancel_inflight_request()
         st.session_state.selected_tab = selected_tab
         st.rerun()
 
-    # Export buttons
-    export_cols = st.columns(2)
+    # Export buttons (the exporters and pandas are imported on first use)
+    export_cols = st.columns(3)
     with export_cols[0]:
         if st.button("Export as CSV"):
+            from app.exporters.csv_exporter import export_to_csv
             csv_data = export_to_csv()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             st.download_button(
@@ -102,6 +124,7 @@ def main():
 
     with export_cols[1]:
         if st.button("Export as Excel"):
+            from app.exporters.excel_exporter import export_to_excel
             excel_data = export_to_excel()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             st.download_button(
@@ -112,6 +135,46 @@ def main():
                 key=f"download_excel_{timestamp}"
             )
 
+    with export_cols[2]:
+        if st.button("Export as Parquet"):
+            try:
+                from app.exporters.arrow_exporter import export_to_parquet
+                parquet_data = export_to_parquet()
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                st.download_button(
+                    label="Download Parquet",
+                    data=parquet_data,
+                    file_name=f"arcos_sig_{timestamp}.zip",
+                    mime="application/zip",
+                    key=f"download_parquet_{timestamp}"
+                )
+            except ImportError as e:
+                st.error(str(e))
+
+    # Save the session so it can be exported again later (e.g. by tools.batch_export)
+    if st.button("Save SIG State"):
+        state_data = SIGState.from_session_state().to_json()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        st.download_button(
+            label="Download SIG State (JSON)",
+            data=state_data,
+            file_name=f"arcos_sig_state_{timestamp}.json",
+            mime="application/json",
+            key=f"download_state_{timestamp}"
+        )
+
+    # Resume from a previously exported workbook
+    with st.expander("Resume from an exported SIG workbook", expanded=False):
+        uploaded_workbook = st.file_uploader("Upload an Excel file produced by 'Export as Excel'", type=["xlsx"], key="import_workbook")
+        if uploaded_workbook is not None and st.button("Import Workbook"):
+            try:
+                imported_keys = import_from_excel(uploaded_workbook)
+                # The imported SIG is the baseline that later edits are compared to
+                take_baseline_snapshot()
+                st.success(f"Imported {len(imported_keys)} section(s) from {uploaded_workbook.name}")
+            except Exception as e:
+                st.error(f"Error importing workbook: {str(e)}")
+
     # Add a separator
     st.markdown("<hr style='margin: 12px 0;'>", unsafe_allow_html=True)
     
@@ -119,37 +182,21 @@ def main():
     content_col, ai_col = st.columns([3, 1])
     
     with content_col:
+        # Findings of the last SIG review for this tab
+        render_review_findings(selected_tab)
+        
         # Main content area - render the appropriate tab
-        try:
-            if selected_tab == "Location Hierarchy":
-                location_hierarchy.render_form()
-            elif selected_tab == "Trouble Locations":
-                trouble_locations.render_form()
-            elif selected_tab == "Job Classifications":
-                job_classifications.render_form()
-            elif selected_tab == "Callout Reasons":
-                callout_reasons.render_form()
-            elif selected_tab == "Event Types":
-                event_types.render_form()
-            elif selected_tab == "Callout Type Configuration":
-                callout_type_config.render_form()
-            elif selected_tab == "Global Configuration Options":
-                global_config.render_form()
-            elif selected_tab == "Data and Interfaces":
-                data_interfaces.render_form()
-            elif selected_tab == "Additions":
-                additions.render_form()
-            else:
-                # For other tabs, use the generic form renderer
-                generic_tab.render_form(selected_tab)
-        except Exception as e:
-            st.error(f"Error rendering tab: {str(e)}")
-            import traceback
-            st.code(traceback.format_exc())
+        render_tab_content(selected_tab)
     
     with ai_col:
-        # AI Assistant panel
+        # Whole-SIG review, then the AI Assistant panel
+        render_sig_review_button()
         render_ai_assistant(selected_tab)
+    
+    # Admin view of the assistant telemetry, opened with ?admin=1
+    if st.query_params.get("admin") == "1":
+        with st.sidebar:
+            render_assistant_admin()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,6 @@
+# ============================================================================
+# ARCOS SIG Form Application - Tests
+# ============================================================================
+# This file initializes the tests package. Run the suite from the repository
+# root with: python -m pytest
+# ============================================================================
@@ -0,0 +1,56 @@
+# ============================================================================
+# ARCOS SIG Form Application - Change Tracking Tests
+# ============================================================================
+# This file tests the row diff behind the SIG color key.
+# ============================================================================
+
+from app.change_tracking import diff_rows, CHANGE_CHANGED, CHANGE_MOVED
+
+def _key(row):
+    return [("id", row["id"])] if row.get("id") else []
+
+def _content(row):
+    return row["name"]
+
+def _parent(row):
+    return row["parent"]
+
+def _row(row_id, name, parent="A"):
+    return {"id": row_id, "name": name, "parent": parent}
+
+def test_unchanged_rows_have_no_status():
+    rows = [_row("1", "North"), _row("2", "South")]
+    result = diff_rows(rows, [dict(row) for row in rows], _key, _content, _parent)
+    assert result == {"statuses": [None, None], "deleted": []}
+
+def test_changed_new_moved_and_deleted_rows():
+    baseline = [_row("1", "North"), _row("2", "South"), _row("3", "East")]
+    current = [_row("1", "North Zone"), _row("2", "South", parent="B"), _row("4", "West")]
+    result = diff_rows(baseline, current, _key, _content, _parent)
+    assert result["statuses"] == [CHANGE_CHANGED, CHANGE_MOVED, CHANGE_CHANGED]
+    assert result["deleted"] == [_row("3", "East")]
+
+def test_rows_without_keys_are_ignored():
+    baseline = [_row("", "Draft"), _row("1", "North")]
+    current = [_row("", "Other draft"), _row("1", "North")]
+    result = diff_rows(baseline, current, _key, _content, _parent)
+    assert result == {"statuses": [None, None], "deleted": []}
+
+def test_duplicate_keys_match_baseline_rows_once():
+    baseline = [_row("1", "North")]
+    current = [_row("1", "North"), _row("1", "North")]
+    result = diff_rows(baseline, current, _key, _content, _parent)
+    assert result["statuses"] == [None, CHANGE_CHANGED]
+
+def test_later_keys_match_when_the_first_one_changed():
+    def keys(row):
+        return [("code", row["code"]), ("name", row["name"])]
+    baseline = [{"code": "100", "name": "North", "parent": "A"}]
+    current = [{"code": "200", "name": "North", "parent": "A"}]
+    result = diff_rows(baseline, current, keys, lambda row: row["code"], _parent)
+    assert result == {"statuses": [CHANGE_CHANGED], "deleted": []}
+
+def test_without_parent_function_moves_are_not_detected():
+    baseline = [_row("1", "North")]
+    current = [_row("1", "North", parent="B")]
+    assert diff_rows(baseline, current, _key, _content)["statuses"] == [None]
@@ -0,0 +1,47 @@
+# ============================================================================
+# ARCOS SIG Form Application - Excel Exporter Tests
+# ============================================================================
+# This file tests the color-keyed Excel export against a baseline.
+# ============================================================================
+
+import io
+from openpyxl import load_workbook
+from app.sig_state import SIGState
+from app.change_tracking import snapshot_sig_state
+from app.exporters.excel_exporter import export_to_excel
+from app.config import ARCOS_LIGHT_RED, ARCOS_GREEN
+
+def _location(location_id, name):
+    return {"recording_needed": True, "id": location_id, "location": name, "verbiage": ""}
+
+def _sheet(data, name):
+    """Rows of a sheet as (values, fill color) pairs, without the header"""
+    worksheet = load_workbook(io.BytesIO(data))[name]
+    return [([cell.value for cell in row], row[0].fill.fgColor.rgb[-6:])
+            for row in worksheet.iter_rows(min_row=2)]
+
+def test_changed_and_deleted_rows_are_colored():
+    baseline = SIGState(trouble_locations=[_location("1", "Main"), _location("2", "Harbor Yard")])
+    state = SIGState(trouble_locations=[_location("1", "Main St"), _location("3", "Elm St")])
+    state.sig_baseline = snapshot_sig_state(baseline)
+
+    rows = _sheet(export_to_excel(state), "Trouble Locations")
+    green, red = ARCOS_GREEN.lstrip("#").upper(), ARCOS_LIGHT_RED.lstrip("#").upper()
+    assert rows == [
+        (["X", "1", "Main St", None], green),
+        (["X", "3", "Elm St", None], green),
+        (["X", "2", "Harbor Yard", None], red)
+    ]
+
+def test_changed_rows_with_non_scalar_values_are_written():
+    state = SIGState(responses={"Additions_Alert_Events": ["Storm", "Outage"], "Additions_Min_Staff": 5})
+    state.sig_baseline = snapshot_sig_state(SIGState(responses={"Additions_Alert_Events": ["Storm"]}))
+
+    rows = _sheet(export_to_excel(state), "Other Configurations")
+    assert [values for values, _ in rows] == [
+        ["Additions", "Alert_Events", "['Storm', 'Outage']"],
+        ["Additions", "Min_Staff", 5]
+    ]
+    # Colored rows hold the same values as an export without a baseline
+    state.sig_baseline = None
+    assert [values for values, _ in _sheet(export_to_excel(state), "Other Configurations")] == [values for values, _ in rows]
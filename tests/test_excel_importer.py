@@ -0,0 +1,49 @@
+# ============================================================================
+# ARCOS SIG Form Application - Excel Importer Tests
+# ============================================================================
+# This file tests that a workbook written by the Excel exporter imports back
+# into the same SIG data.
+# ============================================================================
+
+import io
+from app.sig_state import SIGState
+from app.exporters.excel_exporter import export_to_excel
+from app.importers.excel_importer import read_sig_workbook, _cell_str, _cell_value
+
+def _round_trip(state):
+    return read_sig_workbook(io.BytesIO(export_to_excel(state)))
+
+def test_cell_conversions():
+    assert _cell_str(None) == ""
+    assert _cell_str(5.0) == "5"
+    assert _cell_str("  North ") == "North"
+    assert _cell_value(None) == ""
+    assert _cell_value(5.0) == 5 and isinstance(_cell_value(5.0), int)
+    assert _cell_value(2.5) == 2.5
+    assert _cell_value(True) is True
+    assert _cell_value(" Yes ") == "Yes"
+
+def test_responses_keep_their_types():
+    responses = {
+        "Additions_Count": 5,
+        "Additions_Ratio": 2.5,
+        "Additions_Flag": True,
+        "Additions_Code": "5",
+        "Additions_CTT_Method": "Rotate"
+    }
+    imported = _round_trip(SIGState(responses=dict(responses)))
+    for key, value in responses.items():
+        assert imported["responses"][key] == value
+        assert type(imported["responses"][key]) is type(value)
+
+def test_trouble_locations_round_trip():
+    locations = [
+        {"recording_needed": True, "id": "101", "location": "Main Street Substation", "verbiage": "mayn street"},
+        {"recording_needed": False, "id": "102", "location": "Harbor Yard", "verbiage": "har-ber yard"}
+    ]
+    imported = _round_trip(SIGState(trouble_locations=[dict(row) for row in locations]))
+    assert imported["trouble_locations"] == locations
+
+def test_only_sheets_in_the_workbook_are_imported():
+    imported = _round_trip(SIGState())
+    assert "responses" not in imported
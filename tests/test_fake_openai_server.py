@@ -0,0 +1,75 @@
+# ============================================================================
+# ARCOS SIG Form Application - Fake OpenAI Server Tests
+# ============================================================================
+# This file tests that the fake server answers structured-output requests
+# with a document that fits the schema and reports usage on streams.
+# ============================================================================
+
+import re
+import json
+import threading
+import openai
+import pytest
+from app.sig_review import REVIEW_SCHEMA, validate_review_findings
+from tools.fake_openai_server import FakeOpenAIServer, schema_example
+
+@pytest.fixture
+def server():
+    server = FakeOpenAIServer(("127.0.0.1", 0), latency=lambda rng: 0.0, tokens_per_second=0.0,
+                              rate_limit_rate=0.0, error_rate=0.0, seed=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def _client(server):
+    return openai.OpenAI(api_key="test", base_url=f"http://127.0.0.1:{server.server_address[1]}/v1", max_retries=0)
+
+def test_schema_example_fills_required_properties_only():
+    schema = {
+        "type": "object",
+        "properties": {
+            "items": {"type": "array", "items": {"type": "string"}},
+            "name": {"type": "string"},
+            "level": {"type": "string", "enum": ["high", "low"]},
+            "count": {"type": "integer", "minimum": 1},
+            "note": {"type": ["string", "null"]},
+            "flag": {"type": "boolean"}
+        },
+        "required": ["items", "level", "count", "note", "flag"]
+    }
+    assert schema_example(schema) == {"items": [], "level": "high", "count": 1, "note": "", "flag": False}
+
+def test_structured_request_gets_a_document_that_fits_the_schema(server):
+    response = _client(server).chat.completions.create(
+        model="test-model",
+        messages=[{"role": "user", "content": "Review this"}],
+        response_format={"type": "json_schema", "json_schema": {"name": "review", "schema": REVIEW_SCHEMA}}
+    )
+    document = json.loads(response.choices[0].message.content)
+    assert validate_review_findings(document) == []
+
+def test_canned_json_answer_overrides_the_schema_example(server):
+    server.canned_responses = [(re.compile("Review"), json.dumps({"findings": ["x"]}))]
+    response = _client(server).chat.completions.create(
+        model="test-model",
+        messages=[{"role": "user", "content": "Review this"}],
+        response_format={"type": "json_schema", "json_schema": {"name": "review", "schema": REVIEW_SCHEMA}}
+    )
+    assert json.loads(response.choices[0].message.content) == {"findings": ["x"]}
+
+def test_stream_ends_with_usage_when_requested(server):
+    chunks = list(_client(server).chat.completions.create(
+        model="test-model", messages=[{"role": "user", "content": "What is a SIG?"}],
+        stream=True, stream_options={"include_usage": True}
+    ))
+    assert chunks[-1].choices == []
+    assert chunks[-1].usage.prompt_tokens == 4
+    assert chunks[-1].usage.completion_tokens > 0
+
+def test_stream_has_no_usage_chunk_by_default(server):
+    chunks = list(_client(server).chat.completions.create(
+        model="test-model", messages=[{"role": "user", "content": "What is a SIG?"}], stream=True
+    ))
+    assert all(chunk.usage is None for chunk in chunks)
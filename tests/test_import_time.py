@@ -0,0 +1,14 @@
+# ============================================================================
+# ARCOS SIG Form Application - Import Time Tests
+# ============================================================================
+# This file fails the test run when importing the app's entry point exceeds
+# the startup budget of benchmarks/check_import_time.py, or imports a module
+# that should only be loaded by the code paths that use it.
+# ============================================================================
+
+from benchmarks.check_import_time import check_import_time, DEFAULT_BUDGET_SECONDS
+
+def test_main_imports_within_budget():
+    result = check_import_time(budget=DEFAULT_BUDGET_SECONDS)
+    assert not result["eager"], f"Imported at startup but should be deferred: {result['eager']}"
+    assert result["ok"], f"import main took {result['seconds'] * 1000:.0f} ms (budget {DEFAULT_BUDGET_SECONDS * 1000:.0f} ms)"
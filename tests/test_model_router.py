@@ -0,0 +1,138 @@
+# ============================================================================
+# ARCOS SIG Form Application - Model Router Tests
+# ============================================================================
+# This file tests how requests are routed between the fast and the large
+# model, and when a failed route falls back to the other one.
+# ============================================================================
+
+import time
+import asyncio
+import pytest
+import app.openai_client as openai_client
+from app.openai_client import _route_plan, _call_routes, _call_with_retries
+from app.openai_resilience import (
+    AssistantUnavailableError, CircuitBreaker, CircuitOpenError, RateLimiterBusyError, InvalidAnswerError
+)
+from app.config import MODEL_ROUTES, DEFAULT_MODEL
+
+def test_help_uses_the_fast_route_with_the_large_one_as_fallback():
+    plan = _route_plan("What is CTT?", None, None, "", "help")
+    assert [route["route"] for route in plan] == ["fast", "large"]
+    assert plan[0]["model"] == MODEL_ROUTES["fast"]["model"]
+    assert plan[0]["max_tokens"] == MODEL_ROUTES["fast"]["max_tokens"]
+
+def test_complex_questions_use_the_large_route():
+    plan = _route_plan("Compare the callout rotation options", None, None, "", None)
+    assert [route["route"] for route in plan] == ["large", "fast"]
+
+def test_a_model_chosen_by_the_caller_has_no_fallback():
+    plan = _route_plan("What is CTT?", "my-model", 123, "", "help")
+    assert plan == [{"route": "fixed", "model": "my-model", "max_tokens": 123, "deadline": None}]
+
+def test_disabled_router_uses_the_default_model(monkeypatch):
+    monkeypatch.setattr(openai_client, "MODEL_ROUTER_ENABLED", False)
+    plan = _route_plan("What is CTT?", None, None, "", "help")
+    assert [(route["route"], route["model"]) for route in plan] == [("fixed", DEFAULT_MODEL)]
+
+PLAN = [
+    {"route": "fast", "model": "fast-model", "max_tokens": 10, "deadline": None},
+    {"route": "large", "model": "large-model", "max_tokens": 10, "deadline": None}
+]
+
+def _run_routes(failures, progress=None, served=None):
+    """Run PLAN where each route raises its entry of failures (None succeeds); return (result, routes called)"""
+    called = []
+
+    def call_route(route, route_deadline, metrics):
+        async def call():
+            called.append(route["route"])
+            error = failures.get(route["route"])
+            if error is not None:
+                raise error
+            return route["route"]
+        return call()
+
+    async def run():
+        return await _call_routes("completion", PLAN, time.monotonic() + 10, call_route, progress, served)
+
+    try:
+        return asyncio.run(run()), called
+    except AssistantUnavailableError as e:
+        return e, called
+
+def _api_failure():
+    try:
+        raise ConnectionError("connection reset")
+    except ConnectionError as cause:
+        try:
+            raise AssistantUnavailableError("Could not connect to the AI service.") from cause
+        except AssistantUnavailableError as e:
+            return e
+
+def test_api_failure_falls_back_to_the_next_route():
+    assert _run_routes({"fast": _api_failure()}) == ("large", ["fast", "large"])
+
+def test_served_names_the_route_that_answered():
+    served = {}
+    _run_routes({"fast": _api_failure()}, served=served)
+    assert served == {"route": "large", "model": "large-model"}
+
+def test_answer_in_the_wrong_format_falls_back():
+    assert _run_routes({"fast": InvalidAnswerError("not valid JSON")}) == ("large", ["fast", "large"])
+
+def test_open_circuit_does_not_fall_back():
+    result, called = _run_routes({"fast": CircuitOpenError("circuit open")})
+    assert isinstance(result, CircuitOpenError) and called == ["fast"]
+
+def test_busy_rate_limiter_does_not_fall_back():
+    result, called = _run_routes({"fast": RateLimiterBusyError("busy")})
+    assert isinstance(result, RateLimiterBusyError) and called == ["fast"]
+
+def test_started_stream_does_not_fall_back():
+    result, called = _run_routes({"fast": _api_failure()}, progress={"started": True})
+    assert isinstance(result, AssistantUnavailableError) and called == ["fast"]
+
+def test_failure_on_the_last_route_is_raised():
+    result, called = _run_routes({"fast": _api_failure(), "large": _api_failure()})
+    assert isinstance(result, AssistantUnavailableError) and called == ["fast", "large"]
+
+class _NeverGrantingLimiter:
+    async def acquire(self, session_id):
+        await asyncio.Event().wait()
+
+def _runtime(limiter):
+    return {
+        "breaker": CircuitBreaker(failure_threshold=1, reset_seconds=60),
+        "limiter": limiter,
+        "settings": {"max_attempts": 3, "backoff_base": 0.01, "backoff_max": 0.01}
+    }
+
+def test_rate_limiter_timeout_is_not_retried_on_another_route():
+    runtime = _runtime(_NeverGrantingLimiter())
+    called = []
+
+    def call_route(route, route_deadline, metrics):
+        async def attempt(remaining):
+            called.append(route["route"])
+        return _call_with_retries(runtime, route_deadline, attempt, session_id="s", metrics=metrics)
+
+    plan = [dict(route, deadline=0.05) for route in PLAN]
+    with pytest.raises(RateLimiterBusyError):
+        asyncio.run(_call_routes("completion", plan, time.monotonic() + 1, call_route))
+    assert called == []
+    # Waiting on our own limiter says nothing about the API's health
+    assert runtime["breaker"].state == "closed"
+
+def test_invalid_answer_does_not_count_against_the_circuit():
+    class Limiter:
+        async def acquire(self, session_id):
+            return None
+
+    runtime = _runtime(Limiter())
+
+    async def attempt(remaining):
+        raise InvalidAnswerError("not valid JSON")
+
+    with pytest.raises(InvalidAnswerError):
+        asyncio.run(_call_with_retries(runtime, time.monotonic() + 1, attempt))
+    assert runtime["breaker"].state == "closed"
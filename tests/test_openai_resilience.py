@@ -0,0 +1,180 @@
+# ============================================================================
+# ARCOS SIG Form Application - OpenAI Resilience Tests
+# ============================================================================
+# This file tests the circuit breaker, backoff, request coalescing and rate
+# limiting used by the assistant's API calls.
+# ============================================================================
+
+import asyncio
+import pytest
+from app.openai_resilience import CircuitBreaker, CircuitOpenError, SingleFlight, FairRateLimiter, backoff_delay
+
+def _fail(breaker, times):
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure()
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    _fail(breaker, 2)
+    assert breaker.state == "closed"
+    _fail(breaker, 1)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    _fail(breaker, 1)
+    breaker.record_success()
+    _fail(breaker, 1)
+    assert breaker.state == "closed"
+
+def test_half_open_lets_one_trial_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    _fail(breaker, 1)
+    assert breaker.state == "half-open"
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+def test_failed_trial_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=5, reset_seconds=0)
+    _fail(breaker, 5)
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.reset_seconds = 60
+    assert breaker.state == "open"
+
+def test_released_trial_lets_another_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    _fail(breaker, 1)
+    breaker.before_call()
+    breaker.release_trial()
+    breaker.before_call()
+
+def test_backoff_delay_is_capped_and_honours_retry_after():
+    for attempt in range(1, 10):
+        assert 0 <= backoff_delay(attempt, base=0.5, cap=4.0) <= min(4.0, 0.5 * 2 ** (attempt - 1))
+
+    class Response:
+        headers = {"retry-after": "2"}
+
+    class Error(Exception):
+        response = Response()
+
+    assert backoff_delay(1, base=0.5, cap=4.0, error=Error()) == 2.0
+    Response.headers = {"retry-after": "30"}
+    assert backoff_delay(1, base=0.5, cap=4.0, error=Error()) == 4.0
+
+def test_singleflight_shares_one_call_between_identical_requests():
+    events = []
+    flight = SingleFlight(on_call=events.append)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    async def run():
+        return await asyncio.gather(flight.do("key", call), flight.do("key", call), flight.do("other", call))
+
+    assert asyncio.run(run()) == ["answer", "answer", "answer"]
+    assert len(calls) == 2
+    assert (flight.started, flight.coalesced) == (2, 1)
+    assert sorted(events) == ["hit", "miss", "miss"]
+
+def test_singleflight_raises_the_shared_error_to_every_caller():
+    flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream failed")
+
+    async def run():
+        return await asyncio.gather(flight.do("key", call), flight.do("key", call), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.started == 1
+
+def test_singleflight_cancelled_caller_leaves_the_others_waiting():
+    flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def run():
+        first = asyncio.ensure_future(flight.do("key", call))
+        second = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second, first.cancelled()
+
+    assert asyncio.run(run()) == ("answer", True)
+
+def test_singleflight_cancels_the_call_when_every_caller_has_gone():
+    flight = SingleFlight()
+    finished = []
+
+    async def call():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+
+    async def run():
+        caller = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+    assert finished == []
+    assert flight.started == 1
+
+def test_rate_limiter_serves_waiting_sessions_in_turn():
+    limiter = FairRateLimiter(requests_per_minute=6000, burst=1)
+    granted = []
+
+    async def request(session_id):
+        await limiter.acquire(session_id)
+        granted.append(session_id)
+
+    async def run():
+        await limiter.acquire("busy")
+        # The busy session queues twice before the other session asks once
+        tasks = [asyncio.ensure_future(request(s)) for s in ("busy", "busy", "busy", "other")]
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert granted == ["busy", "other", "busy", "busy"]
+
+def test_rate_limiter_returns_the_token_of_a_caller_cancelled_after_its_grant():
+    limiter = FairRateLimiter(requests_per_minute=1, burst=1)
+
+    async def run():
+        await limiter.acquire("s1")
+        waiter = asyncio.ensure_future(limiter.acquire("s1"))
+        await asyncio.sleep(0)
+        # Grant the token, then cancel before the caller resumes
+        limiter._tokens = 1.0
+        limiter._dispatch()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert waiter.cancelled()
+        await asyncio.wait_for(limiter.acquire("s2"), timeout=0.5)
+
+    asyncio.run(run())
+
+def test_rate_limiter_with_zero_rate_never_waits():
+    limiter = FairRateLimiter(requests_per_minute=0, burst=1)
+
+    async def run():
+        for _ in range(100):
+            await asyncio.wait_for(limiter.acquire("s1"), timeout=0.5)
+
+    asyncio.run(run())
@@ -0,0 +1,65 @@
+# ============================================================================
+# ARCOS SIG Form Application - Pronunciation Tests
+# ============================================================================
+# This file tests the rule-based pronunciation generator for trouble
+# location verbiage.
+# ============================================================================
+
+from app.pronunciation import respell_word, suggest_pronunciation, fill_pronunciations
+
+def test_place_name_endings_and_spelling_rules():
+    assert respell_word("Rockford") == "rok-ferd"
+    assert respell_word("Knoxville") == "noks-vil"
+    assert respell_word("McHenry") == "muhk-hen-ree"
+
+def test_exceptions_override_the_rules():
+    assert respell_word("Chicago") == "shuh-kah-goh"
+    assert respell_word("houston") == "hyoo-stuhn"
+
+def test_short_codes_are_spelled_out_and_numbers_kept():
+    assert respell_word("OPC") == "oh-pee-see"
+    assert respell_word("12") == "12"
+
+def test_suggest_pronunciation_respells_each_word():
+    assert suggest_pronunciation("Paxton Sub 12") == "pak-stuhn sub-stay-shuhn 12"
+    assert suggest_pronunciation("  ") == ""
+
+def test_street_abbreviations():
+    assert suggest_pronunciation("Main St") == "mayn street"
+    assert suggest_pronunciation("Elm St Substation") == "elm street sub-stay-shuhn"
+    assert suggest_pronunciation("Oak Dr") == "ohk dryv"
+    assert suggest_pronunciation("Lake Pkwy") == "layk park-way"
+
+def test_leading_st_is_saint():
+    assert suggest_pronunciation("St Charles").startswith("saynt ")
+
+def test_words_without_vowels_are_spelled_out():
+    assert respell_word("Xr") == "eks-ar"
+
+def _location(name, verbiage="", recording_needed=True):
+    return {"recording_needed": recording_needed, "id": "", "location": name, "verbiage": verbiage}
+
+def test_fill_pronunciations_fills_only_missing_verbiage():
+    rows = [
+        _location("Rockford"),
+        _location("Knoxville", verbiage="nox-vill"),
+        _location("Chicago", recording_needed=False),
+        _location("")
+    ]
+    updated, changed = fill_pronunciations(rows)
+    assert changed == [0]
+    assert updated[0]["verbiage"] == "rok-ferd"
+    assert updated[1:] == rows[1:]
+    # The input rows are not modified
+    assert rows[0]["verbiage"] == ""
+
+def test_fill_pronunciations_overwrite_replaces_existing_verbiage():
+    rows = [_location("Knoxville", verbiage="nox-vill"), _location("Rockford", verbiage="rok-ferd")]
+    updated, changed = fill_pronunciations(rows, overwrite=True)
+    assert changed == [0]
+    assert [row["verbiage"] for row in updated] == ["noks-vil", "rok-ferd"]
+
+def test_fill_pronunciations_respells_repeated_names_alike():
+    updated, changed = fill_pronunciations([_location("Rockford"), _location(" Rockford ")])
+    assert changed == [0, 1]
+    assert updated[0]["verbiage"] == updated[1]["verbiage"] == "rok-ferd"
@@ -0,0 +1,78 @@
+# ============================================================================
+# ARCOS SIG Form Application - Similar Question Cache Tests
+# ============================================================================
+# This file tests question normalization and the reuse of answers to
+# near-duplicate questions.
+# ============================================================================
+
+from app.question_cache import QuestionCache, normalize_question, question_scope, jaccard
+
+def test_normalize_question_ignores_case_punctuation_and_contractions():
+    assert normalize_question("What is CTT?") == normalize_question("what's the ctt")
+    assert normalize_question("Which codes are used?") == normalize_question("used codes are which")
+
+def test_normalize_question_keeps_interrogatives_and_verbs():
+    questions = ["What is CTT?", "How should I set up CTT?", "Why do we need CTT?", "Where is CTT?"]
+    assert len({tuple(normalize_question(q)) for q in questions}) == len(questions)
+    assert normalize_question("How should I set up CTT?") == ["ctt", "how", "set", "should", "up"]
+
+def test_jaccard():
+    assert jaccard(set(), set()) == 1.0
+    assert jaccard({1, 2}, {2, 3}) == 1 / 3
+
+def test_same_question_after_normalization_is_reused():
+    cache = QuestionCache()
+    scope = question_scope("Additions", "summary")
+    cache.set("What is CTT?", scope, "Closest to Trouble")
+    hit = cache.get("what's the CTT", scope)
+    assert hit == {"answer": "Closest to Trouble", "question": "What is CTT?", "similarity": 1.0}
+
+def test_different_questions_about_the_same_topic_are_not_reused():
+    cache = QuestionCache()
+    scope = question_scope("Additions")
+    cache.set("What is CTT?", scope, "Closest to Trouble")
+    for question in ["How should I set up CTT?", "Why do we need CTT?", "Where is CTT?"]:
+        assert cache.get(question, scope) is None
+
+def test_near_duplicate_question_is_reused():
+    cache = QuestionCache()
+    scope = question_scope("Additions")
+    cache.set("How do I configure the callout rotation for linemen?", scope, "answer")
+    hit = cache.get("How do I configure callout rotations for the linemen", scope)
+    assert hit is not None and hit["answer"] == "answer"
+
+def test_numbers_and_negations_must_match():
+    cache = QuestionCache(min_similarity=0.5)
+    scope = question_scope("Additions")
+    cache.set("Can a callout use 3 rosters?", scope, "three")
+    cache.set("Should the pointer reset after a callout?", scope, "reset")
+    assert cache.get("Can a callout use 4 rosters?", scope) is None
+    assert cache.get("Should the pointer not reset after a callout?", scope) is None
+
+def test_answers_are_scoped_to_the_tab_and_form_data():
+    cache = QuestionCache()
+    cache.set("What is CTT?", question_scope("Additions", "a"), "answer")
+    assert cache.get("What is CTT?", question_scope("Additions", "b")) is None
+    assert cache.get("What is CTT?", question_scope("Event Types", "a")) is None
+
+def test_expired_and_evicted_entries_are_misses():
+    cache = QuestionCache(ttl_seconds=-1)
+    cache.set("What is CTT?", "scope", "answer")
+    assert cache.get("What is CTT?", "scope") is None
+
+    cache = QuestionCache(max_entries=2)
+    for question in ["What is CTT?", "What is a roster?", "What is a pointer?"]:
+        cache.set(question, "scope", question)
+    assert cache.get("What is CTT?", "scope") is None
+    assert cache.get("What is a pointer?", "scope") is not None
+    assert cache.stats()["entries"] == 2
+
+def test_stats_count_hits_and_misses():
+    cache = QuestionCache()
+    cache.set("What is CTT?", "scope", "answer")
+    cache.get("What is CTT?", "scope")
+    cache.get("What is a roster?", "scope")
+    stats = cache.stats()
+    assert (stats["exact"], stats["miss"], stats["hit_rate"]) == (1, 1, 0.5)
+    cache.clear()
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,52 @@
+# ============================================================================
+# ARCOS SIG Form Application - Retrieval Tests
+# ============================================================================
+# This file tests the tokenizer, the BM25 index and the local answers given
+# from the SIG guide.
+# ============================================================================
+
+from app.retrieval import tokenize, BM25Index, find_local_answer, format_snippets
+
+def _document(doc_id, title, text, answerable=True):
+    return {"id": doc_id, "tab": "Additions", "title": title, "text": text, "answerable": answerable}
+
+DOCUMENTS = [
+    _document("ctt", "Closest to Trouble", "Closest to Trouble sorts employees by distance from the trouble location."),
+    _document("pointer", "Roster Pointer", "The pointer remembers where the last callout stopped on a roster."),
+    _document("blast", "Blast Calling", "Blast calling dials every employee on the roster at once."),
+    _document("questions", "Roster questions", "Which roster order do you use? Do you use a pointer?", answerable=False)
+]
+
+def test_tokenize_drops_stopwords_and_plurals():
+    assert tokenize("What are the Codes for these zones?") == ["code", "zone"]
+    assert tokenize("how do I set up", stopwords=frozenset()) == ["how", "do", "i", "set", "up"]
+
+def test_search_ranks_the_matching_document_first():
+    results = BM25Index(DOCUMENTS).search("roster pointer")
+    assert results[0]["document"]["id"] == "pointer"
+    assert results[0]["confidence"] == 1.0
+    assert [r["score"] for r in results] == sorted((r["score"] for r in results), reverse=True)
+
+def test_search_without_known_terms_finds_nothing():
+    index = BM25Index(DOCUMENTS)
+    assert index.search("what is the") == []
+    assert index.search("paycode") == []
+    assert BM25Index([]).search("roster") == []
+
+def test_confident_match_is_answered_locally():
+    answer = find_local_answer(BM25Index(DOCUMENTS).search("blast calling"))
+    assert answer.startswith("**Blast Calling**")
+
+def test_partial_match_needs_the_model():
+    results = BM25Index(DOCUMENTS).search("blast calling overtime paycode")
+    assert results and find_local_answer(results) is None
+
+def test_question_lists_are_never_answers():
+    documents = [_document("questions", "Callout questions", "Which callout types do you use?", answerable=False)]
+    assert find_local_answer(BM25Index(documents).search("callout types")) is None
+
+def test_snippets_quote_each_result():
+    results = BM25Index(DOCUMENTS).search("roster")
+    snippets = format_snippets(results)
+    assert all(f"[{r['document']['title']}]" in snippets for r in results)
+    assert format_snippets([]) == ""
@@ -0,0 +1,116 @@
+# ============================================================================
+# ARCOS SIG Form Application - SIG Review Tests
+# ============================================================================
+# This file tests how the SIG data is split into review requests and how the
+# findings returned by the model are checked and grouped.
+# ============================================================================
+
+import json
+import pytest
+import app.sig_review as sig_review
+from app.assistant_context import count_tokens
+from app.help_cache import HelpCache
+from app.openai_resilience import BackgroundEventLoop
+from app.sig_review import (
+    chunk_review_snapshot, review_cache_key, validate_review_findings, group_review_findings, review_sig
+)
+from app.config import SIG_REVIEW_MAX_FINDINGS_PER_TAB, SIG_REVIEW_MAX_MESSAGE_LENGTH, MODEL_ROUTES
+
+def _snapshot(rows):
+    return {
+        "Trouble Locations": {
+            "trouble_locations": {
+                "columns": ["id", "location", "verbiage"],
+                "rows": [[str(i), f"Location {i}", f"loh-kay-shuhn {i}"] for i in range(rows)]
+            }
+        },
+        "Event Types": {
+            "event_types": {"columns": ["id", "description"], "rows": [["1", "Storm"], ["2", "Outage"]]}
+        }
+    }
+
+def _rows(chunks, tab_name, table_name):
+    return [row for chunk in chunks for row in chunk.get(tab_name, {}).get(table_name, {}).get("rows", [])]
+
+def test_small_snapshot_is_one_request():
+    snapshot = _snapshot(5)
+    assert chunk_review_snapshot(snapshot, max_tokens=6000) == [snapshot]
+
+def test_large_table_is_split_between_rows():
+    snapshot = _snapshot(200)
+    chunks = chunk_review_snapshot(snapshot, max_tokens=300)
+    assert len(chunks) > 1
+    assert _rows(chunks, "Trouble Locations", "trouble_locations") == snapshot["Trouble Locations"]["trouble_locations"]["rows"]
+    assert _rows(chunks, "Event Types", "event_types") == snapshot["Event Types"]["event_types"]["rows"]
+    for chunk in chunks:
+        for tables in chunk.values():
+            for table in tables.values():
+                assert table["columns"] and table["rows"]
+        # Rows and headers are counted separately, so allow for the JSON punctuation
+        assert count_tokens(json.dumps(chunk, separators=(",", ":"))) <= 300 * 1.5
+
+def test_row_larger_than_the_budget_gets_its_own_request():
+    snapshot = {"Additions": {"responses": {"columns": ["setting", "value"], "rows": [["notes", "word " * 500]]}}}
+    assert chunk_review_snapshot(snapshot, max_tokens=50) == [snapshot]
+
+def test_empty_snapshot_needs_no_request():
+    assert chunk_review_snapshot({}) == []
+
+def test_cache_key_changes_with_the_data():
+    assert review_cache_key(_snapshot(3)) == review_cache_key(_snapshot(3))
+    assert review_cache_key(_snapshot(3)) != review_cache_key(_snapshot(4))
+
+def test_invalid_findings_are_dropped_and_long_messages_shortened():
+    data = {"findings": [
+        {"tab": "Event Types", "severity": "error", "item": "ID 1", "message": " Duplicate ID "},
+        {"tab": "No Such Tab", "severity": "error", "item": "", "message": "unknown tab"},
+        {"tab": "Event Types", "severity": "fatal", "item": "", "message": "unknown severity"},
+        {"tab": "Event Types", "severity": "warning", "item": "", "message": "  "},
+        "not a finding",
+        {"tab": "Additions", "severity": "suggestion", "item": None, "message": "x" * 1000}
+    ]}
+    findings = validate_review_findings(data)
+    assert findings[0] == {"tab": "Event Types", "severity": "error", "item": "ID 1", "message": "Duplicate ID"}
+    assert findings[1]["item"] == "" and len(findings[1]["message"]) == SIG_REVIEW_MAX_MESSAGE_LENGTH
+    assert len(findings) == 2
+    assert validate_review_findings({"findings": "none"}) == []
+    assert validate_review_findings(None) == []
+
+def test_findings_are_grouped_by_tab_most_severe_first():
+    def finding(severity, message, tab="Event Types"):
+        return {"tab": tab, "severity": severity, "item": "", "message": message}
+
+    findings = [finding("suggestion", "c"), finding("error", "a"), finding("warning", "b"), finding("error", "a"),
+                finding("error", "d", tab="Additions")]
+    findings += [finding("suggestion", str(i)) for i in range(SIG_REVIEW_MAX_FINDINGS_PER_TAB)]
+    grouped = group_review_findings(findings)
+    assert [f["message"] for f in grouped["Event Types"][:3]] == ["a", "b", "c"]
+    assert len(grouped["Event Types"]) == SIG_REVIEW_MAX_FINDINGS_PER_TAB
+    assert grouped["Additions"] == [finding("error", "d", tab="Additions")]
+
+@pytest.fixture
+def review_runtime(monkeypatch):
+    """Answer review requests with one finding, from the model in answered_by["model"]"""
+    answered_by = {"model": MODEL_ROUTES["large"]["model"]}
+    loop = BackgroundEventLoop(name="test-review-loop")
+
+    async def request_structured_output(runtime, messages, *args, served=None, **kwargs):
+        served.update(route="test", model=answered_by["model"])
+        return {"findings": [{"tab": "Event Types", "severity": "warning", "item": "", "message": "Check"}]}
+
+    monkeypatch.setattr(sig_review, "get_openai_runtime", lambda: {"loop": loop})
+    monkeypatch.setattr(sig_review, "request_structured_output", request_structured_output)
+    return answered_by
+
+def test_review_by_the_large_model_is_cached(review_runtime, tmp_path):
+    cache = HelpCache(path=str(tmp_path / "review.sqlite3"))
+    first = review_sig(_snapshot(3), cache=cache, session_id="test")
+    assert first["requests"] == 1 and first["findings"]["Event Types"]
+    second = review_sig(_snapshot(3), cache=cache, session_id="test")
+    assert second["requests"] == 0 and second["findings"] == first["findings"]
+
+def test_review_by_a_fallback_model_is_not_cached(review_runtime, tmp_path):
+    review_runtime["model"] = MODEL_ROUTES["fast"]["model"]
+    cache = HelpCache(path=str(tmp_path / "review.sqlite3"))
+    review_sig(_snapshot(3), cache=cache, session_id="test")
+    assert review_sig(_snapshot(3), cache=cache, session_id="test")["requests"] == 1
@@ -0,0 +1,6 @@
+# ============================================================================
+# ARCOS SIG Form Application - Tools Package
+# ============================================================================
+# This package contains command-line tools that run outside of Streamlit.
+# Run them from the repository root, e.g. 'python -m tools.batch_export'.
+# ============================================================================
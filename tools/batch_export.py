@@ -0,0 +1,155 @@
+# ============================================================================
+# ARCOS SIG Form Application - Batch Export Tool
+# ============================================================================
+# This file contains a headless command-line tool that regenerates the CSV and
+# Excel exports for many saved SIG state files. Each file is exported in its
+# own worker process and a timing summary is written when all are done.
+#
+# Usage (from the repository root):
+#   python -m tools.batch_export saved_states/ --output-dir exports --workers 8
+# ============================================================================
+
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Output format mapped to its file extension
+EXPORT_FORMATS = {
+    "csv": "csv",
+    "xlsx": "xlsx"
+}
+
+def find_state_files(paths):
+    """
+    Expand the given files and directories into a sorted list of state files
+
+    Args:
+        paths (list): JSON state files or directories containing them
+
+    Returns:
+        list: Paths of the JSON state files to export
+    """
+    state_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            state_files.extend(glob.glob(os.path.join(path, "*.json")))
+        else:
+            state_files.append(path)
+    return sorted(set(state_files))
+
+def export_state_file(state_path, output_dir, formats):
+    """
+    Export one saved SIG state file. Runs inside a worker process.
+
+    Args:
+        state_path (str): Path of the JSON state file
+        output_dir (str): Directory the exports are written to
+        formats (list): Output formats to write ("csv", "xlsx")
+
+    Returns:
+        dict: Timing and output details for the summary
+    """
+    # Imported here so each worker process loads the exporters itself
+    from app.sig_state import SIGState
+    from app.exporters.csv_exporter import export_to_csv
+    from app.exporters.excel_exporter import export_to_excel
+
+    exporters = {"csv": export_to_csv, "xlsx": export_to_excel}
+    name = os.path.splitext(os.path.basename(state_path))[0]
+    result = {"state_file": state_path, "outputs": {}, "timings": {}, "error": None}
+
+    try:
+        start = time.perf_counter()
+        state = SIGState.load(state_path)
+        result["timings"]["load"] = time.perf_counter() - start
+
+        for export_format in formats:
+            start = time.perf_counter()
+            data = exporters[export_format](state)
+            output_path = os.path.join(output_dir, f"{name}.{EXPORT_FORMATS[export_format]}")
+            with open(output_path, 'wb') as file:
+                file.write(data)
+            result["timings"][export_format] = time.perf_counter() - start
+            result["outputs"][export_format] = output_path
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {str(e)}"
+
+    return result
+
+def run_batch_export(state_files, output_dir, formats, workers=None):
+    """
+    Export all state files across a process pool
+
+    Args:
+        state_files (list): Paths of the JSON state files
+        output_dir (str): Directory the exports are written to
+        formats (list): Output formats to write
+        workers (int): Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        dict: Summary with per-file results and overall timing
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(export_state_file, path, output_dir, formats) for path in state_files]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "ERROR " + result["error"] if result["error"] else "ok"
+            print(f"{result['state_file']}: {status}")
+            results.append(result)
+
+    results.sort(key=lambda r: r["state_file"])
+    total_seconds = time.perf_counter() - start
+    succeeded = [r for r in results if not r["error"]]
+
+    return {
+        "state_files": len(state_files),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "workers": workers or os.cpu_count(),
+        "total_seconds": total_seconds,
+        "format_seconds": {
+            export_format: sum(r["timings"].get(export_format, 0.0) for r in succeeded)
+            for export_format in formats
+        },
+        "results": results
+    }
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Regenerate SIG exports for saved SIG state files without Streamlit.")
+    parser.add_argument("paths", nargs="+", help="JSON state files or directories containing them")
+    parser.add_argument("--output-dir", default="exports", help="Directory for the exported files (default: exports)")
+    parser.add_argument("--formats", nargs="+", choices=sorted(EXPORT_FORMATS), default=["csv", "xlsx"],
+                        help="Formats to export (default: csv xlsx)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--summary", default=None,
+                        help="Path of the JSON timing summary (default: <output-dir>/batch_export_summary.json)")
+    args = parser.parse_args(argv)
+
+    state_files = find_state_files(args.paths)
+    if not state_files:
+        parser.error("no state files found")
+
+    summary = run_batch_export(state_files, args.output_dir, args.formats, args.workers)
+
+    summary_path = args.summary or os.path.join(args.output_dir, "batch_export_summary.json")
+    with open(summary_path, 'w') as file:
+        json.dump(summary, file, indent=2)
+
+    print(f"Exported {summary['succeeded']} of {summary['state_files']} state file(s) "
+          f"in {summary['total_seconds']:.2f}s using {summary['workers']} worker(s)")
+    for export_format, seconds in summary["format_seconds"].items():
+        print(f"  {export_format}: {seconds:.2f}s total")
+    print(f"Summary written to {summary_path}")
+
+    return 1 if summary["failed"] else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
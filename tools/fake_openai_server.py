@@ -0,0 +1,335 @@
+# ============================================================================
+# ARCOS SIG Form Application - Fake OpenAI Server
+# ============================================================================
+# This file contains a local HTTP server that speaks the OpenAI chat
+# completions API (plain and streaming) for load tests and offline
+# benchmarks. Latency, token rate, rate limiting and server errors are
+# configurable, so retry, caching and throughput behavior can be measured
+# without calling the real API. Structured-output requests get a minimal
+# document that fits their JSON schema, and streams end with a usage chunk
+# when the client asks for one.
+#
+# Usage (from the repository root):
+#   python -m tools.fake_openai_server --port 8001 --latency lognormal:0.8,0.5 \
+#       --tokens-per-second 40 --rate-limit-rate 0.05 --error-rate 0.02
+#
+# Then point the app at it in .streamlit/secrets.toml:
+#   OPENAI_BASE_URL = "http://127.0.0.1:8001/v1"
+# ============================================================================
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_RESPONSE = (
+    "This is a simulated answer from the local test server. When configuring {topic} in ARCOS, "
+    "review the descriptions in the SIG guide, agree on naming conventions with your team, "
+    "and confirm the values with your ARCOS implementation consultant before go-live."
+)
+
+def parse_latency(spec):
+    """
+    Parse a latency distribution specification
+
+    Args:
+        spec (str): 'fixed:S', 'uniform:MIN,MAX', 'normal:MEAN,STD' or
+            'lognormal:MEDIAN,SIGMA', all in seconds (a bare number means fixed)
+
+    Returns:
+        callable: Takes a random.Random and returns a delay in seconds
+    """
+    kind, _, args = spec.partition(":")
+    if not args:
+        kind, args = "fixed", kind
+    values = [float(v) for v in args.split(",")]
+
+    if kind == "fixed":
+        return lambda rng: values[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        import math
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    raise ValueError(f"unknown latency distribution '{kind}'")
+
+def schema_example(schema):
+    """
+    Build the smallest document that fits a JSON schema
+
+    Required object properties are filled in, arrays are empty, strings take
+    their first enum value (or are empty) and numbers their minimum (or 0).
+
+    Args:
+        schema (dict): JSON schema, as sent in response_format
+
+    Returns:
+        The example document
+    """
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "const" in schema:
+        return schema["const"]
+    for key in ("anyOf", "oneOf"):
+        if schema.get(key):
+            return schema_example(schema[key][0])
+    schema_type = schema.get("type", "object")
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != "null"), "null")
+    if schema_type == "object":
+        properties = schema.get("properties", {})
+        return {name: schema_example(properties.get(name, {})) for name in schema.get("required", [])}
+    if schema_type == "array":
+        return []
+    if schema_type in ("number", "integer"):
+        return schema.get("minimum", 0)
+    return {"string": "", "boolean": False}.get(schema_type)
+
+def load_canned_responses(path):
+    """
+    Load canned responses from a JSON file
+
+    The file maps a regular expression to the answer returned when the last
+    user message matches it, e.g. {"(?i)time zone": "Use ET, CT, MT or PT."}.
+    An answer that is a JSON object or array is sent as JSON text, e.g. for
+    structured-output requests.
+
+    Returns:
+        list: (compiled pattern, answer) pairs in file order
+    """
+    with open(path, 'r') as file:
+        return [(re.compile(pattern), answer if isinstance(answer, str) else json.dumps(answer))
+                for pattern, answer in json.load(file).items()]
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    """
+    The server state shared by all request handlers: the simulation
+    settings, a seeded random generator and request counters.
+    """
+    daemon_threads = True
+
+    def __init__(self, address, latency, tokens_per_second, rate_limit_rate, error_rate,
+                 canned_responses=None, seed=None):
+        super().__init__(address, FakeOpenAIHandler)
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.canned_responses = canned_responses or []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "streamed": 0, "rate_limited": 0, "errors": 0, "completed": 0}
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def draw(self):
+        """Draw the outcome and time to first token of one request"""
+        with self._lock:
+            roll = self._random.random()
+            delay = self.latency(self._random)
+        if roll < self.rate_limit_rate:
+            return "rate_limited", delay
+        if roll < self.rate_limit_rate + self.error_rate:
+            return "error", delay
+        return "ok", delay
+
+    def answer_for(self, messages, response_format=None):
+        """
+        Pick the canned answer for a conversation, or the default answer
+
+        A json_schema response format without a matching canned answer gets
+        the schema's minimal example document.
+        """
+        question = next((m.get("content", "") for m in reversed(messages) if m.get("role") == "user"), "")
+        for pattern, answer in self.canned_responses:
+            if pattern.search(question):
+                return answer
+        if (response_format or {}).get("type") == "json_schema":
+            return json.dumps(schema_example(response_format.get("json_schema", {}).get("schema", {})))
+        match = re.search(r"about (.+?) when configuring", question)
+        return DEFAULT_RESPONSE.format(topic=match.group(1) if match else "this")
+
+def _split_tokens(text):
+    """Split text into word-sized pieces that join back to the original"""
+    return re.findall(r"\s*\S+", text)
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Handles /v1/chat/completions, /v1/models and /stats"""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        # Keep the console quiet under load
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "fake-model", "object": "model", "owned_by": "local"}]})
+        elif self.path.rstrip("/") == "/stats":
+            self._send_json(200, self.server.stats)
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Invalid JSON body", "type": "invalid_request_error"}})
+            return
+
+        server = self.server
+        server.count("requests")
+        outcome, delay = server.draw()
+        time.sleep(delay)
+
+        if outcome == "rate_limited":
+            server.count("rate_limited")
+            self._send_json(429, {"error": {"message": "Rate limit reached (simulated)", "type": "rate_limit_error"}},
+                            headers={"Retry-After": "1"})
+            return
+        if outcome == "error":
+            server.count("errors")
+            self._send_json(500, {"error": {"message": "Internal server error (simulated)", "type": "server_error"}})
+            return
+
+        model = request.get("model", "fake-model")
+        answer = server.answer_for(request.get("messages", []), request.get("response_format"))
+        pieces = _split_tokens(answer)
+        max_tokens = request.get("max_tokens")
+        if max_tokens:
+            pieces = pieces[:max_tokens]
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in request.get("messages", []))
+
+        if request.get("stream"):
+            server.count("streamed")
+            include_usage = bool((request.get("stream_options") or {}).get("include_usage"))
+            self._stream(completion_id, model, pieces, prompt_tokens if include_usage else None)
+        else:
+            # Simulate generation time for the whole answer
+            if server.tokens_per_second > 0:
+                time.sleep(len(pieces) / server.tokens_per_second)
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(pieces)},
+                    "finish_reason": "stop"
+                }],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": len(pieces),
+                    "total_tokens": prompt_tokens + len(pieces)
+                }
+            })
+        server.count("completed")
+
+    def _stream(self, completion_id, model, pieces, prompt_tokens=None):
+        """
+        Send the answer as server-sent events at the configured token rate
+
+        Unless prompt_tokens is None, a final chunk without choices reports
+        the usage, like stream_options.include_usage on the real API.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def send(delta, finish_reason=None, usage=None):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [] if usage else [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            }
+            if usage:
+                chunk["usage"] = usage
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        interval = 1.0 / self.server.tokens_per_second if self.server.tokens_per_second > 0 else 0.0
+        try:
+            send({"role": "assistant", "content": ""})
+            for piece in pieces:
+                if interval:
+                    time.sleep(interval)
+                send({"content": piece})
+            send({}, finish_reason="stop")
+            if prompt_tokens is not None:
+                send({}, usage={
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": len(pieces),
+                    "total_tokens": prompt_tokens + len(pieces)
+                })
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client cancelled the stream
+            pass
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Run a local OpenAI-compatible chat completions server for testing.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8001, help="Port to listen on (default: 8001)")
+    parser.add_argument("--latency", default="fixed:0.3",
+                        help="Time to first token: fixed:S, uniform:MIN,MAX, normal:MEAN,STD or "
+                             "lognormal:MEDIAN,SIGMA in seconds (default: fixed:0.3)")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0,
+                        help="Generation speed; 0 sends the answer at once (default: 50)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429 (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 500 (default: 0)")
+    parser.add_argument("--responses", default=None, help="JSON file mapping regular expressions to canned answers")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+    args = parser.parse_args(argv)
+
+    server = FakeOpenAIServer(
+        (args.host, args.port),
+        latency=parse_latency(args.latency),
+        tokens_per_second=args.tokens_per_second,
+        rate_limit_rate=args.rate_limit_rate,
+        error_rate=args.error_rate,
+        canned_responses=load_canned_responses(args.responses) if args.responses else None,
+        seed=args.seed
+    )
+    print(f"Fake OpenAI server listening on http://{args.host}:{args.port}/v1 (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Stopped. Request counts: {json.dumps(server.stats)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
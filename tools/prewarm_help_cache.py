@@ -0,0 +1,202 @@
+# ============================================================================
+# ARCOS SIG Form Application - Help Cache Pre-warm Tool
+# ============================================================================
+# This file contains a headless command-line tool that generates the answer
+# for every contextual help topic ahead of time and stores it in the help
+# cache, so no user waits on a cold model call. Requests run concurrently
+# with asyncio under a bounded concurrency limit.
+#
+# Usage (from the repository root):
+#   OPENAI_API_KEY=... python -m tools.prewarm_help_cache --concurrency 8
+#   python -m tools.prewarm_help_cache --base-url http://127.0.0.1:8001/v1
+# ============================================================================
+
+import argparse
+import asyncio
+import os
+import time
+
+# Tab modules with a "Need Help?" topic select
+HELP_TOPIC_MODULES = [
+    "app.tabs.trouble_locations",
+    "app.tabs.event_types",
+    "app.tabs.callout_type_config",
+    "app.tabs.global_config",
+    "app.tabs.data_interfaces",
+    "app.tabs.additions"
+]
+
+def collect_help_topics():
+    """
+    Enumerate every help topic the app can ask for
+
+    Returns:
+        list: Unique (topic, tab_name) pairs from the tab topic selects and
+        the fields in sig_descriptions.json, in a stable order
+    """
+    import importlib
+    import json
+    from app.config import DESCRIPTIONS_JSON_PATH
+
+    topics = []
+    for module_name in HELP_TOPIC_MODULES:
+        module = importlib.import_module(module_name)
+        topics.extend((topic, module.HELP_TAB_NAME) for topic in module.HELP_TOPICS)
+
+    # The generic tab offers help on each described field of its tab
+    with open(DESCRIPTIONS_JSON_PATH, 'r') as file:
+        descriptions = json.load(file)
+    for tab_name, tab_desc in descriptions.items():
+        topics.extend((field_name, tab_name) for field_name in tab_desc.get("fields", {}))
+
+    return list(dict.fromkeys(topics))
+
+async def _generate_answer(client, semaphore, cache, system_message, model, max_tokens, topic, tab_name):
+    """
+    Generate and cache the answer for one topic
+
+    Returns:
+        dict: Topic, tab, elapsed seconds and error (None on success)
+    """
+    from app.config import HELP_QUERY_TEMPLATE, DEFAULT_TEMPERATURE
+    from app.help_cache import help_cache_key
+
+    result = {"topic": topic, "tab_name": tab_name, "seconds": 0.0, "error": None}
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    system_message,
+                    {"role": "user", "content": HELP_QUERY_TEMPLATE.format(topic=topic, tab_name=tab_name)}
+                ],
+                max_tokens=max_tokens,
+                temperature=DEFAULT_TEMPERATURE
+            )
+            answer = response.choices[0].message.content
+            if not answer:
+                raise ValueError("empty response")
+            key = help_cache_key(model, system_message["content"], topic, tab_name)
+            # SQLite calls are short; run them off the event loop anyway
+            await asyncio.to_thread(cache.set, key, answer, topic, tab_name, model)
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {str(e)}"
+        result["seconds"] = time.perf_counter() - start
+
+    status = "ERROR " + result["error"] if result["error"] else f"ok ({result['seconds']:.1f}s)"
+    print(f"{tab_name} / {topic}: {status}")
+    return result
+
+async def prewarm_help_cache(topics, cache, model, max_tokens, concurrency=8, base_url=None, api_key=None,
+                             timeout=60.0, force=False):
+    """
+    Generate answers for all topics that are not cached yet
+
+    Args:
+        topics (list): (topic, tab_name) pairs from collect_help_topics
+        cache (HelpCache): Cache the answers are stored in
+        model (str): The OpenAI model to use (part of the cache key)
+        max_tokens (int): Maximum tokens per answer; the help route's limit, so
+            pre-warmed answers match the ones the app generates
+        concurrency (int): Maximum number of requests in flight
+        base_url (str): OpenAI-compatible API base URL (None for the default)
+        api_key (str): API key (defaults to the OPENAI_API_KEY environment variable)
+        timeout (float): Per-request timeout in seconds
+        force (bool): Regenerate answers that are already cached
+
+    Returns:
+        dict: Summary with counts, timing and per-topic results
+    """
+    import openai
+    from app.openai_client import get_system_message
+    from app.help_cache import help_cache_key
+
+    # The same system message get_contextual_help sends, so the keys match
+    system_message = get_system_message()
+    pending = [
+        (topic, tab_name) for topic, tab_name in topics
+        if force or not cache.contains(help_cache_key(model, system_message["content"], topic, tab_name))
+    ]
+
+    start = time.perf_counter()
+    results = []
+    if pending:
+        client = openai.AsyncOpenAI(
+            api_key=api_key or os.environ.get("OPENAI_API_KEY"),
+            base_url=base_url,
+            timeout=timeout
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        try:
+            results = await asyncio.gather(*[
+                _generate_answer(client, semaphore, cache, system_message, model, max_tokens, topic, tab_name)
+                for topic, tab_name in pending
+            ])
+        finally:
+            await client.close()
+
+    failed = [r for r in results if r["error"]]
+    return {
+        "topics": len(topics),
+        "already_cached": len(topics) - len(pending),
+        "generated": len(results) - len(failed),
+        "failed": len(failed),
+        "concurrency": concurrency,
+        "total_seconds": time.perf_counter() - start,
+        "results": results
+    }
+
+def main(argv=None):
+    """Command-line entry point"""
+    from app.config import HELP_CACHE_PATH, OPENAI_REQUEST_TIMEOUT
+    from app.help_cache import HelpCache
+    from app.openai_client import get_help_route
+
+    # The model and answer length the router uses for help questions
+    help_route = get_help_route()
+    help_model = help_route["model"]
+
+    parser = argparse.ArgumentParser(description="Generate and cache the answer for every contextual help topic.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum requests in flight (default: 8)")
+    parser.add_argument("--model", default=help_model,
+                        help=f"Model to use; the app only reads answers for its own help model (default: {help_model})")
+    parser.add_argument("--max-tokens", type=int, default=help_route["max_tokens"],
+                        help=f"Maximum tokens per answer (default: the help route's {help_route['max_tokens']})")
+    parser.add_argument("--base-url", default=os.environ.get("OPENAI_BASE_URL"),
+                        help="OpenAI-compatible API base URL (default: $OPENAI_BASE_URL or the OpenAI API)")
+    parser.add_argument("--api-key", default=None, help="API key (default: $OPENAI_API_KEY)")
+    parser.add_argument("--cache", default=HELP_CACHE_PATH, help=f"Help cache database (default: {HELP_CACHE_PATH})")
+    parser.add_argument("--timeout", type=float, default=OPENAI_REQUEST_TIMEOUT, help="Per-request timeout in seconds")
+    parser.add_argument("--force", action="store_true", help="Regenerate answers that are already cached")
+    parser.add_argument("--list", action="store_true", help="Only list the topics that would be generated")
+    args = parser.parse_args(argv)
+
+    topics = collect_help_topics()
+    if args.list:
+        for topic, tab_name in topics:
+            print(f"{tab_name} / {topic}")
+        print(f"{len(topics)} topic(s)")
+        return 0
+
+    if not (args.api_key or os.environ.get("OPENAI_API_KEY")) and not args.base_url:
+        parser.error("set OPENAI_API_KEY (or --api-key), or point --base-url at a local server")
+
+    cache = HelpCache(args.cache)
+    try:
+        summary = asyncio.run(prewarm_help_cache(
+            topics, cache, args.model, args.max_tokens, concurrency=args.concurrency, base_url=args.base_url,
+            api_key=args.api_key or os.environ.get("OPENAI_API_KEY") or "local", timeout=args.timeout, force=args.force
+        ))
+        stats = cache.stats()
+    finally:
+        cache.close()
+
+    print(f"Generated {summary['generated']} answer(s), {summary['already_cached']} already cached, "
+          f"{summary['failed']} failed in {summary['total_seconds']:.2f}s "
+          f"(concurrency {summary['concurrency']}); cache holds {stats['entries']} answer(s)")
+
+    return 1 if summary["failed"] else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())